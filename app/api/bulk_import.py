@@ -0,0 +1,146 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Callable, List, Optional
+
+from fastapi import HTTPException, Query, Request
+from pydantic import BaseModel, ValidationError
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.config import settings
+from crud.aio import import_crud
+
+IMPORT_FORMATS = {"text/csv": "csv", "application/x-ndjson": "ndjson", "application/jsonl": "ndjson"}
+
+
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+
+class ImportResult(BaseModel):
+    inserted: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = []
+
+
+async def import_format(
+    request: Request,
+    format: Optional[str] = Query(None, description="csv или ndjson; по умолчанию — по Content-Type"),
+) -> str:
+    if format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        format = IMPORT_FORMATS.get(content_type)
+    if format not in ("csv", "ndjson"):
+        raise HTTPException(status_code=415, detail="Expected text/csv or application/x-ndjson body (or ?format=csv|ndjson)")
+    return format
+
+
+async def import_stream(request: Request, db: AsyncSession, fmt: str, schema: type[SQLModel], model, check: Optional[Callable[[dict], Optional[str]]] = None) -> ImportResult:
+    """Stream the request body into ``model``'s table.
+
+    Rows are validated against ``schema`` as they arrive and inserted in
+    batches of ``settings.import_batch_size``, one transaction per batch.
+    Rows that fail validation or are rejected by the database are reported by
+    their line number; they do not abort the rest of the import. ``check``
+    may reject a validated row before it reaches the database by returning
+    an error message.
+    """
+    result = ImportResult()
+    batch: list[tuple[int, dict]] = []
+    records = _csv_records(request.stream()) if fmt == "csv" else _ndjson_records(request.stream())
+    async for row, data, error in records:
+        if error is None:
+            try:
+                values = schema.model_validate(data).model_dump()
+            except ValidationError as exc:
+                error = _describe(exc)
+            else:
+                error = check(values) if check is not None else None
+                if error is None:
+                    batch.append((row, values))
+        if error is not None:
+            _fail(result, row, error)
+        if len(batch) >= settings.import_batch_size:
+            await _flush(db, model, batch, result)
+            batch = []
+    await _flush(db, model, batch, result)
+    # ошибки БД приходят после ошибок валидации той же пачки
+    result.errors.sort(key=lambda error: error.row)
+    return result
+
+
+async def _flush(db: AsyncSession, model, batch: list[tuple[int, dict]], result: ImportResult) -> None:
+    if not batch:
+        return
+    errors = await import_crud.insert_rows(db, model, batch)
+    result.inserted += len(batch) - len(errors)
+    for row, error in errors:
+        _fail(result, row, error)
+
+
+def _fail(result: ImportResult, row: int, error: str) -> None:
+    result.failed += 1
+    if len(result.errors) < settings.import_max_errors:
+        result.errors.append(ImportRowError(row=row, error=error))
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, err['loc'])) or 'row'}: {err['msg']}" for err in exc.errors())
+
+
+async def _lines(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    # только "\n": str.splitlines() режет и по символам, допустимым внутри значений
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail, number = "", 0
+    async for chunk in stream:
+        *lines, tail = (tail + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            number += 1
+            yield number, line + "\n"
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield number + 1, tail
+
+
+async def _ndjson_records(stream: AsyncIterator[bytes]):
+    async for number, line in _lines(stream):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield number, None, f"invalid JSON: {exc}"
+            continue
+        if isinstance(data, dict):
+            yield number, data, None
+        else:
+            yield number, None, "expected a JSON object"
+
+
+async def _csv_records(stream: AsyncIterator[bytes]):
+    # запись может занимать несколько строк (перевод строки в кавычках):
+    # копим строки, пока число кавычек не станет чётным
+    header, pending, start, quoted = None, [], 0, False
+    async for number, line in _lines(stream):
+        if not pending:
+            start = number
+        pending.append(line)
+        if line.count('"') % 2:
+            quoted = not quoted
+        if quoted:
+            continue
+        values = next(csv.reader(pending), [])
+        pending = []
+        if not any(values):
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+        elif len(values) != len(header):
+            yield start, None, f"expected {len(header)} columns, got {len(values)}"
+        else:
+            # пустая ячейка — значение не задано (сработает default модели)
+            yield start, {name: value for name, value in zip(header, values) if value != ""}, None
+    if pending:
+        yield start, None, "unterminated quoted field"
@@ -0,0 +1,76 @@
+import secrets
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response
+from sqlmodel import SQLModel
+
+from core.config import settings
+from database.table_versions import table_versions
+
+# счётчики версий свои у каждого процесса: эпоха не даёт двум воркерам
+# (или одному после рестарта) выдать одинаковый ETag для разных данных
+_EPOCH = secrets.token_hex(4)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    # сравнение слабое (RFC 9110): префикс W/ не учитывается
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Set ``ETag`` on ``response``; a bare 304 if the client already has this version."""
+    headers = {"ETag": etag, "Cache-Control": settings.http_cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+class Conditional:
+    """Router dependency adding ``ETag``/``Last-Modified`` to GET responses and answering 304.
+
+    Validators are built from the ``table_versions`` of the tables a response
+    may read, so checking them costs neither a query nor serialization. The
+    counters are per process: validators also roll over every
+    ``settings.http_validator_ttl`` seconds, which bounds how long a write
+    made by another worker can go unnoticed.
+    """
+
+    def __init__(self, *models: type[SQLModel]):
+        self.tables = tuple(model.__tablename__ for model in models)
+
+    async def __call__(self, request: Request, response: Response) -> None:
+        if request.method != "GET":
+            return
+        ttl = settings.http_validator_ttl
+        now = time.time()
+        window = int(now // ttl)
+        versions = ".".join(map(str, table_versions.token(self.tables)))
+        etag = f'W/"{_EPOCH}-{window}-{versions}"'
+        modified = max(table_versions.last_modified(self.tables), window * ttl)
+        headers = {"ETag": etag, "Cache-Control": settings.http_cache_control}
+        # Last-Modified точен до секунды: пока идёт секунда последней записи,
+        # в ней может случиться ещё одна, и клиент получил бы ложный 304
+        if now - modified >= 1:
+            headers["Last-Modified"] = formatdate(modified, usegmt=True)
+        if self._fresh(request, etag, modified, "Last-Modified" in headers):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    @staticmethod
+    def _fresh(request: Request, etag: str, modified: float, dated: bool) -> bool:
+        if "if-none-match" in request.headers:
+            return etag_matches(request, etag)
+        if_modified_since = request.headers.get("if-modified-since")
+        if not (dated and if_modified_since):
+            return False
+        try:
+            return int(modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
@@ -0,0 +1,83 @@
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.cache import VersionedCache
+from core.config import settings
+from crud.aio import restrictions_crud
+from models.restrictions import Restriction
+
+
+class RestrictionPeriods:
+    """Interval index: restriction periods of every object, merged and sorted.
+
+    A period is ``[imposed_date, removed_date)``, open-ended while
+    ``removed_date`` is null. Overlapping periods of one object are merged, so
+    whether it is encumbered on a day is one ``bisect`` over its period starts.
+    """
+
+    def __init__(self, rows: Iterable[tuple[int, date, Optional[date]]]):
+        by_object: dict[int, list[tuple[date, Optional[date]]]] = defaultdict(list)
+        for real_estate_id, imposed, removed in rows:
+            # снято в день наложения или раньше — ни на одну дату не действует
+            if removed is None or removed > imposed:
+                by_object[real_estate_id].append((imposed, removed))
+        self._periods: dict[int, tuple[list[date], list[Optional[date]]]] = {}
+        for real_estate_id, periods in by_object.items():
+            periods.sort(key=lambda period: period[0])
+            starts: list[date] = []
+            ends: list[Optional[date]] = []
+            for start, end in periods:
+                if starts and (ends[-1] is None or start <= ends[-1]):
+                    if ends[-1] is not None:
+                        ends[-1] = None if end is None else max(end, ends[-1])
+                    continue
+                starts.append(start)
+                ends.append(end)
+            self._periods[real_estate_id] = (starts, ends)
+
+    def active(self, real_estate_id: int, day: date) -> bool:
+        periods = self._periods.get(real_estate_id)
+        if periods is None:
+            return False
+        starts, ends = periods
+        i = bisect_right(starts, day) - 1
+        return i >= 0 and (ends[i] is None or ends[i] > day)
+
+    def encumbered(self, real_estate_ids: Iterable[int], day: date) -> set[int]:
+        return {real_estate_id for real_estate_id in real_estate_ids if self.active(real_estate_id, day)}
+
+
+class Encumbrances:
+    """Which objects have a restriction active on a date.
+
+    With ``settings.encumbrance_index_ttl`` > 0 answers come from a
+    ``RestrictionPeriods`` index rebuilt on the first check after a commit to
+    ``restrictions``; the TTL bounds staleness for writes made by other
+    workers. With 0 every check is one query over the period index.
+    """
+
+    def __init__(self):
+        self._cache = VersionedCache(
+            tables=(Restriction.__tablename__,),
+            ttl=settings.encumbrance_index_ttl,
+            maxsize=1,
+            name="encumbrance_index",
+        )
+
+    async def periods(self, db: AsyncSession) -> RestrictionPeriods:
+        return await self._cache.get_or_compute_async("all", lambda: self._build(db))
+
+    async def _build(self, db: AsyncSession) -> RestrictionPeriods:
+        return RestrictionPeriods(await restrictions_crud.get_restriction_periods(db))
+
+    async def encumbered(self, db: AsyncSession, real_estate_ids: list[int], day: date) -> set[int]:
+        if settings.encumbrance_index_ttl > 0:
+            return (await self.periods(db)).encumbered(real_estate_ids, day)
+        return await restrictions_crud.get_encumbered_ids(db, real_estate_ids, day)
+
+
+encumbrances = Encumbrances()
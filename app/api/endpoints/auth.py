@@ -1,41 +1,60 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel.ext.asyncio.session import AsyncSession
 from pydantic import BaseModel
-from database.database import get_db
-import crud.user_crud as user_crud
+from typing import Optional
+from api.security import TokenUser, current_user
+from core.security import create_token, dummy_hash, hash_password, needs_rehash, verify_password
+from database.database import get_async_db
+from crud.aio import user_crud
 
 # Модель для данных, приходящих с фронтенда (логин/пароль)
 class LoginRequest(BaseModel):
     login: str
     password: str
 
-# Модель для успешного ответа (можно дополнить токеном)
+# Модель для успешного ответа: данные пользователя и токен для заголовка Authorization
 class LoginResponse(BaseModel):
     user_id: int
     login: str
     full_name: str
-    role: str
+    role: Optional[str] = None
+    access_token: str
+    token_type: str = "bearer"
 
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 @router.post("/login", response_model=LoginResponse)
-def login_user(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login_user(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     # 1. Найти пользователя по логину
-    db_user = user_crud.get_user_by_login(db, login=login_data.login)
-    
-    # 2. Если пользователь не найден — ошибка
-    if not db_user:
-        raise HTTPException(status_code=401, detail="Invalid login or password")
-    
-    # 3. Сравнить пароль (ЗДЕСЬ: простая проверка, в реальном проекте нужно хеширование!)
-    if db_user.password != login_data.password:
+    db_user = await user_crud.get_user_by_login(db, login=login_data.login)
+    # соединение не держим, пока считается хеш: close() возвращает его в пул,
+    # объект остаётся с загруженными полями
+    await db.close()
+
+    # 2. Проверить пароль. scrypt медленный — считаем в пуле потоков, не блокируя цикл событий;
+    #    для неизвестного логина проверяем против фиктивного хеша, чтобы время ответа не выдавало логины
+    stored = db_user.password if db_user else dummy_hash()
+    valid = await run_in_threadpool(verify_password, login_data.password, stored)
+    if not db_user or not valid:
         raise HTTPException(status_code=401, detail="Invalid login or password")
-    
-    # 4. Если всё верно — вернуть успех и ID пользователя
+
+    # 3. Пароли в открытом виде (и хеши со старыми параметрами) перехешируем при входе
+    if needs_rehash(db_user.password):
+        password = await run_in_threadpool(hash_password, login_data.password)
+        await user_crud.update_user(db, db_user.id, {"password": password})
+
+    # 4. Вернуть данные пользователя и подписанный токен
+    token = create_token({"sub": str(db_user.id), "login": db_user.login, "role": db_user.role})
     return LoginResponse(
         user_id=db_user.id,
         login=db_user.login,
         full_name=db_user.full_name,
         role=db_user.role,
-    )
\ No newline at end of file
+        access_token=token,
+    )
+
+@router.get("/me", response_model=TokenUser)
+async def read_current_user(user: TokenUser = Depends(current_user)):
+    return user
@@ -1,46 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from database.database import get_db
-from models.clients import Client
-import crud.client_crud as client_crud
+from api.bulk_import import ImportResult, import_format, import_stream
+from api.conditional import Conditional
+from api.export import export_format, export_response
+from api.pagination import CursorPage, cursor_page
+from api.responses import row_response, rows_response
+from database.database import get_async_db
+from models.clients import Client, ClientBase, ClientRead
+from crud.aio import client_crud
+from crud.export_crud import export_statement
+from crud.writes import unique_violation
 
 # Создаем router вместо app
-router = APIRouter(prefix="/clients", tags=["clients"])
-
-@router.post("/", response_model=Client)
-def create_client(client: Client, db: Session = Depends(get_db)):
-    db_client = client_crud.get_client_by_email(db, email=client.email)
-    if db_client:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    db_phone = client_crud.get_client_by_phone(db, phone=client.phone)
-    if db_phone:
-        raise HTTPException(status_code=400, detail="Phone number already registered")
-    return client_crud.create_client(db=db, client=client)
-
-@router.get("/", response_model=List[Client])
-def read_clients(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return client_crud.get_clients(db, skip=skip, limit=limit)
-
-@router.get("/{client_id}", response_model=Client)
-def read_client(client_id: int, db: Session = Depends(get_db)):
-    db_client = client_crud.get_client(db, client_id=client_id)
+router = APIRouter(prefix="/clients", tags=["clients"], dependencies=[Depends(Conditional(Client))])
+
+@router.post("/", response_model=ClientRead)
+async def create_client(client: Client, db: AsyncSession = Depends(get_async_db)):
+    # уникальность проверяет сама БД: один INSERT вместо двух SELECT перед ним, без гонки
+    try:
+        return await client_crud.create_client(db=db, client=client)
+    except IntegrityError as exc:
+        column = unique_violation(exc, Client)
+        if column == "email":
+            raise HTTPException(status_code=400, detail="Email already registered")
+        if column == "phone":
+            raise HTTPException(status_code=400, detail="Phone number already registered")
+        raise
+
+@router.post("/import", response_model=ImportResult)
+async def import_clients(request: Request, fmt: str = Depends(import_format), db: AsyncSession = Depends(get_async_db)):
+    return await import_stream(request, db, fmt, ClientBase, Client)
+
+@router.get("/", response_model=List[ClientRead])
+async def read_clients(response: Response, skip: int = 0, limit: int = 100, page: CursorPage = Depends(cursor_page), db: AsyncSession = Depends(get_async_db)):
+    clients = await client_crud.get_clients(db, skip=skip, limit=limit, after=page.after)
+    page.set_next_cursor(response, clients, limit)
+    return rows_response(response, clients, ClientRead)
+
+@router.get("/export")
+async def export_clients(fmt: str = Depends(export_format)):
+    return export_response(export_statement(Client), fmt, "clients")
+
+@router.get("/{client_id}", response_model=ClientRead)
+async def read_client(response: Response, client_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_client = await client_crud.get_client(db, client_id=client_id)
     if db_client is None:
         raise HTTPException(status_code=404, detail="Client not found")
-    return db_client
+    return row_response(response, db_client, ClientRead)
 
-@router.patch("/{client_id}", response_model=Client)
-def update_client(client_id: int, client: Client, db: Session = Depends(get_db)):
+@router.patch("/{client_id}", response_model=ClientRead)
+async def update_client(client_id: int, client: Client, db: AsyncSession = Depends(get_async_db)):
     update_data = client.dict(exclude_unset=True)
-    db_client = client_crud.update_client(db, client_id=client_id, client_data=update_data)
+    db_client = await client_crud.update_client(db, client_id=client_id, client_data=update_data)
     if db_client is None:
         raise HTTPException(status_code=404, detail="Client not found")
     return db_client
 
 @router.delete("/{client_id}")
-def delete_client(client_id: int, db: Session = Depends(get_db)):
-    db_client = client_crud.delete_client(db, client_id=client_id)
+async def delete_client(client_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_client = await client_crud.delete_client(db, client_id=client_id)
     if db_client is None:
         raise HTTPException(status_code=404, detail="Client not found")
     return {"message": "Client deleted successfully"}
\ No newline at end of file
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
-from database.database import get_db
+from fastapi import APIRouter, Depends, Request
+from sqlmodel.ext.asyncio.session import AsyncSession
+from api.compression import CompressedBody
+from core.cache import VersionedCache
+from core.config import settings
+from database.database import get_async_db
 from models.clients import Client
 from models.deals import Deal
 from models.real_estate import RealEstate
 from pydantic import BaseModel
 from typing import List
+from crud.aio import dashboard_crud
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -29,50 +33,40 @@ class DashboardData(BaseModel):
     recent_deals: List[RecentDeal]
     new_properties: List[NewProperty]
 
-@router.get("/", response_model=DashboardData)
-def get_dashboard_data(db: Session = Depends(get_db)):
-    total_properties = db.query(RealEstate).count()
-    total_clients = db.query(Client).count()
-    active_deals = db.query(Deal).filter(Deal.status == "active").count()
+# снимок пересчитывается только после коммита в одну из этих таблиц (или по TTL)
+_snapshot = VersionedCache(
+    tables=(Deal.__tablename__, Client.__tablename__, RealEstate.__tablename__),
+    ttl=settings.dashboard_cache_ttl,
+    maxsize=1,
+    name="dashboard",
+)
 
-    recent_deals = (
-        db.query(Deal)
-        .join(Client, Deal.client_id == Client.id)
-        .join(RealEstate, Deal.real_estate_id == RealEstate.id)
-        .order_by(Deal.deal_date.desc())
-        .limit(5)
-        .all()
-    )
-    recent_deals_data = [
-        RecentDeal(
-            client=deal.client.full_name,
-            property=deal.real_estate.address,
-            amount=deal.amount,
-        )
-        for deal in recent_deals
-    ]
-
-    new_properties = (
-        db.query(RealEstate)
-        .order_by(RealEstate.id.desc())
-        .limit(5)
-        .all()
-    )
-    new_properties_data = [
-        NewProperty(
-            address=prop.address,
-            type=prop.type,
-            price=prop.price,
-        )
-        for prop in new_properties
-    ]
 
+async def _compute_dashboard(db: AsyncSession) -> DashboardData:
+    total_properties, total_clients, active_deals = await dashboard_crud.get_stats(db)
     return DashboardData(
         stats=DashboardStats(
             total_properties=total_properties,
             total_clients=total_clients,
             active_deals=active_deals,
         ),
-        recent_deals=recent_deals_data,
-        new_properties=new_properties_data,
-    )
\ No newline at end of file
+        recent_deals=[
+            RecentDeal(client=client, property=address, amount=amount)
+            for client, address, amount in await dashboard_crud.get_recent_deals(db)
+        ],
+        new_properties=[
+            NewProperty(address=address, type=type_, price=price)
+            for address, type_, price in await dashboard_crud.get_new_properties(db)
+        ],
+    )
+
+
+async def _compute_body(db: AsyncSession) -> CompressedBody:
+    # в кеше — готовый JSON: сериализуется и сжимается один раз на снимок
+    return CompressedBody((await _compute_dashboard(db)).model_dump_json().encode())
+
+
+@router.get("/", response_model=DashboardData)
+async def get_dashboard_data(request: Request, db: AsyncSession = Depends(get_async_db)):
+    body = await _snapshot.get_or_compute_async("dashboard", lambda: _compute_body(db))
+    return body.response(request)
@@ -1,44 +1,69 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from database.database import get_db
-from models.deals import Deal
-import crud.deal_crud as deal_crud
+from api.bulk_import import ImportResult, import_format, import_stream
+from api.conditional import Conditional
+from api.export import export_format, export_response
+from api.include import Include
+from api.pagination import CursorPage, cursor_page
+from api.responses import row_response, rows_response
+from database.database import get_async_db
+from models.deals import Deal, DealBase, DealRead
+from models.expanded import DealExpanded
+from models.clients import Client
+from models.real_estate import RealEstate
+from models.users import User
+from crud.aio import deal_crud
+from crud.export_crud import export_statement
 
-router = APIRouter(prefix="/deals", tags=["deals"])
+router = APIRouter(prefix="/deals", tags=["deals"], dependencies=[Depends(Conditional(Deal, Client, RealEstate, User))])
 
+deal_include = Include("client", "real_estate", "employee")
 
-@router.post("/", response_model=Deal)
-def create_deal(deal: Deal, db: Session = Depends(get_db)):
-    return deal_crud.create_deal(db=db, deal=deal)
 
+@router.post("/", response_model=DealRead)
+async def create_deal(deal: Deal, db: AsyncSession = Depends(get_async_db)):
+    return await deal_crud.create_deal(db=db, deal=deal)
 
-@router.get("/", response_model=List[Deal])
-def read_deals(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return deal_crud.get_deals(db, skip=skip, limit=limit)
 
+@router.post("/import", response_model=ImportResult)
+async def import_deals(request: Request, fmt: str = Depends(import_format), db: AsyncSession = Depends(get_async_db)):
+    return await import_stream(request, db, fmt, DealBase, Deal)
 
-@router.get("/{deal_id}", response_model=Deal)
-def read_deal(deal_id: int, db: Session = Depends(get_db)):
-    db_deal = deal_crud.get_deal(db, deal_id)
+
+@router.get("/", response_model=List[DealExpanded])
+async def read_deals(response: Response, skip: int = 0, limit: int = 100, include: list[str] = Depends(deal_include), page: CursorPage = Depends(cursor_page), db: AsyncSession = Depends(get_async_db)):
+    deals = await deal_crud.get_deals(db, skip=skip, limit=limit, after=page.after, include=include)
+    page.set_next_cursor(response, deals, limit)
+    return rows_response(response, deals, DealExpanded)
+
+
+@router.get("/export")
+async def export_deals(fmt: str = Depends(export_format)):
+    return export_response(export_statement(Deal), fmt, "deals")
+
+
+@router.get("/{deal_id}", response_model=DealExpanded)
+async def read_deal(response: Response, deal_id: int, include: list[str] = Depends(deal_include), db: AsyncSession = Depends(get_async_db)):
+    db_deal = await deal_crud.get_deal(db, deal_id, include=include)
     if db_deal is None:
         raise HTTPException(status_code=404, detail="Deal not found")
-    return db_deal
+    return row_response(response, db_deal, DealExpanded)
 
 
-@router.patch("/{deal_id}", response_model=Deal)
-def update_deal(deal_id: int, deal: Deal, db: Session = Depends(get_db)):
+@router.patch("/{deal_id}", response_model=DealRead)
+async def update_deal(deal_id: int, deal: Deal, db: AsyncSession = Depends(get_async_db)):
     update_data = deal.dict(exclude_unset=True)
-    db_deal = deal_crud.update_deal(db, deal_id, update_data)
+    db_deal = await deal_crud.update_deal(db, deal_id, update_data)
     if db_deal is None:
         raise HTTPException(status_code=404, detail="Deal not found")
     return db_deal
 
 
 @router.delete("/{deal_id}")
-def delete_deal(deal_id: int, db: Session = Depends(get_db)):
-    db_deal = deal_crud.delete_deal(db, deal_id)
+async def delete_deal(deal_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_deal = await deal_crud.delete_deal(db, deal_id)
     if db_deal is None:
         raise HTTPException(status_code=404, detail="Deal not found")
     return {"message": "Deal deleted successfully"}
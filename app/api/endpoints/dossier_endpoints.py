@@ -0,0 +1,55 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from api.compression import CompressedBody
+from api.conditional import Conditional
+from api.responses import row_json
+from core.cache import VersionedCache
+from core.config import settings
+from database.database import get_async_db
+from models.clients import Client
+from models.deals import Deal
+from models.expanded import RealEstateDossier
+from models.ownership import Ownership
+from models.ownership_types import OwnershipType
+from models.real_estate import RealEstate
+from models.restriction_types import RestrictionType
+from models.restrictions import Restriction
+from models.users import User
+from crud.aio import real_estate_crud
+
+# всё, что попадает в карточку: по этим таблицам строятся ETag и версия кеша
+DOSSIER_MODELS = (RealEstate, Ownership, Restriction, Deal, Client, User, OwnershipType, RestrictionType)
+
+# свой роутер: у /real_estate ETag зависит от меньшего набора таблиц,
+# и смена имени клиента не сбросила бы его для карточки
+router = APIRouter(prefix="/real_estate", tags=["real_estate"], dependencies=[Depends(Conditional(*DOSSIER_MODELS))])
+
+_dossiers = VersionedCache(
+    tables=tuple(model.__tablename__ for model in DOSSIER_MODELS),
+    ttl=settings.dossier_cache_ttl,
+    maxsize=settings.dossier_cache_size,
+    name="dossier",
+)
+
+
+async def _compute_body(db: AsyncSession, real_estate_id: int, today: date) -> CompressedBody | None:
+    real_estate = await real_estate_crud.get_dossier(db, real_estate_id, today)
+    if real_estate is None:
+        return None
+    return CompressedBody(row_json(real_estate, RealEstateDossier))
+
+
+@router.get("/{real_estate_id}/dossier", response_model=RealEstateDossier)
+async def read_dossier(request: Request, response: Response, real_estate_id: int, db: AsyncSession = Depends(get_async_db)):
+    # дата в ключе: в полночь ограничения могут начаться или закончиться без записи в БД
+    today = date.today()
+    if settings.dossier_cache_ttl > 0:
+        body = await _dossiers.get_or_compute_async((real_estate_id, today), lambda: _compute_body(db, real_estate_id, today))
+    else:
+        body = await _compute_body(db, real_estate_id, today)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Real estate object not found")
+    return body.response(request, response)
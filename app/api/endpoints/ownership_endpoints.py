@@ -1,39 +1,68 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from database.database import get_db
-from models.ownership import Ownership
-import crud.ownership_crud as ownership_crud
+from api.bulk_import import ImportResult, import_format, import_stream
+from api.conditional import Conditional
+from api.export import export_format, export_response
+from api.include import Include
+from api.pagination import CursorPage, cursor_page
+from api.reference import ownership_types
+from api.responses import row_response, rows_response
+from database.database import get_async_db
+from models.ownership import Ownership, OwnershipBase, OwnershipRead
+from models.expanded import OwnershipExpanded
+from models.real_estate import RealEstate
+from models.clients import Client
+from models.ownership_types import OwnershipType
+from crud.aio import ownership_crud
+from crud.export_crud import export_statement
 
-router = APIRouter(prefix="/ownership", tags=["ownership"])
+router = APIRouter(prefix="/ownership", tags=["ownership"], dependencies=[Depends(Conditional(Ownership, RealEstate, Client, OwnershipType))])
 
-@router.post("/", response_model=Ownership)
-def create_ownership(ownership: Ownership, db: Session = Depends(get_db)):
-    return ownership_crud.create_ownership(db=db, ownership=ownership)
+ownership_include = Include("real_estate", "owner", "ownership_type")
 
-@router.get("/", response_model=List[Ownership])
-def read_ownerships(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return ownership_crud.get_ownerships(db, skip=skip, limit=limit)
+@router.post("/", response_model=OwnershipRead)
+async def create_ownership(ownership: Ownership, db: AsyncSession = Depends(get_async_db)):
+    await ownership_types.require(db, ownership.ownership_type_code)
+    return await ownership_crud.create_ownership(db=db, ownership=ownership)
 
-@router.get("/{ownership_id}", response_model=Ownership)
-def read_ownership(ownership_id: int, db: Session = Depends(get_db)):
-    db_ownership = ownership_crud.get_ownership(db, ownership_id)
+@router.post("/import", response_model=ImportResult)
+async def import_ownerships(request: Request, fmt: str = Depends(import_format), db: AsyncSession = Depends(get_async_db)):
+    # проверка строк идёт без запросов, поэтому снимок — свежий на начало импорта
+    check = ownership_types.row_check(await ownership_types.fresh_snapshot(db), "ownership_type_code")
+    return await import_stream(request, db, fmt, OwnershipBase, Ownership, check=check)
+
+@router.get("/", response_model=List[OwnershipExpanded])
+async def read_ownerships(response: Response, skip: int = 0, limit: int = 100, include: list[str] = Depends(ownership_include), page: CursorPage = Depends(cursor_page), db: AsyncSession = Depends(get_async_db)):
+    ownerships = await ownership_crud.get_ownerships(db, skip=skip, limit=limit, after=page.after, include=include)
+    page.set_next_cursor(response, ownerships, limit)
+    return rows_response(response, ownerships, OwnershipExpanded)
+
+@router.get("/export")
+async def export_ownerships(fmt: str = Depends(export_format)):
+    return export_response(export_statement(Ownership), fmt, "ownership")
+
+@router.get("/{ownership_id}", response_model=OwnershipExpanded)
+async def read_ownership(response: Response, ownership_id: int, include: list[str] = Depends(ownership_include), db: AsyncSession = Depends(get_async_db)):
+    db_ownership = await ownership_crud.get_ownership(db, ownership_id, include=include)
     if db_ownership is None:
         raise HTTPException(status_code=404, detail="Ownership record not found")
-    return db_ownership
+    return row_response(response, db_ownership, OwnershipExpanded)
 
-@router.patch("/{ownership_id}", response_model=Ownership)
-def update_ownership(ownership_id: int, ownership: Ownership, db: Session = Depends(get_db)):
+@router.patch("/{ownership_id}", response_model=OwnershipRead)
+async def update_ownership(ownership_id: int, ownership: Ownership, db: AsyncSession = Depends(get_async_db)):
     update_data = ownership.dict(exclude_unset=True)
-    db_ownership = ownership_crud.update_ownership(db, ownership_id, update_data)
+    if update_data.get("ownership_type_code") is not None:
+        await ownership_types.require(db, update_data["ownership_type_code"])
+    db_ownership = await ownership_crud.update_ownership(db, ownership_id, update_data)
     if db_ownership is None:
         raise HTTPException(status_code=404, detail="Ownership record not found")
     return db_ownership
 
 @router.delete("/{ownership_id}")
-def delete_ownership(ownership_id: int, db: Session = Depends(get_db)):
-    db_ownership = ownership_crud.delete_ownership(db, ownership_id)
+async def delete_ownership(ownership_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_ownership = await ownership_crud.delete_ownership(db, ownership_id)
     if db_ownership is None:
         raise HTTPException(status_code=404, detail="Ownership record not found")
     return {"message": "Ownership record deleted successfully"}
@@ -1,42 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from database.database import get_db
-from models.ownership_types import OwnershipType
-import crud.ownership_type_crud as ownership_type_crud
+from api.pagination import CodeCursorPage, code_cursor_page
+from api.conditional import not_modified
+from api.reference import ownership_types
+from api.responses import rows_response
+from database.database import get_async_db
+from models.ownership_types import OwnershipType, OwnershipTypeRead
+from crud.aio import ownership_type_crud
+from crud.writes import unique_violation
 
 router = APIRouter(prefix="/ownership_types", tags=["ownership_types"])
 
-@router.post("/", response_model=OwnershipType)
-def create_ownership_type(ownership_type: OwnershipType, db: Session = Depends(get_db)):
-    db_type = ownership_type_crud.get_ownership_type(db, ownership_type.code)
-    if db_type:
-        raise HTTPException(status_code=400, detail="Ownership type already exists")
-    return ownership_type_crud.create_ownership_type(db=db, ownership_type=ownership_type)
+@router.post("/", response_model=OwnershipTypeRead)
+async def create_ownership_type(ownership_type: OwnershipType, db: AsyncSession = Depends(get_async_db)):
+    try:
+        return await ownership_type_crud.create_ownership_type(db=db, ownership_type=ownership_type)
+    except IntegrityError as exc:
+        if unique_violation(exc, OwnershipType) is not None:
+            raise HTTPException(status_code=400, detail="Ownership type already exists")
+        raise
 
-@router.get("/", response_model=List[OwnershipType])
-def read_ownership_types(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return ownership_type_crud.get_ownership_types(db, skip=skip, limit=limit)
+@router.get("/", response_model=List[OwnershipTypeRead])
+async def read_ownership_types(request: Request, response: Response, skip: int = 0, limit: int = 100, page: CodeCursorPage = Depends(code_cursor_page), db: AsyncSession = Depends(get_async_db)):
+    snapshot = await ownership_types.snapshot(db)
+    cached = not_modified(request, response, snapshot.etag)
+    if cached is not None:
+        return cached
+    types = snapshot.page(skip=skip, limit=limit, after=page.after)
+    page.set_next_cursor(response, types, limit)
+    if len(types) == len(snapshot.rows):
+        return snapshot.body.response(request, response)
+    return rows_response(response, types, OwnershipTypeRead)
 
-@router.get("/{code}", response_model=OwnershipType)
-def read_ownership_type(code: str, db: Session = Depends(get_db)):
-    db_type = ownership_type_crud.get_ownership_type(db, code)
+@router.get("/{code}", response_model=OwnershipTypeRead)
+async def read_ownership_type(code: str, db: AsyncSession = Depends(get_async_db)):
+    db_type = await ownership_types.lookup(db, code)
     if db_type is None:
         raise HTTPException(status_code=404, detail="Ownership type not found")
     return db_type
 
-@router.patch("/{code}", response_model=OwnershipType)
-def update_ownership_type(code: str, ownership_type: OwnershipType, db: Session = Depends(get_db)):
+@router.patch("/{code}", response_model=OwnershipTypeRead)
+async def update_ownership_type(code: str, ownership_type: OwnershipType, db: AsyncSession = Depends(get_async_db)):
     update_data = ownership_type.dict(exclude_unset=True)
-    db_type = ownership_type_crud.update_ownership_type(db, code, update_data)
+    db_type = await ownership_type_crud.update_ownership_type(db, code, update_data)
     if db_type is None:
         raise HTTPException(status_code=404, detail="Ownership type not found")
     return db_type
 
 @router.delete("/{code}")
-def delete_ownership_type(code: str, db: Session = Depends(get_db)):
-    db_type = ownership_type_crud.delete_ownership_type(db, code)
+async def delete_ownership_type(code: str, db: AsyncSession = Depends(get_async_db)):
+    db_type = await ownership_type_crud.delete_ownership_type(db, code)
     if db_type is None:
         raise HTTPException(status_code=404, detail="Ownership type not found")
     return {"message": "Ownership type deleted successfully"}
@@ -1,39 +1,87 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from database.database import get_db
-from models.real_estate import RealEstate
-import crud.real_estate_crud as real_estate_crud
+from api.bulk_import import ImportResult, import_format, import_stream
+from api.conditional import Conditional
+from api.export import export_format, export_response
+from api.include import Include
+from api.pagination import CursorPage, sorted_cursor_page
+from api.responses import row_response, rows_response
+from database.database import get_async_db
+from models.real_estate import RealEstate, RealEstateBase, RealEstateRead
+from models.expanded import RealEstateExpanded
+from models.ownership import Ownership
+from models.restrictions import Restriction
+from models.deals import Deal
+from crud.aio import real_estate_crud
+from crud.real_estate_crud import RealEstateFilters, export_real_estates_statement, parse_sort
 
-router = APIRouter(prefix="/real_estate", tags=["real_estate"])
+router = APIRouter(prefix="/real_estate", tags=["real_estate"], dependencies=[Depends(Conditional(RealEstate, Ownership, Restriction, Deal))])
 
-@router.post("/", response_model=RealEstate)
-def create_real_estate(real_estate: RealEstate, db: Session = Depends(get_db)):
-    return real_estate_crud.create_real_estate(db=db, real_estate=real_estate)
+real_estate_include = Include("ownerships", "restrictions", "deals")
 
-@router.get("/", response_model=List[RealEstate])
-def read_real_estates(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return real_estate_crud.get_real_estates(db, skip=skip, limit=limit)
+@router.post("/", response_model=RealEstateRead)
+async def create_real_estate(real_estate: RealEstate, db: AsyncSession = Depends(get_async_db)):
+    return await real_estate_crud.create_real_estate(db=db, real_estate=real_estate)
 
-@router.get("/{real_estate_id}", response_model=RealEstate)
-def read_real_estate(real_estate_id: int, db: Session = Depends(get_db)):
-    real_estate = real_estate_crud.get_real_estate(db, real_estate_id)
+@router.post("/import", response_model=ImportResult)
+async def import_real_estates(request: Request, fmt: str = Depends(import_format), db: AsyncSession = Depends(get_async_db)):
+    return await import_stream(request, db, fmt, RealEstateBase, RealEstate)
+
+@router.get("/", response_model=List[RealEstateExpanded])
+async def read_real_estates(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    sort: str = Query("id", description="id, price, area, rooms или floor; префикс '-' — по убыванию"),
+    filters: RealEstateFilters = Depends(),
+    include: list[str] = Depends(real_estate_include),
+    page: CursorPage = Depends(sorted_cursor_page),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        sort_key, _ = parse_sort(sort)
+        real_estates = await real_estate_crud.get_real_estates(
+            db, skip=skip, limit=limit, after=page.after,
+            filters=filters, sort=sort, include=include,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    page.set_next_cursor(response, real_estates, limit, sort_key=sort_key)
+    return rows_response(response, real_estates, RealEstateExpanded)
+
+# объявлен до /{real_estate_id}, иначе "export" разбирается как id
+@router.get("/export")
+async def export_real_estates(
+    fmt: str = Depends(export_format),
+    sort: str = Query("id", description="id, price, area, rooms или floor; префикс '-' — по убыванию"),
+    filters: RealEstateFilters = Depends(),
+):
+    try:
+        statement = export_real_estates_statement(filters, sort)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return export_response(statement, fmt, "real_estate")
+
+@router.get("/{real_estate_id}", response_model=RealEstateExpanded)
+async def read_real_estate(response: Response, real_estate_id: int, include: list[str] = Depends(real_estate_include), db: AsyncSession = Depends(get_async_db)):
+    real_estate = await real_estate_crud.get_real_estate(db, real_estate_id, include=include)
     if real_estate is None:
         raise HTTPException(status_code=404, detail="Real estate object not found")
-    return real_estate
+    return row_response(response, real_estate, RealEstateExpanded)
 
-@router.patch("/{real_estate_id}", response_model=RealEstate)
-def update_real_estate(real_estate_id: int, real_estate: RealEstate, db: Session = Depends(get_db)):
+@router.patch("/{real_estate_id}", response_model=RealEstateRead)
+async def update_real_estate(real_estate_id: int, real_estate: RealEstate, db: AsyncSession = Depends(get_async_db)):
     update_data = real_estate.dict(exclude_unset=True)
-    updated = real_estate_crud.update_real_estate(db, real_estate_id, update_data)
+    updated = await real_estate_crud.update_real_estate(db, real_estate_id, update_data)
     if updated is None:
         raise HTTPException(status_code=404, detail="Real estate object not found")
     return updated
 
 @router.delete("/{real_estate_id}")
-def delete_real_estate(real_estate_id: int, db: Session = Depends(get_db)):
-    deleted = real_estate_crud.delete_real_estate(db, real_estate_id)
+async def delete_real_estate(real_estate_id: int, db: AsyncSession = Depends(get_async_db)):
+    deleted = await real_estate_crud.delete_real_estate(db, real_estate_id)
     if deleted is None:
         raise HTTPException(status_code=404, detail="Real estate object not found")
     return {"message": "Real estate object deleted successfully"}
@@ -0,0 +1,97 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+from pydantic import BaseModel
+from datetime import date
+from typing import List, Optional
+
+from core.cache import VersionedCache
+from core.config import settings
+from database.database import get_async_db
+from models.deals import Deal
+from models.real_estate import RealEstate
+from models.users import User
+from crud.aio import report_crud
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+# результаты кешируются на набор параметров и сбрасываются при записи в эти таблицы
+_reports = VersionedCache(
+    tables=(Deal.__tablename__, RealEstate.__tablename__, User.__tablename__),
+    ttl=settings.report_cache_ttl,
+    maxsize=256,
+    name="reports",
+)
+
+
+class SalesRow(BaseModel):
+    period_start: date
+    deals: int
+    amount: float
+
+
+class PropertyTypeRow(BaseModel):
+    type: str
+    count: int
+    # средняя цена продажи по объектам; None — продаж за период не было
+    avg_price: Optional[float] = None
+
+
+class EmployeeRow(BaseModel):
+    employee_id: int
+    name: str
+    deals: int
+    revenue: float
+
+
+def _check_range(date_from: date, date_to: date) -> None:
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from must not be later than date_to")
+
+
+@router.get("/sales", response_model=List[SalesRow])
+async def sales_report(
+    date_from: date,
+    date_to: date,
+    period: str = Query("week", pattern="^(day|week|month)$"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    _check_range(date_from, date_to)
+
+    async def compute():
+        rows = await report_crud.sales_by_period(db, date_from, date_to, period)
+        return [SalesRow(period_start=start, deals=deals, amount=amount) for start, deals, amount in rows]
+
+    return await _reports.get_or_compute_async(("sales", date_from, date_to, period), compute)
+
+
+@router.get("/properties", response_model=List[PropertyTypeRow])
+async def properties_report(date_from: date, date_to: date, db: AsyncSession = Depends(get_async_db)):
+    _check_range(date_from, date_to)
+
+    async def compute():
+        rows = await report_crud.properties_by_type(db, date_from, date_to)
+        return [
+            PropertyTypeRow(type=type_, count=count, avg_price=avg_price)
+            for type_, count, avg_price in rows
+        ]
+
+    return await _reports.get_or_compute_async(("properties", date_from, date_to), compute)
+
+
+@router.get("/employees", response_model=List[EmployeeRow])
+async def employees_report(
+    date_from: date,
+    date_to: date,
+    limit: int = Query(20, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db),
+):
+    _check_range(date_from, date_to)
+
+    async def compute():
+        rows = await report_crud.employees_ranking(db, date_from, date_to, limit)
+        return [
+            EmployeeRow(employee_id=employee_id, name=name, deals=deals, revenue=revenue)
+            for employee_id, name, deals, revenue in rows
+        ]
+
+    return await _reports.get_or_compute_async(("employees", date_from, date_to, limit), compute)
@@ -1,42 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from database.database import get_db
-from models.restriction_types import RestrictionType
-import crud.restriction_type_crud as restriction_type_crud
+from api.pagination import CodeCursorPage, code_cursor_page
+from api.conditional import not_modified
+from api.reference import restriction_types
+from api.responses import rows_response
+from database.database import get_async_db
+from models.restriction_types import RestrictionType, RestrictionTypeRead
+from crud.aio import restriction_type_crud
+from crud.writes import unique_violation
 
 router = APIRouter(prefix="/restriction_types", tags=["restriction_types"])
 
-@router.post("/", response_model=RestrictionType)
-def create_restriction_type(restriction_type: RestrictionType, db: Session = Depends(get_db)):
-    db_type = restriction_type_crud.get_restriction_type(db, restriction_type.code)
-    if db_type:
-        raise HTTPException(status_code=400, detail="Restriction type already exists")
-    return restriction_type_crud.create_restriction_type(db=db, restriction_type=restriction_type)
+@router.post("/", response_model=RestrictionTypeRead)
+async def create_restriction_type(restriction_type: RestrictionType, db: AsyncSession = Depends(get_async_db)):
+    try:
+        return await restriction_type_crud.create_restriction_type(db=db, restriction_type=restriction_type)
+    except IntegrityError as exc:
+        if unique_violation(exc, RestrictionType) is not None:
+            raise HTTPException(status_code=400, detail="Restriction type already exists")
+        raise
 
-@router.get("/", response_model=List[RestrictionType])
-def read_restriction_types(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return restriction_type_crud.get_restriction_types(db, skip=skip, limit=limit)
+@router.get("/", response_model=List[RestrictionTypeRead])
+async def read_restriction_types(request: Request, response: Response, skip: int = 0, limit: int = 100, page: CodeCursorPage = Depends(code_cursor_page), db: AsyncSession = Depends(get_async_db)):
+    snapshot = await restriction_types.snapshot(db)
+    cached = not_modified(request, response, snapshot.etag)
+    if cached is not None:
+        return cached
+    types = snapshot.page(skip=skip, limit=limit, after=page.after)
+    page.set_next_cursor(response, types, limit)
+    if len(types) == len(snapshot.rows):
+        return snapshot.body.response(request, response)
+    return rows_response(response, types, RestrictionTypeRead)
 
-@router.get("/{code}", response_model=RestrictionType)
-def read_restriction_type(code: str, db: Session = Depends(get_db)):
-    db_type = restriction_type_crud.get_restriction_type(db, code)
+@router.get("/{code}", response_model=RestrictionTypeRead)
+async def read_restriction_type(code: str, db: AsyncSession = Depends(get_async_db)):
+    db_type = await restriction_types.lookup(db, code)
     if db_type is None:
         raise HTTPException(status_code=404, detail="Restriction type not found")
     return db_type
 
-@router.patch("/{code}", response_model=RestrictionType)
-def update_restriction_type(code: str, restriction_type: RestrictionType, db: Session = Depends(get_db)):
+@router.patch("/{code}", response_model=RestrictionTypeRead)
+async def update_restriction_type(code: str, restriction_type: RestrictionType, db: AsyncSession = Depends(get_async_db)):
     update_data = restriction_type.dict(exclude_unset=True)
-    db_type = restriction_type_crud.update_restriction_type(db, code, update_data)
+    db_type = await restriction_type_crud.update_restriction_type(db, code, update_data)
     if db_type is None:
         raise HTTPException(status_code=404, detail="Restriction type not found")
     return db_type
 
 @router.delete("/{code}")
-def delete_restriction_type(code: str, db: Session = Depends(get_db)):
-    db_type = restriction_type_crud.delete_restriction_type(db, code)
+async def delete_restriction_type(code: str, db: AsyncSession = Depends(get_async_db)):
+    db_type = await restriction_type_crud.delete_restriction_type(db, code)
     if db_type is None:
         raise HTTPException(status_code=404, detail="Restriction type not found")
     return {"message": "Restriction type deleted successfully"}
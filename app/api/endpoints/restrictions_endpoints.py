@@ -1,39 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import BaseModel, Field
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import date
 from typing import List
 
-from database.database import get_db
-from models.restrictions import Restriction
-import crud.restrictions_crud as restrictions_crud
+from api.conditional import Conditional
+from api.encumbrance import encumbrances
+from api.include import Include
+from api.pagination import CursorPage, cursor_page
+from api.reference import restriction_types
+from api.responses import row_response, rows_response
+from database.database import get_async_db
+from models.restrictions import Restriction, RestrictionRead
+from models.expanded import RestrictionExpanded
+from models.real_estate import RealEstate
+from models.restriction_types import RestrictionType
+from crud.aio import restrictions_crud
 
-router = APIRouter(prefix="/restrictions", tags=["restrictions"])
+router = APIRouter(prefix="/restrictions", tags=["restrictions"], dependencies=[Depends(Conditional(Restriction, RealEstate, RestrictionType))])
 
-@router.post("/", response_model=Restriction)
-def create_restriction(restriction: Restriction, db: Session = Depends(get_db)):
-    return restrictions_crud.create_restriction(db=db, restriction=restriction)
+restriction_include = Include("real_estate", "restriction_type")
 
-@router.get("/", response_model=List[Restriction])
-def read_restrictions(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return restrictions_crud.get_restrictions(db, skip=skip, limit=limit)
+# все id уходят одним IN (...): держимся ниже лимита параметров SQLite и asyncpg (32766)
+MAX_CHECK_IDS = 10_000
 
-@router.get("/{restriction_id}", response_model=Restriction)
-def read_restriction(restriction_id: int, db: Session = Depends(get_db)):
-    db_restriction = restrictions_crud.get_restriction(db, restriction_id)
+
+class EncumbranceCheck(BaseModel):
+    as_of: date
+    real_estate_ids: List[int] = Field(min_length=1, max_length=MAX_CHECK_IDS)
+
+
+class EncumbranceResult(BaseModel):
+    as_of: date
+    encumbered: List[int]
+    clear: List[int]
+
+
+# POST: тысячи id в query string не поместятся
+@router.post("/check", response_model=EncumbranceResult)
+async def check_encumbrances(check: EncumbranceCheck, db: AsyncSession = Depends(get_async_db)):
+    """Objects with a restriction active on ``as_of``; ids without restrictions (or unknown) are clear."""
+    real_estate_ids = sorted(set(check.real_estate_ids))
+    encumbered = await encumbrances.encumbered(db, real_estate_ids, check.as_of)
+    return EncumbranceResult(
+        as_of=check.as_of,
+        encumbered=[real_estate_id for real_estate_id in real_estate_ids if real_estate_id in encumbered],
+        clear=[real_estate_id for real_estate_id in real_estate_ids if real_estate_id not in encumbered],
+    )
+
+@router.post("/", response_model=RestrictionRead)
+async def create_restriction(restriction: Restriction, db: AsyncSession = Depends(get_async_db)):
+    await restriction_types.require(db, restriction.restriction_type_code)
+    return await restrictions_crud.create_restriction(db=db, restriction=restriction)
+
+@router.get("/", response_model=List[RestrictionExpanded])
+async def read_restrictions(response: Response, skip: int = 0, limit: int = 100, include: list[str] = Depends(restriction_include), page: CursorPage = Depends(cursor_page), db: AsyncSession = Depends(get_async_db)):
+    restrictions = await restrictions_crud.get_restrictions(db, skip=skip, limit=limit, after=page.after, include=include)
+    page.set_next_cursor(response, restrictions, limit)
+    return rows_response(response, restrictions, RestrictionExpanded)
+
+@router.get("/{restriction_id}", response_model=RestrictionExpanded)
+async def read_restriction(response: Response, restriction_id: int, include: list[str] = Depends(restriction_include), db: AsyncSession = Depends(get_async_db)):
+    db_restriction = await restrictions_crud.get_restriction(db, restriction_id, include=include)
     if db_restriction is None:
         raise HTTPException(status_code=404, detail="Restriction not found")
-    return db_restriction
+    return row_response(response, db_restriction, RestrictionExpanded)
 
-@router.patch("/{restriction_id}", response_model=Restriction)
-def update_restriction(restriction_id: int, restriction: Restriction, db: Session = Depends(get_db)):
+@router.patch("/{restriction_id}", response_model=RestrictionRead)
+async def update_restriction(restriction_id: int, restriction: Restriction, db: AsyncSession = Depends(get_async_db)):
     update_data = restriction.dict(exclude_unset=True)
-    db_restriction = restrictions_crud.update_restriction(db, restriction_id, update_data)
+    if update_data.get("restriction_type_code") is not None:
+        await restriction_types.require(db, update_data["restriction_type_code"])
+    db_restriction = await restrictions_crud.update_restriction(db, restriction_id, update_data)
     if db_restriction is None:
         raise HTTPException(status_code=404, detail="Restriction not found")
     return db_restriction
 
 @router.delete("/{restriction_id}")
-def delete_restriction(restriction_id: int, db: Session = Depends(get_db)):
-    db_restriction = restrictions_crud.delete_restriction(db, restriction_id)
+async def delete_restriction(restriction_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_restriction = await restrictions_crud.delete_restriction(db, restriction_id)
     if db_restriction is None:
         raise HTTPException(status_code=404, detail="Restriction not found")
     return {"message": "Restriction deleted successfully"}
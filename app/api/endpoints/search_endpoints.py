@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+from pydantic import BaseModel
+from typing import List, Optional
+
+from database.database import get_async_db
+from crud.aio import search_crud
+from crud.search_crud import SEARCH_TARGETS
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+class SearchHit(BaseModel):
+    id: int
+    title: str
+    score: float
+
+
+class SearchResults(BaseModel):
+    properties: List[SearchHit] = []
+    clients: List[SearchHit] = []
+    employees: List[SearchHit] = []
+
+
+@router.get("/", response_model=SearchResults)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: Optional[str] = Query(None, description="properties,clients,employees — по умолчанию все"),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db),
+):
+    kinds = list(SEARCH_TARGETS) if not types else [t.strip() for t in types.split(",") if t.strip()]
+    unknown = [kind for kind in kinds if kind not in SEARCH_TARGETS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown search types: {', '.join(unknown)}")
+    found = await search_crud.search(db, q.strip(), kinds, limit=limit)
+    return SearchResults(**{
+        kind: [SearchHit(id=id_, title=title, score=score) for id_, title, score in rows]
+        for kind, rows in found.items()
+    })
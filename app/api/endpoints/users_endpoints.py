@@ -1,42 +1,56 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 
-from database.database import get_db
-from models.users import User
-import crud.user_crud as user_crud
+from api.pagination import CursorPage, cursor_page
+from api.responses import row_response, rows_response
+from core.security import hash_password
+from database.database import get_async_db
+from models.users import User, UserRead
+from crud.aio import user_crud
+from crud.writes import unique_violation
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-@router.post("/", response_model=User)
-def create_user(user: User, db: Session = Depends(get_db)):
-    db_user = user_crud.get_user_by_login(db, login=user.login)
-    if db_user:
-        raise HTTPException(status_code=400, detail="Login already exists")
-    return user_crud.create_user(db=db, user=user)
+@router.post("/", response_model=UserRead)
+async def create_user(user: User, db: AsyncSession = Depends(get_async_db)):
+    if user.password:
+        user.password = await run_in_threadpool(hash_password, user.password)
+    try:
+        return await user_crud.create_user(db=db, user=user)
+    except IntegrityError as exc:
+        if unique_violation(exc, User) == "login":
+            raise HTTPException(status_code=400, detail="Login already exists")
+        raise
 
-@router.get("/", response_model=List[User])
-def read_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return user_crud.get_users(db, skip=skip, limit=limit)
+@router.get("/", response_model=List[UserRead])
+async def read_users(response: Response, skip: int = 0, limit: int = 100, page: CursorPage = Depends(cursor_page), db: AsyncSession = Depends(get_async_db)):
+    users = await user_crud.get_users(db, skip=skip, limit=limit, after=page.after)
+    page.set_next_cursor(response, users, limit)
+    return rows_response(response, users, UserRead)
 
-@router.get("/{user_id}", response_model=User)
-def read_user(user_id: int, db: Session = Depends(get_db)):
-    db_user = user_crud.get_user(db, user_id=user_id)
+@router.get("/{user_id}", response_model=UserRead)
+async def read_user(response: Response, user_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_user = await user_crud.get_user(db, user_id=user_id)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    return db_user
+    return row_response(response, db_user, UserRead)
 
-@router.patch("/{user_id}", response_model=User)
-def update_user(user_id: int, user: User, db: Session = Depends(get_db)):
+@router.patch("/{user_id}", response_model=UserRead)
+async def update_user(user_id: int, user: User, db: AsyncSession = Depends(get_async_db)):
     update_data = user.dict(exclude_unset=True)
-    db_user = user_crud.update_user(db, user_id=user_id, user_data=update_data)
+    if update_data.get("password"):
+        update_data["password"] = await run_in_threadpool(hash_password, update_data["password"])
+    db_user = await user_crud.update_user(db, user_id=user_id, user_data=update_data)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return db_user
 
 @router.delete("/{user_id}")
-def delete_user(user_id: int, db: Session = Depends(get_db)):
-    db_user = user_crud.delete_user(db, user_id=user_id)
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_user = await user_crud.delete_user(db, user_id=user_id)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return {"message": "User deleted successfully"}
@@ -0,0 +1,54 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Literal
+
+from fastapi import Query
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.config import settings
+from database.database import async_engine
+
+ExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+async def export_format(format: ExportFormat = Query("csv", description="csv или ndjson")) -> str:
+    return format
+
+
+def export_response(statement, fmt: str, filename: str) -> StreamingResponse:
+    """Stream ``statement``'s rows as CSV or NDJSON.
+
+    The body is produced while the rows are fetched from a server-side cursor
+    (``yield_per``), so memory stays flat whatever the table size.
+    """
+    return StreamingResponse(
+        _render(statement, fmt),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
+
+
+async def _render(statement, fmt: str) -> AsyncIterator[str]:
+    # своя сессия: тело отдаётся уже после выхода из зависимостей эндпоинта
+    async with AsyncSession(async_engine) as session:
+        result = await session.stream(statement.execution_options(yield_per=settings.export_batch_size))
+        columns = list(result.keys())
+        if fmt == "csv":
+            yield _csv_chunk([columns])
+        async for rows in result.partitions():
+            if fmt == "csv":
+                yield _csv_chunk(rows)
+            else:
+                yield "".join(
+                    json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str) + "\n" for row in rows
+                )
+
+
+def _csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from fastapi import HTTPException, Query
+
+
+class Include:
+    """Dependency parsing ``include=a,b`` against the relationships an endpoint allows."""
+
+    def __init__(self, *allowed: str):
+        self.allowed = allowed
+
+    async def __call__(self, include: Optional[str] = Query(None, description="Связи через запятую")) -> list[str]:
+        if not include:
+            return []
+        names = list(dict.fromkeys(name.strip() for name in include.split(",") if name.strip()))
+        unknown = [name for name in names if name not in self.allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown include: {', '.join(unknown)}. Allowed: {', '.join(self.allowed)}",
+            )
+        return names
@@ -0,0 +1,176 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.cache import caches
+from core.security import token_cache_info
+from database.pool import pool_snapshot
+
+# границы корзин гистограммы задержек, секунды (как у клиентов Prometheus по умолчанию)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# charset=utf-8 допишет PlainTextResponse
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+class _Shard:
+    """Counters written by one thread only."""
+
+    def __init__(self):
+        self.requests: defaultdict[tuple, int] = defaultdict(int)
+        # (method, route) -> [счётчики корзин..., +Inf, сумма]
+        self.latency: dict[tuple, list] = {}
+        self.started = 0
+        self.finished = 0
+
+
+class RequestMetrics:
+    """Per-route request counters and latency histograms.
+
+    Every thread records into its own shard, so the hot path takes no lock:
+    the event loop and each threadpool worker only ever touch their own
+    counters. A scrape sums the shards; the registry lock is taken only when
+    a thread records for the first time.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def start(self) -> None:
+        self._shard().started += 1
+
+    def finish(self, method: str, route: str, status: int, elapsed: float) -> None:
+        shard = self._shard()
+        shard.finished += 1
+        shard.requests[(method, route, status)] += 1
+        counts = shard.latency.get((method, route))
+        if counts is None:
+            counts = shard.latency[(method, route)] = [0] * (len(BUCKETS) + 1) + [0.0]
+        counts[bisect_left(BUCKETS, elapsed)] += 1
+        counts[-1] += elapsed
+
+    def collect(self) -> tuple[dict, dict, int]:
+        requests: defaultdict[tuple, int] = defaultdict(int)
+        latency: dict[tuple, list] = {}
+        in_flight = 0
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            # list(dict.items()) копируется целиком под GIL — запись в шард не мешает
+            for key, count in list(shard.requests.items()):
+                requests[key] += count
+            for key, counts in list(shard.latency.items()):
+                total = latency.setdefault(key, [0] * len(counts))
+                for i, value in enumerate(list(counts)):
+                    total[i] += value
+            in_flight += shard.started - shard.finished
+        return requests, latency, in_flight
+
+
+request_metrics = RequestMetrics()
+
+
+class MetricsMiddleware:
+    """Records every HTTP request into ``request_metrics`` under its route template."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        request_metrics.start()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # шаблон маршрута (/clients/{client_id}), а не путь — иначе метка на каждый id
+            route = scope.get("route")
+            request_metrics.finish(scope["method"], route.path if route is not None else "unmatched", status, time.perf_counter() - started)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def render(engines: dict) -> str:
+    """All metrics in the Prometheus text exposition format."""
+    requests, latency, in_flight = request_metrics.collect()
+    lines = [
+        "# HELP http_requests_total HTTP requests by route and status.",
+        "# TYPE http_requests_total counter",
+    ]
+    for (method, route, status), count in sorted(requests.items()):
+        lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+    lines += [
+        "# HELP http_request_duration_seconds HTTP request latency by route.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for (method, route), counts in sorted(latency.items()):
+        cumulative = 0
+        for bound, count in zip((*BUCKETS, "+Inf"), counts):
+            cumulative += count
+            lines.append(f"http_request_duration_seconds_bucket{_labels(method=method, route=route, le=bound)} {cumulative}")
+        lines.append(f"http_request_duration_seconds_sum{_labels(method=method, route=route)} {counts[-1]:.6f}")
+        lines.append(f"http_request_duration_seconds_count{_labels(method=method, route=route)} {cumulative}")
+
+    lines += [
+        "# HELP http_requests_in_flight HTTP requests being served.",
+        "# TYPE http_requests_in_flight gauge",
+        f"http_requests_in_flight {in_flight}",
+    ]
+
+    pool_metrics = {
+        "size": ("gauge", "Configured pool size."),
+        "checked_out": ("gauge", "Connections in use."),
+        "checked_in": ("gauge", "Idle connections in the pool."),
+        "overflow": ("gauge", "Overflow connections open."),
+        "checkouts": ("counter", "Connection checkouts."),
+        "timeouts": ("counter", "Checkouts that timed out."),
+    }
+    snapshots = {name: pool_snapshot(engine) for name, engine in engines.items()}
+    for key, (kind, help_text) in pool_metrics.items():
+        metric = f"db_pool_{key}" + ("_total" if kind == "counter" else "")
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+        for name, snapshot in snapshots.items():
+            if key in snapshot:
+                lines.append(f"{metric}{_labels(engine=name)} {snapshot[key]}")
+
+    cache_stats = {name: (cache.hits, cache.misses) for name, cache in caches.items()}
+    token_cache = token_cache_info()
+    cache_stats["auth_tokens"] = (token_cache.hits, token_cache.misses)
+    lines += ["# HELP cache_hits_total Cache lookups answered from the cache.", "# TYPE cache_hits_total counter"]
+    lines += [f"cache_hits_total{_labels(cache=name)} {hits}" for name, (hits, _) in sorted(cache_stats.items())]
+    lines += ["# HELP cache_misses_total Cache lookups that had to compute the value.", "# TYPE cache_misses_total counter"]
+    lines += [f"cache_misses_total{_labels(cache=name)} {misses}" for name, (_, misses) in sorted(cache_stats.items())]
+    lines += ["# HELP cache_hit_ratio Share of lookups answered from the cache.", "# TYPE cache_hit_ratio gauge"]
+    for name, (hits, misses) in sorted(cache_stats.items()):
+        lines.append(f"cache_hit_ratio{_labels(cache=name)} {hits / (hits + misses) if hits + misses else 0.0:.4f}")
+    return "\n".join(lines) + "\n"
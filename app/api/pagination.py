@@ -0,0 +1,88 @@
+from typing import Optional
+
+from fastapi import HTTPException, Response
+
+from crud.pagination import decode_cursor, encode_cursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _is_int(value) -> bool:
+    # bool — подкласс int, но true в курсоре не id
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class CursorPage:
+    """Opt-in keyset pagination for list endpoints.
+
+    Passing ``cursor`` (an empty value starts from the beginning) or ``after_id``
+    switches the endpoint from offset to keyset mode; the next cursor is
+    returned in the ``X-Next-Cursor`` header while a full page comes back.
+    A cursor is the last key, or ``[sort value, key]`` on ``sortable`` pages;
+    anything else is answered with 400.
+    """
+
+    key = "id"
+
+    def __init__(self, cursor: Optional[str] = None, after_id: Optional[int] = None, sortable: bool = False):
+        self.enabled = cursor is not None or after_id is not None
+        self.after = after_id
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                after = None
+            if not self._valid(after, sortable):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            self.after = after
+
+    def _valid(self, after, sortable: bool) -> bool:
+        if sortable and isinstance(after, list):
+            # колонки сортировки числовые; None — строки с NULL в конце выдачи
+            value = after[0] if len(after) == 2 else ""
+            return (value is None or _is_int(value) or isinstance(value, float)) and self._valid_key(after[1])
+        return self._valid_key(after)
+
+    @staticmethod
+    def _valid_key(value) -> bool:
+        return _is_int(value)
+
+    def set_next_cursor(self, response: Response, items: list, limit: int, sort_key: Optional[str] = None) -> None:
+        if not (self.enabled and items and len(items) >= limit):
+            return
+        last = items[-1]
+        key = getattr(last, self.key)
+        if sort_key is not None and sort_key != self.key:
+            key = [getattr(last, sort_key), key]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(key)
+
+
+class CodeCursorPage(CursorPage):
+    """Keyset pagination for reference tables keyed by ``code``."""
+
+    key = "code"
+
+    @staticmethod
+    def _valid_key(value) -> bool:
+        return isinstance(value, str)
+
+    def __init__(self, cursor: Optional[str] = None, after_code: Optional[str] = None):
+        super().__init__(cursor=cursor)
+        self.enabled = self.enabled or after_code is not None
+        if after_code is not None and not cursor:
+            self.after = after_code
+
+
+# async-обёртки: FastAPI вызывает классы-зависимости в threadpool, корутины — прямо в event loop
+
+async def cursor_page(cursor: Optional[str] = None, after_id: Optional[int] = None) -> CursorPage:
+    return CursorPage(cursor=cursor, after_id=after_id)
+
+
+async def sorted_cursor_page(cursor: Optional[str] = None, after_id: Optional[int] = None) -> CursorPage:
+    """For endpoints with ``sort=``: the cursor may also be a ``[value, id]`` pair."""
+    return CursorPage(cursor=cursor, after_id=after_id, sortable=True)
+
+
+async def code_cursor_page(cursor: Optional[str] = None, after_code: Optional[str] = None) -> CodeCursorPage:
+    return CodeCursorPage(cursor=cursor, after_code=after_code)
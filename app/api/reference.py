@@ -0,0 +1,94 @@
+import hashlib
+import time
+from bisect import bisect_right
+from typing import Awaitable, Callable, Optional
+
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from api.compression import CompressedBody
+from core.cache import VersionedCache
+from core.config import settings
+from crud.aio import ownership_type_crud, restriction_type_crud
+from models.ownership_types import OwnershipType, OwnershipTypeRead
+from models.restriction_types import RestrictionType, RestrictionTypeRead
+
+
+class ReferenceSnapshot:
+    """All rows of a lookup table as loaded at one table version."""
+
+    def __init__(self, rows: list[SQLModel], read_model: type[SQLModel]):
+        # порядок Python, а не collation БД: по нему же идёт bisect в page()
+        self.rows = rows = sorted(rows, key=lambda row: row.code)
+        self.by_code = {row.code: row for row in rows}
+        self.codes = [row.code for row in rows]
+        # полный список — самый частый ответ: JSON и его сжатые варианты готовятся один раз
+        self.body = CompressedBody(TypeAdapter(list[read_model]).dump_json(rows))
+        # от содержимого, а не от счётчика версий: у всех воркеров одинаковый
+        self.etag = f'W/"{hashlib.sha256(self.body.body).hexdigest()[:32]}"'
+
+    def __contains__(self, code: str) -> bool:
+        return code in self.by_code
+
+    def page(self, skip: int = 0, limit: int = 100, after: Optional[str] = None) -> list[SQLModel]:
+        # как Repository.get_page: строки уже упорядочены по коду
+        start = bisect_right(self.codes, after) if after is not None else skip
+        return self.rows[start:start + limit]
+
+
+class ReferenceData:
+    """Versioned in-process copy of a small lookup table keyed by ``code``.
+
+    The snapshot is reloaded on the first read after a commit to the table
+    (``table_versions``), so the create/update/delete endpoints invalidate it
+    without extra calls. Writes made by other worker processes are not
+    counted there: a code missing from the snapshot is looked up again in a
+    reloaded one before it is reported as unknown (at most one such reload
+    per ``settings.reference_miss_reload_interval``, so requests for unknown
+    codes cannot turn every call into a table scan), and
+    ``settings.reference_cache_ttl`` bounds how long other changes stay unseen.
+    """
+
+    def __init__(self, model: type[SQLModel], read_model: type[SQLModel], load: Callable[[AsyncSession], Awaitable[list]], detail: str):
+        self.read_model = read_model
+        self.detail = detail
+        self._load = load
+        self._cache = VersionedCache(tables=(model.__tablename__,), ttl=settings.reference_cache_ttl, maxsize=1, name=model.__tablename__)
+        self._next_miss_reload = 0.0
+
+    async def snapshot(self, db: AsyncSession) -> ReferenceSnapshot:
+        return await self._cache.get_or_compute_async("all", lambda: self._build(db))
+
+    async def fresh_snapshot(self, db: AsyncSession) -> ReferenceSnapshot:
+        """Snapshot reloaded from the table now, whatever the cached one is."""
+        self._cache.clear()
+        return await self.snapshot(db)
+
+    async def _build(self, db: AsyncSession) -> ReferenceSnapshot:
+        return ReferenceSnapshot([self.read_model.model_validate(row) for row in await self._load(db)], self.read_model)
+
+    async def lookup(self, db: AsyncSession, code: str) -> Optional[SQLModel]:
+        """Row for ``code``; a hit costs no query, a miss is confirmed against a reloaded snapshot."""
+        row = (await self.snapshot(db)).by_code.get(code)
+        now = time.monotonic()
+        if row is None and now >= self._next_miss_reload:
+            # код мог добавить другой воркер — его запись не сбрасывает наш снимок;
+            # срок сдвигается до await: параллельные промахи не перечитывают таблицу ещё раз
+            self._next_miss_reload = now + settings.reference_miss_reload_interval
+            row = (await self.fresh_snapshot(db)).by_code.get(code)
+        return row
+
+    async def require(self, db: AsyncSession, code: str) -> None:
+        """400 if ``code`` is not in the table."""
+        if await self.lookup(db, code) is None:
+            raise HTTPException(status_code=400, detail=f"{self.detail}: {code}")
+
+    def row_check(self, snapshot: ReferenceSnapshot, field: str) -> Callable[[dict], Optional[str]]:
+        """Per-row check for ``import_stream``: an error message for unknown codes."""
+        return lambda data: None if data[field] in snapshot else f"{self.detail}: {data[field]}"
+
+
+ownership_types = ReferenceData(OwnershipType, OwnershipTypeRead, ownership_type_crud.get_all_ownership_types, "Unknown ownership type code")
+restriction_types = ReferenceData(RestrictionType, RestrictionTypeRead, restriction_type_crud.get_all_restriction_types, "Unknown restriction type code")
@@ -0,0 +1,38 @@
+from functools import lru_cache
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlmodel import SQLModel
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def _json(response: Response, body: bytes) -> Response:
+    # ответ собран вручную: переносим заголовки, выставленные зависимостями (ETag, X-Next-Cursor)
+    return Response(body, media_type="application/json", headers=dict(response.headers))
+
+
+def rows_response(response: Response, rows: list[SQLModel], schema: type[BaseModel]) -> Response:
+    """JSON list of ORM ``rows`` written straight through ``schema``'s serializer.
+
+    Rows loaded from the database are already valid, so the validate-then-
+    serialize pass FastAPI runs for ``response_model`` is skipped: pydantic-core
+    reads each row's attributes and writes JSON bytes in one call. Only the
+    schema's fields are written (``User.password`` stays out of ``UserRead``),
+    and of the ``*Expanded`` relations only those loaded — i.e. eager-loaded
+    for ``include=``. Rows must not be expired (no commit after loading).
+    Keep ``response_model`` on the route: it still documents the response.
+    """
+    return _json(response, _adapter(list[schema]).dump_json(rows))
+
+
+def row_json(row: SQLModel, schema: type[BaseModel]) -> bytes:
+    """``row`` as JSON bytes through ``schema``, without validation (see ``rows_response``)."""
+    return _adapter(schema).dump_json(row)
+
+
+def row_response(response: Response, row: SQLModel, schema: type[BaseModel]) -> Response:
+    return _json(response, row_json(row, schema))
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel
+
+from core.security import decode_token
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+class TokenUser(BaseModel):
+    id: int
+    login: str
+    role: Optional[str] = None
+
+
+async def current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)) -> TokenUser:
+    """User from the ``Authorization: Bearer`` token — no database lookup."""
+    if credentials is None:
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+    try:
+        claims = decode_token(credentials.credentials)
+    except ValueError as exc:
+        raise HTTPException(status_code=401, detail=str(exc), headers={"WWW-Authenticate": "Bearer"})
+    return TokenUser(id=int(claims["sub"]), login=claims["login"], role=claims.get("role"))
@@ -0,0 +1,68 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+from database.sql_stats import SqlStats, current_stats
+
+logger = logging.getLogger("api.sql")
+
+
+class SqlTimingMiddleware:
+    """Per-request SQL count and time as ``Server-Timing`` plus one log line.
+
+    The header reports what ran before the response started; the log line,
+    written when the response is finished, also covers streamed bodies.
+    Statement shapes repeated ``settings.sql_n_plus_one_threshold`` times or
+    more are logged as a likely N+1. Registered only when
+    ``settings.sql_instrumentation`` is on, together with the engine hooks.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = SqlStats()
+        token = current_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+                    f"app;dur={(time.perf_counter() - started) * 1000:.1f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_stats.reset(token)
+            self._log(scope, status, stats, time.perf_counter() - started)
+
+    @staticmethod
+    def _log(scope: Scope, status: int, stats: SqlStats, elapsed: float) -> None:
+        record = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status,
+            "queries": stats.count,
+            "db_ms": round(stats.duration * 1000, 2),
+            "total_ms": round(elapsed * 1000, 2),
+        }
+        logger.info(" ".join(f"{key}={value}" for key, value in record.items()), extra={"sql": record})
+        for shape, count in stats.repeated(settings.sql_n_plus_one_threshold):
+            logger.warning(
+                "possible N+1 on %s %s: %d x %s", scope["method"], scope["path"], count, " ".join(shape.split())[:200],
+                extra={"sql": {**record, "repeated": count, "statement": shape}},
+            )
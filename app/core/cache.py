@@ -0,0 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from database.table_versions import table_versions
+
+# именованные кеши — для /metrics
+caches: dict[str, "VersionedCache"] = {}
+
+
+class VersionedCache:
+    """In-process cache whose entries are dropped once any of ``tables`` is written.
+
+    Entries also expire after ``ttl`` seconds so that writes made by other
+    worker processes become visible eventually.
+    """
+
+    def __init__(self, tables: tuple[str, ...], ttl: float, maxsize: int = 128, name: str | None = None):
+        self.tables = tables
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[tuple, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        if name is not None:
+            caches[name] = self
+
+    def _lookup(self, key: Hashable, token: tuple, now: float) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == token and entry[1] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[2]
+            self.misses += 1
+        return False, None
+
+    def _store(self, key: Hashable, token: tuple, now: float, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (token, now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        token = table_versions.token(self.tables)
+        now = time.monotonic()
+        found, value = self._lookup(key, token, now)
+        if not found:
+            # считаем без блокировки: compute ходит в БД и может надолго уступить управление
+            value = compute()
+            self._store(key, token, now, value)
+        return value
+
+    async def get_or_compute_async(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        token = table_versions.token(self.tables)
+        now = time.monotonic()
+        found, value = self._lookup(key, token, now)
+        if not found:
+            value = await compute()
+            self._store(key, token, now, value)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,63 @@
+from typing import Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # пул соединений (одинаковые настройки для sync и async engine)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # ожидание соединения дольше порога пишется в лог database.pool
+    db_pool_slow_checkout_ms: float = 100.0
+
+    # сколько секунд живёт снимок дашборда, даже если записей не было
+    # (страховка для записей из других воркеров)
+    dashboard_cache_ttl: float = 30.0
+    report_cache_ttl: float = 300.0
+    # справочники видов прав и ограничений
+    reference_cache_ttl: float = 300.0
+    # неизвестный код перечитывает справочник не чаще раза в столько секунд
+    reference_miss_reload_interval: float = 1.0
+    # карточка объекта (/real_estate/{id}/dossier); 0 — без кеша
+    dossier_cache_ttl: float = 10.0
+    dossier_cache_size: int = 1024
+    # периоды ограничений в памяти для POST /restrictions/check; 0 — каждый раз запрос к БД
+    encumbrance_index_ttl: float = 60.0
+
+    # условные GET: Cache-Control ответов и как часто ETag/Last-Modified сменяются
+    # сами (версии таблиц считаются в процессе и не видят записей других воркеров)
+    http_cache_control: str = "no-cache"
+    http_validator_ttl: int = 60
+
+    # сжатие ответов: gzip, а при установленном пакете brotli — и br
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+
+    # счётчик SQL на запрос (Server-Timing, лог api.sql, поиск N+1); выключен — ничего не стоит
+    sql_instrumentation: bool = False
+    sql_n_plus_one_threshold: int = 5
+
+    # массовый импорт: строк на транзакцию и сколько ошибок строк вернуть в ответе
+    import_batch_size: int = 1000
+    import_max_errors: int = 1000
+    # экспорт: строк за одну выборку из серверного курсора
+    export_batch_size: int = 1000
+
+    # ключ подписи токенов, один на все воркеры; без AUTH_SECRET_KEY приложение не стартует.
+    # AUTH_DEV_MODE=1 — случайный ключ на процесс (токены не переживают рестарт
+    # и не принимаются другими воркерами), только для разработки
+    auth_secret_key: Optional[str] = None
+    auth_dev_mode: bool = False
+    auth_token_ttl: int = 3600
+    auth_token_cache_size: int = 1024
+    # стоимость scrypt (2**14 ≈ 80 мс); после смены пароли перехешируются при входе
+    auth_scrypt_n: int = 2**14
+
+
+settings = Settings()
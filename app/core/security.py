@@ -0,0 +1,124 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+from core.config import settings
+
+_SCHEME = "scrypt"
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=128 * r * n * 2, dklen=32)
+
+
+def hash_password(password: str) -> str:
+    """``scrypt$n$r$p$salt$hash``. Deliberately slow: call it from a worker thread."""
+    n, r, p = settings.auth_scrypt_n, 8, 1
+    salt = os.urandom(16)
+    return f"{_SCHEME}${n}${r}${p}${_b64encode(salt)}${_b64encode(_scrypt(password, salt, n, r, p))}"
+
+
+def verify_password(password: str, stored: str) -> bool:
+    if not is_hashed(stored):
+        # пароли, сохранённые до хеширования: сравниваем как есть, при входе они перехешируются
+        return hmac.compare_digest(password.encode(), stored.encode())
+    try:
+        _, n, r, p, salt, expected = stored.split("$")
+        actual = _scrypt(password, _b64decode(salt), int(n), int(r), int(p))
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, _b64decode(expected))
+
+
+def is_hashed(stored: str) -> bool:
+    return stored.startswith(f"{_SCHEME}$")
+
+
+def needs_rehash(stored: str) -> bool:
+    return not is_hashed(stored) or stored.split("$")[1] != str(settings.auth_scrypt_n)
+
+
+@lru_cache(maxsize=1)
+def dummy_hash() -> str:
+    # для неизвестного логина пароль проверяется против этого хеша — время ответа то же
+    return hash_password(os.urandom(16).hex())
+
+
+_HEADER = _b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+
+@lru_cache(maxsize=1)
+def signing_key() -> bytes:
+    """Token signing key; raises ``RuntimeError`` if ``AUTH_SECRET_KEY`` is unset outside dev mode.
+
+    Called at startup so a misconfigured worker fails instead of issuing
+    tokens the other workers reject.
+    """
+    if settings.auth_secret_key:
+        return settings.auth_secret_key.encode()
+    if settings.auth_dev_mode:
+        return secrets.token_urlsafe(32).encode()
+    raise RuntimeError("AUTH_SECRET_KEY is not set (use the same value for every worker, or AUTH_DEV_MODE=1 for development)")
+
+
+def _sign(message: bytes) -> bytes:
+    return hmac.new(signing_key(), message, hashlib.sha256).digest()
+
+
+def create_token(claims: dict, ttl: int | None = None) -> str:
+    """HS256 JWT with ``claims`` plus ``iat``/``exp``."""
+    now = int(time.time())
+    payload = {**claims, "iat": now, "exp": now + (ttl if ttl is not None else settings.auth_token_ttl)}
+    signing_input = f"{_HEADER}.{_b64encode(json.dumps(payload, separators=(',', ':')).encode())}"
+    return f"{signing_input}.{_b64encode(_sign(signing_input.encode()))}"
+
+
+def decode_token(token: str) -> Mapping:
+    """Claims of a valid, unexpired token; raises ``ValueError`` otherwise.
+
+    The signature check and JSON decoding are cached per token string, so a
+    client reusing its token costs a dict lookup and the ``exp`` comparison.
+    The claims are shared with later requests and therefore read-only.
+    """
+    claims = _verified_claims(token)
+    if claims["exp"] <= time.time():
+        raise ValueError("Token expired")
+    return claims
+
+
+def token_cache_info():
+    """Hits and misses of the verified-claims cache (``functools`` ``CacheInfo``)."""
+    return _verified_claims.cache_info()
+
+
+@lru_cache(maxsize=settings.auth_token_cache_size)
+def _verified_claims(token: str) -> Mapping:
+    # исключения не кешируются: подделанный токен каждый раз проверяется заново
+    try:
+        signing_input, signature = token.rsplit(".", 1)
+        header, payload = signing_input.split(".")
+        valid = hmac.compare_digest(_b64decode(signature), _sign(signing_input.encode()))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Malformed token") from exc
+    if header != _HEADER or not valid:
+        raise ValueError("Invalid token signature")
+    claims = json.loads(_b64decode(payload))
+    if not isinstance(claims, dict) or not isinstance(claims.get("exp"), int):
+        raise ValueError("Malformed token")
+    # один объект на все запросы с этим токеном — изменять его нельзя
+    return MappingProxyType(claims)
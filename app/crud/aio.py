@@ -0,0 +1,54 @@
+from types import ModuleType
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import crud.client_crud as _client_crud
+import crud.dashboard_crud as _dashboard_crud
+import crud.deal_crud as _deal_crud
+import crud.import_crud as _import_crud
+import crud.ownership_crud as _ownership_crud
+import crud.ownership_type_crud as _ownership_type_crud
+import crud.real_estate_crud as _real_estate_crud
+import crud.report_crud as _report_crud
+import crud.restriction_type_crud as _restriction_type_crud
+import crud.restrictions_crud as _restrictions_crud
+import crud.search_crud as _search_crud
+import crud.user_crud as _user_crud
+
+
+class AsyncCrud:
+    """Async counterpart of a ``*_crud`` module.
+
+    ``await client_crud.get_client(db, client_id)`` runs the sync function
+    through ``AsyncSession.run_sync``: the ORM code is shared, while the I/O
+    goes through the async driver on the event loop instead of a threadpool
+    thread.
+    """
+
+    def __init__(self, module: ModuleType):
+        self._module = module
+
+    def __getattr__(self, name: str):
+        func = getattr(self._module, name)
+
+        async def call(db: AsyncSession, *args, **kwargs):
+            return await db.run_sync(func, *args, **kwargs)
+
+        call.__name__ = call.__qualname__ = name
+        call.__doc__ = func.__doc__
+        setattr(self, name, call)
+        return call
+
+
+client_crud = AsyncCrud(_client_crud)
+dashboard_crud = AsyncCrud(_dashboard_crud)
+deal_crud = AsyncCrud(_deal_crud)
+import_crud = AsyncCrud(_import_crud)
+ownership_crud = AsyncCrud(_ownership_crud)
+ownership_type_crud = AsyncCrud(_ownership_type_crud)
+real_estate_crud = AsyncCrud(_real_estate_crud)
+report_crud = AsyncCrud(_report_crud)
+restriction_type_crud = AsyncCrud(_restriction_type_crud)
+restrictions_crud = AsyncCrud(_restrictions_crud)
+search_crud = AsyncCrud(_search_crud)
+user_crud = AsyncCrud(_user_crud)
@@ -1,8 +1,11 @@
 from sqlmodel import Session, select
+from crud.repository import Repository
 from models.clients import Client
 
+repository = Repository(Client)
+
 def get_client(db: Session, client_id: int) -> Client | None:
-    return db.get(Client, client_id)
+    return repository.get(db, client_id)
 
 def get_client_by_email(db: Session, email: str) -> Client | None:
     statement = select(Client).where(Client.email == email)
@@ -12,30 +15,14 @@ def get_client_by_phone(db: Session, phone: str) -> Client | None:
     statement = select(Client).where(Client.phone == phone)
     return db.exec(statement).first()
 
-def get_clients(db: Session, skip: int = 0, limit: int = 100) -> list[Client]:
-    statement = select(Client).offset(skip).limit(limit)
-    return db.exec(statement).all()
+def get_clients(db: Session, skip: int = 0, limit: int = 100, after: int | None = None) -> list[Client]:
+    return repository.get_page(db, skip=skip, limit=limit, after=after)
 
 def create_client(db: Session, client: Client) -> Client:
-    db.add(client)
-    db.commit()
-    db.refresh(client)
-    return client
+    return repository.create(db, client)
 
 def update_client(db: Session, client_id: int, client_data: dict) -> Client | None:
-    client = db.get(Client, client_id)
-    if client:
-        for key, value in client_data.items():
-            if value is not None:  # Обновляем только переданные поля
-                setattr(client, key, value)
-        db.add(client)
-        db.commit()
-        db.refresh(client)
-    return client
+    return repository.update(db, client_id, client_data)
 
 def delete_client(db: Session, client_id: int) -> Client | None:
-    client = db.get(Client, client_id)
-    if client:
-        db.delete(client)
-        db.commit()
-    return client
\ No newline at end of file
+    return repository.delete(db, client_id)
\ No newline at end of file
@@ -0,0 +1,37 @@
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from models.clients import Client
+from models.deals import Deal
+from models.real_estate import RealEstate
+
+
+def get_stats(db: Session) -> tuple[int, int, int]:
+    # три счётчика одним запросом через скалярные подзапросы
+    statement = select(
+        select(func.count()).select_from(RealEstate).scalar_subquery(),
+        select(func.count()).select_from(Client).scalar_subquery(),
+        select(func.count()).select_from(Deal).where(Deal.status == "active").scalar_subquery(),
+    )
+    return tuple(db.exec(statement).one())
+
+
+def get_recent_deals(db: Session, limit: int = 5) -> list[tuple[str, str, float]]:
+    # только нужные колонки через JOIN — без ленивой загрузки deal.client / deal.real_estate
+    statement = (
+        select(Client.full_name, RealEstate.address, Deal.amount)
+        .join(Client, Deal.client_id == Client.id)
+        .join(RealEstate, Deal.real_estate_id == RealEstate.id)
+        .order_by(Deal.deal_date.desc())
+        .limit(limit)
+    )
+    return [tuple(row) for row in db.exec(statement).all()]
+
+
+def get_new_properties(db: Session, limit: int = 5) -> list[tuple[str, str, float]]:
+    statement = (
+        select(RealEstate.address, RealEstate.type, RealEstate.price)
+        .order_by(RealEstate.id.desc())
+        .limit(limit)
+    )
+    return [tuple(row) for row in db.exec(statement).all()]
@@ -1,38 +1,25 @@
-from sqlmodel import Session, select
+from sqlmodel import Session
+from crud.repository import Repository
 from models.deals import Deal
 
+repository = Repository(Deal)
 
-def get_deal(db: Session, deal_id: int) -> Deal | None:
-    return db.get(Deal, deal_id)
 
+def get_deal(db: Session, deal_id: int, include=()) -> Deal | None:
+    return repository.get(db, deal_id, include=include)
 
-def get_deals(db: Session, skip: int = 0, limit: int = 100) -> list[Deal]:
-    statement = select(Deal).offset(skip).limit(limit)
-    return db.exec(statement).all()
+
+def get_deals(db: Session, skip: int = 0, limit: int = 100, after: int | None = None, include=()) -> list[Deal]:
+    return repository.get_page(db, skip=skip, limit=limit, after=after, include=include)
 
 
 def create_deal(db: Session, deal: Deal) -> Deal:
-    db.add(deal)
-    db.commit()
-    db.refresh(deal)
-    return deal
+    return repository.create(db, deal)
 
 
 def update_deal(db: Session, deal_id: int, update_data: dict) -> Deal | None:
-    deal = db.get(Deal, deal_id)
-    if deal:
-        for key, value in update_data.items():
-            if value is not None:
-                setattr(deal, key, value)
-        db.add(deal)
-        db.commit()
-        db.refresh(deal)
-    return deal
+    return repository.update(db, deal_id, update_data)
 
 
 def delete_deal(db: Session, deal_id: int) -> Deal | None:
-    deal = db.get(Deal, deal_id)
-    if deal:
-        db.delete(deal)
-        db.commit()
-    return deal
+    return repository.delete(db, deal_id)
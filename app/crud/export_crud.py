@@ -0,0 +1,17 @@
+from sqlalchemy import select
+
+
+def export_statement(model, filters=None, sort_column=None, descending: bool = False):
+    """Plain column rows of ``model``'s table in a stable order, for streaming export.
+
+    Rows come back as tuples rather than ORM objects, so nothing piles up in
+    the session's identity map however many rows are read.
+    """
+    statement = select(*model.__table__.columns)
+    if filters is not None:
+        statement = filters.apply(statement)
+    key_column = model.__table__.c.id
+    if sort_column is None:
+        return statement.order_by(key_column.desc() if descending else key_column)
+    sort_order = sort_column.desc() if descending else sort_column.asc()
+    return statement.order_by(sort_order.nulls_last(), key_column)
@@ -0,0 +1,72 @@
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.util import await_only
+from sqlmodel import Session
+
+from database.table_versions import mark_written
+
+
+def insert_rows(db: Session, model, rows: list[tuple[int, dict]]) -> list[tuple[int, str]]:
+    """Insert one batch of validated ``(row_number, values)`` in a single transaction.
+
+    Returns ``(row_number, error)`` for the rows the database rejected; the
+    rest of the batch is committed either way.
+    """
+    if not rows:
+        return []
+    values = [value for _, value in rows]
+    if db.get_bind().dialect.driver == "asyncpg":
+        inserted = _copy(db, model, values)
+    else:
+        inserted = _execute_many(db, model, values)
+    if inserted:
+        return []
+
+    # в пачке есть плохие строки: повторяем построчно в savepoint-ах,
+    # чтобы отбросить только их
+    errors = []
+    for row, value in rows:
+        try:
+            with db.begin_nested():
+                db.execute(insert(model), [value])
+        except DBAPIError as exc:
+            errors.append((row, _describe(exc)))
+    db.commit()
+    return errors
+
+
+def _execute_many(db: Session, model, values: list[dict]) -> bool:
+    # один executemany вместо INSERT + refresh на каждую строку
+    try:
+        db.execute(insert(model), values)
+        db.commit()
+    except DBAPIError:
+        db.rollback()
+        return False
+    return True
+
+
+def _copy(db: Session, model, values: list[dict]) -> bool:
+    # COPY есть только у asyncpg: без этого драйвера пакет не нужен
+    import asyncpg
+
+    columns = list(values[0])
+    raw = db.connection().connection.driver_connection
+    try:
+        await_only(raw.copy_records_to_table(
+            model.__tablename__,
+            records=[tuple(value[column] for column in columns) for value in values],
+            columns=columns,
+        ))
+        mark_written(db, model.__tablename__)
+        db.commit()
+    # COPY идёт мимо SQLAlchemy прямо в соединение asyncpg: его ошибки не оборачиваются в DBAPIError
+    except (DBAPIError, asyncpg.PostgresError):
+        db.rollback()
+        return False
+    return True
+
+
+def _describe(exc: DBAPIError) -> str:
+    lines = str(exc.orig).strip().splitlines()
+    return lines[0] if lines else type(exc.orig).__name__
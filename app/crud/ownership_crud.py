@@ -1,33 +1,20 @@
-from sqlmodel import Session, select
+from sqlmodel import Session
+from crud.repository import Repository
 from models.ownership import Ownership
 
-def get_ownership(db: Session, ownership_id: int) -> Ownership | None:
-    return db.get(Ownership, ownership_id)
+repository = Repository(Ownership)
 
-def get_ownerships(db: Session, skip: int = 0, limit: int = 100) -> list[Ownership]:
-    statement = select(Ownership).offset(skip).limit(limit)
-    return db.exec(statement).all()
+def get_ownership(db: Session, ownership_id: int, include=()) -> Ownership | None:
+    return repository.get(db, ownership_id, include=include)
+
+def get_ownerships(db: Session, skip: int = 0, limit: int = 100, after: int | None = None, include=()) -> list[Ownership]:
+    return repository.get_page(db, skip=skip, limit=limit, after=after, include=include)
 
 def create_ownership(db: Session, ownership: Ownership) -> Ownership:
-    db.add(ownership)
-    db.commit()
-    db.refresh(ownership)
-    return ownership
+    return repository.create(db, ownership)
 
 def update_ownership(db: Session, ownership_id: int, update_data: dict) -> Ownership | None:
-    ownership = db.get(Ownership, ownership_id)
-    if ownership:
-        for key, value in update_data.items():
-            if value is not None:
-                setattr(ownership, key, value)
-        db.add(ownership)
-        db.commit()
-        db.refresh(ownership)
-    return ownership
+    return repository.update(db, ownership_id, update_data)
 
 def delete_ownership(db: Session, ownership_id: int) -> Ownership | None:
-    ownership = db.get(Ownership, ownership_id)
-    if ownership:
-        db.delete(ownership)
-        db.commit()
-    return ownership
+    return repository.delete(db, ownership_id)
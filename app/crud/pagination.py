@@ -0,0 +1,47 @@
+import base64
+import binascii
+import json
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(key) -> str:
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        return json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def paginate(statement, key_column, skip: int = 0, limit: int = 100, after=None, sort_column=None, descending: bool = False):
+    # keyset: WHERE key > :after ORDER BY key — глубокие страницы стоят как первая
+    if sort_column is None:
+        statement = statement.order_by(key_column.desc() if descending else key_column)
+        if isinstance(after, (list, tuple)):
+            # курсор от другой сортировки
+            raise ValueError("Invalid cursor")
+        if after is not None:
+            statement = statement.where(key_column < after if descending else key_column > after)
+    else:
+        # при сортировке по неуникальной колонке курсор — пара (значение, key)
+        sort_order = sort_column.desc() if descending else sort_column.asc()
+        statement = statement.order_by(sort_order.nulls_last(), key_column)
+        if after is not None:
+            if not isinstance(after, (list, tuple)) or len(after) != 2:
+                raise ValueError("Invalid cursor")
+            statement = statement.where(_after_sorted(sort_column, key_column, *after, descending))
+    if after is None:
+        statement = statement.offset(skip)
+    return statement.limit(limit)
+
+
+def _after_sorted(sort_column, key_column, value, key, descending: bool):
+    if value is None:
+        return and_(sort_column.is_(None), key_column > key)
+    beyond = sort_column < value if descending else sort_column > value
+    return or_(beyond, and_(sort_column == value, key_column > key), sort_column.is_(None))
@@ -1,33 +1,137 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import Session, select
+from crud.export_crud import export_statement
+from crud.pagination import paginate
+from crud.relations import eager_options
+from crud.repository import Repository
+from crud.restrictions_crud import active_on
+from crud.search_crud import contains
+from models.deals import Deal
+from models.ownership import Ownership
 from models.real_estate import RealEstate
+from models.restrictions import Restriction
+
+repository = Repository(RealEstate)
+
+def get_real_estate(db: Session, real_estate_id: int, include=()) -> RealEstate | None:
+    return repository.get(db, real_estate_id, include=include)
+
+def get_dossier(db: Session, real_estate_id: int, today: date | None = None) -> RealEstate | None:
+    """The object with ownerships, active restrictions and deals, in four queries.
+
+    One SELECT for the object and one ``SELECT ... IN`` per collection, with
+    owners, clients, employees and reference types joined into those, so the
+    count does not grow with the number of rows. A restriction is active on
+    ``today`` if it was imposed by then and not removed yet.
+    """
+    today = today or date.today()
+    statement = select(RealEstate).where(RealEstate.id == real_estate_id).options(
+        selectinload(RealEstate.ownerships).options(joinedload(Ownership.owner), joinedload(Ownership.ownership_type)),
+        selectinload(RealEstate.restrictions.and_(active_on(today))).joinedload(Restriction.restriction_type),
+        selectinload(RealEstate.deals).options(joinedload(Deal.client), joinedload(Deal.employee)),
+    )
+    real_estate = db.exec(statement).first()
+    if real_estate is None:
+        return None
+    # порядок для карточки; set_committed_value не делает коллекции «изменёнными»
+    set_committed_value(real_estate, "ownerships", sorted(real_estate.ownerships, key=lambda row: (row.registration_date, row.id)))
+    set_committed_value(real_estate, "restrictions", sorted(real_estate.restrictions, key=lambda row: (row.imposed_date, row.id)))
+    set_committed_value(real_estate, "deals", sorted(real_estate.deals, key=lambda row: (row.deal_date, row.id), reverse=True))
+    return real_estate
+
+SORT_COLUMNS = {
+    "id": RealEstate.id,
+    "price": RealEstate.price,
+    "area": RealEstate.area,
+    "rooms": RealEstate.rooms,
+    "floor": RealEstate.floor,
+}
+
 
-def get_real_estate(db: Session, real_estate_id: int) -> RealEstate | None:
-    return db.get(RealEstate, real_estate_id)
+@dataclass
+class RealEstateFilters:
+    type: Optional[str] = None
+    status: Optional[str] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    min_area: Optional[float] = None
+    max_area: Optional[float] = None
+    rooms: Optional[int] = None
+    floor: Optional[int] = None
+    min_floor: Optional[int] = None
+    max_floor: Optional[int] = None
+    address: Optional[str] = None
 
-def get_real_estates(db: Session, skip: int = 0, limit: int = 100) -> list[RealEstate]:
-    statement = select(RealEstate).offset(skip).limit(limit)
+    def apply(self, statement):
+        if self.type is not None:
+            statement = statement.where(RealEstate.type == self.type)
+        if self.status is not None:
+            statement = statement.where(RealEstate.status == self.status)
+        if self.min_price is not None:
+            statement = statement.where(RealEstate.price >= self.min_price)
+        if self.max_price is not None:
+            statement = statement.where(RealEstate.price <= self.max_price)
+        if self.min_area is not None:
+            statement = statement.where(RealEstate.area >= self.min_area)
+        if self.max_area is not None:
+            statement = statement.where(RealEstate.area <= self.max_area)
+        if self.rooms is not None:
+            statement = statement.where(RealEstate.rooms == self.rooms)
+        if self.floor is not None:
+            statement = statement.where(RealEstate.floor == self.floor)
+        if self.min_floor is not None:
+            statement = statement.where(RealEstate.floor >= self.min_floor)
+        if self.max_floor is not None:
+            statement = statement.where(RealEstate.floor <= self.max_floor)
+        if self.address:
+            statement = statement.where(contains(RealEstate.address, self.address))
+        return statement
+
+
+def parse_sort(sort: str) -> tuple[str, bool]:
+    """``"-price"`` -> ``("price", True)``; raises ``ValueError`` on unknown keys."""
+    descending = sort.startswith("-")
+    key = sort.lstrip("-")
+    if key not in SORT_COLUMNS:
+        raise ValueError(f"Unknown sort key: {key}")
+    return key, descending
+
+
+def get_real_estates(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after=None,
+    filters: RealEstateFilters | None = None,
+    sort: str = "id",
+    include=(),
+) -> list[RealEstate]:
+    statement = select(RealEstate).options(*eager_options(RealEstate, include))
+    if filters is not None:
+        statement = filters.apply(statement)
+    key, descending = parse_sort(sort)
+    sort_column = None if key == "id" else SORT_COLUMNS[key]
+    statement = paginate(
+        statement, RealEstate.id, skip=skip, limit=limit, after=after,
+        sort_column=sort_column, descending=descending,
+    )
     return db.exec(statement).all()
 
+def export_real_estates_statement(filters: RealEstateFilters | None = None, sort: str = "id"):
+    key, descending = parse_sort(sort)
+    sort_column = None if key == "id" else SORT_COLUMNS[key]
+    return export_statement(RealEstate, filters, sort_column, descending)
+
 def create_real_estate(db: Session, real_estate: RealEstate) -> RealEstate:
-    db.add(real_estate)
-    db.commit()
-    db.refresh(real_estate)
-    return real_estate
+    return repository.create(db, real_estate)
 
 def update_real_estate(db: Session, real_estate_id: int, update_data: dict) -> RealEstate | None:
-    real_estate = db.get(RealEstate, real_estate_id)
-    if real_estate:
-        for key, value in update_data.items():
-            if value is not None:
-                setattr(real_estate, key, value)
-        db.add(real_estate)
-        db.commit()
-        db.refresh(real_estate)
-    return real_estate
+    return repository.update(db, real_estate_id, update_data)
 
 def delete_real_estate(db: Session, real_estate_id: int) -> RealEstate | None:
-    real_estate = db.get(RealEstate, real_estate_id)
-    if real_estate:
-        db.delete(real_estate)
-        db.commit()
-    return real_estate
+    return repository.delete(db, real_estate_id)
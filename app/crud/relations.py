@@ -0,0 +1,12 @@
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, selectinload
+
+
+def eager_options(model, names) -> list:
+    # многие-к-одному — JOIN в тот же запрос, коллекции — один SELECT ... IN на все строки
+    relationships = inspect(model).relationships
+    return [
+        selectinload(getattr(model, name)) if relationships[name].uselist else joinedload(getattr(model, name))
+        for name in names
+    ]
+
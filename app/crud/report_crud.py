@@ -0,0 +1,71 @@
+from datetime import date
+
+from sqlalchemy import Date, case, cast, func, or_
+from sqlmodel import Session, select
+
+from models.deals import Deal
+from models.real_estate import RealEstate
+from models.users import User
+
+PERIODS = ("day", "week", "month")
+# у аренды в amount — месячный платёж, у ипотеки — сумма кредита: цена объекта только у продажи
+SALE = "Продажа"
+# интерфейс пишет статусы по-русски, API-клиенты и seed_data — по-английски
+CANCELLED = ("Отменена", "cancelled")
+
+
+def _period_start(db: Session, column, period: str):
+    # начало дня/недели (понедельник)/месяца, посчитанное в самой БД
+    if db.get_bind().dialect.name == "sqlite":
+        modifiers = {"day": (), "week": ("weekday 0", "-6 days"), "month": ("start of month",)}[period]
+        return func.date(column, *modifiers)
+    return cast(func.date_trunc(period, column), Date)
+
+
+def _in_range(statement, date_from: date, date_to: date):
+    # диапазон по deal_date — range scan по ix_deals_deal_date; отменённые сделки не считаются
+    return statement.where(
+        Deal.deal_date >= date_from,
+        Deal.deal_date <= date_to,
+        or_(Deal.status.is_(None), Deal.status.not_in(CANCELLED)),
+    )
+
+
+def sales_by_period(db: Session, date_from: date, date_to: date, period: str = "week") -> list[tuple]:
+    start = _period_start(db, Deal.deal_date, period).label("period_start")
+    statement = _in_range(
+        select(start, func.count(Deal.id), func.coalesce(func.sum(Deal.amount), 0)),
+        date_from, date_to,
+    ).group_by(start).order_by(start)
+    return [tuple(row) for row in db.exec(statement).all()]
+
+
+def properties_by_type(db: Session, date_from: date, date_to: date) -> list[tuple]:
+    """``(type, objects with deals, average sale price)``; the price is ``None`` without sales.
+
+    The average is over objects, not deals: an object's price is the mean of
+    its sales in the range, so an object sold twice is not counted twice.
+    """
+    sale_amount = case((Deal.deal_type == SALE, Deal.amount))
+    per_object = _in_range(
+        select(RealEstate.type.label("type"), RealEstate.id.label("id"), func.avg(sale_amount).label("price"))
+        .join(RealEstate, Deal.real_estate_id == RealEstate.id),
+        date_from, date_to,
+    ).group_by(RealEstate.type, RealEstate.id).subquery()
+    count = func.count(per_object.c.id)
+    statement = (
+        select(per_object.c.type, count, func.avg(per_object.c.price))
+        .group_by(per_object.c.type)
+        .order_by(count.desc())
+    )
+    return [tuple(row) for row in db.exec(statement).all()]
+
+
+def employees_ranking(db: Session, date_from: date, date_to: date, limit: int = 20) -> list[tuple]:
+    revenue = func.coalesce(func.sum(Deal.amount), 0)
+    statement = _in_range(
+        select(User.id, User.full_name, func.count(Deal.id), revenue)
+        .join(User, Deal.employee_id == User.id),
+        date_from, date_to,
+    ).group_by(User.id, User.full_name).order_by(revenue.desc(), func.count(Deal.id).desc()).limit(limit)
+    return [tuple(row) for row in db.exec(statement).all()]
@@ -0,0 +1,162 @@
+import threading
+import time
+from functools import wraps
+from typing import Generic, Iterable, TypeVar
+
+from sqlalchemy import bindparam, delete, func, insert, select
+from sqlmodel import Session, SQLModel
+
+from crud.relations import eager_options
+from crud.writes import insert_returning, update_returning
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+class OperationTimings:
+    """Call count and wall time per repository operation."""
+
+    def __init__(self):
+        self._stats: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, elapsed: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(operation, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                operation: {
+                    "calls": calls,
+                    "total_ms": round(total * 1000, 3),
+                    "avg_ms": round(total * 1000 / calls, 3),
+                    "max_ms": round(longest * 1000, 3),
+                }
+                for operation, (calls, total, longest) in self._stats.items()
+            }
+
+
+def _timed(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.timings.record(method.__name__, time.perf_counter() - started)
+
+    return wrapper
+
+
+# все репозитории по имени таблицы — для /health/crud
+repositories: dict[str, "Repository"] = {}
+
+
+class Repository(Generic[ModelT]):
+    """Data access shared by every table model with a single-column primary key.
+
+    Read and bulk statements are built once per shape with bound parameters and
+    reused: SQLAlchemy memoizes the cache key of a statement object, so a repeat
+    call skips both statement construction and cache-key generation and goes
+    straight to the compiled SQL.
+    """
+
+    def __init__(self, model: type[ModelT]):
+        self.model = model
+        (key_column,) = model.__table__.primary_key.columns
+        self.key_name = key_column.name
+        self.key = getattr(model, key_column.name)
+        self.timings = OperationTimings()
+        self._statements: dict = {}
+        repositories[model.__tablename__] = self
+
+    def _statement(self, shape, build):
+        statement = self._statements.get(shape)
+        if statement is None:
+            statement = self._statements[shape] = build()
+        return statement
+
+    @_timed
+    def get(self, db: Session, key, include=()) -> ModelT | None:
+        return db.get(self.model, key, options=eager_options(self.model, include))
+
+    @_timed
+    def get_many(self, db: Session, keys: Iterable) -> list[ModelT]:
+        """Rows for ``keys`` in one ``IN`` query, in the order asked; missing keys are skipped."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return []
+        statement = self._statement(
+            "get_many", lambda: select(self.model).where(self.key.in_(bindparam("keys", expanding=True)))
+        )
+        found = {getattr(obj, self.key_name): obj for obj in db.scalars(statement, {"keys": keys})}
+        return [found[k] for k in keys if k in found]
+
+    @_timed
+    def get_page(self, db: Session, skip: int = 0, limit: int = 100, after=None, include=()) -> list[ModelT]:
+        # те же запросы, что paginate() без сортировки: keyset по ключу или offset
+        keyset = after is not None
+        statement = self._statement(("page", keyset, tuple(include)), lambda: self._page_statement(keyset, include))
+        params = {"limit": limit, "after": after} if keyset else {"limit": limit, "skip": skip}
+        return db.scalars(statement, params).all()
+
+    def _page_statement(self, keyset: bool, include):
+        statement = select(self.model).options(*eager_options(self.model, include))
+        if keyset:
+            statement = statement.where(self.key > bindparam("after"))
+        else:
+            statement = statement.offset(bindparam("skip"))
+        return statement.order_by(self.key).limit(bindparam("limit"))
+
+    @_timed
+    def get_all(self, db: Session) -> list[ModelT]:
+        """Every row ordered by key — for small lookup tables."""
+        statement = self._statement("all", lambda: select(self.model).order_by(self.key))
+        return db.scalars(statement).all()
+
+    @_timed
+    def count(self, db: Session) -> int:
+        statement = self._statement("count", lambda: select(func.count()).select_from(self.model))
+        return db.scalar(statement)
+
+    @_timed
+    def create(self, db: Session, obj: ModelT) -> ModelT:
+        return insert_returning(db, obj)
+
+    @_timed
+    def create_many(self, db: Session, objs: Iterable[ModelT]) -> list[ModelT]:
+        """One multi-row ``INSERT ... RETURNING`` and one commit for all ``objs``."""
+        values = [obj.model_dump(exclude={self.key_name} if getattr(obj, self.key_name) is None else set()) for obj in objs]
+        if not values:
+            return []
+        created = db.scalars(insert(self.model).returning(self.model), values).all()
+        db.commit()
+        return created
+
+    @_timed
+    def update(self, db: Session, key, update_data: dict) -> ModelT | None:
+        return update_returning(db, self.model, key, update_data)
+
+    @_timed
+    def delete(self, db: Session, key) -> ModelT | None:
+        obj = db.get(self.model, key)
+        if obj:
+            db.delete(obj)
+            db.commit()
+        return obj
+
+    @_timed
+    def delete_many(self, db: Session, keys: Iterable) -> int:
+        """Delete every row in ``keys`` with one statement; returns the number deleted."""
+        keys = list(keys)
+        if not keys:
+            return 0
+        statement = self._statement(
+            "delete_many", lambda: delete(self.model).where(self.key.in_(bindparam("keys", expanding=True)))
+        )
+        deleted = db.execute(statement, {"keys": keys}, execution_options={"synchronize_session": False}).rowcount
+        db.commit()
+        return deleted
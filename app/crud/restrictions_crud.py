@@ -1,33 +1,45 @@
+from datetime import date
+
+from sqlalchemy import or_
 from sqlmodel import Session, select
+from crud.repository import Repository
 from models.restrictions import Restriction
 
-def get_restriction(db: Session, restriction_id: int) -> Restriction | None:
-    return db.get(Restriction, restriction_id)
+repository = Repository(Restriction)
 
-def get_restrictions(db: Session, skip: int = 0, limit: int = 100) -> list[Restriction]:
-    statement = select(Restriction).offset(skip).limit(limit)
-    return db.exec(statement).all()
+def get_restriction(db: Session, restriction_id: int, include=()) -> Restriction | None:
+    return repository.get(db, restriction_id, include=include)
+
+def get_restrictions(db: Session, skip: int = 0, limit: int = 100, after: int | None = None, include=()) -> list[Restriction]:
+    return repository.get_page(db, skip=skip, limit=limit, after=after, include=include)
 
 def create_restriction(db: Session, restriction: Restriction) -> Restriction:
-    db.add(restriction)
-    db.commit()
-    db.refresh(restriction)
-    return restriction
+    return repository.create(db, restriction)
 
 def update_restriction(db: Session, restriction_id: int, update_data: dict) -> Restriction | None:
-    restriction = db.get(Restriction, restriction_id)
-    if restriction:
-        for key, value in update_data.items():
-            if value is not None:
-                setattr(restriction, key, value)
-        db.add(restriction)
-        db.commit()
-        db.refresh(restriction)
-    return restriction
+    return repository.update(db, restriction_id, update_data)
 
 def delete_restriction(db: Session, restriction_id: int) -> Restriction | None:
-    restriction = db.get(Restriction, restriction_id)
-    if restriction:
-        db.delete(restriction)
-        db.commit()
-    return restriction
+    return repository.delete(db, restriction_id)
+
+def active_on(day: date):
+    """Restriction imposed by ``day`` and not removed yet: ``imposed_date <= day < removed_date``."""
+    return (Restriction.imposed_date <= day) & or_(Restriction.removed_date.is_(None), Restriction.removed_date > day)
+
+def get_encumbered_ids(db: Session, real_estate_ids: list[int], day: date) -> set[int]:
+    """Ids among ``real_estate_ids`` with a restriction active on ``day``, in one query.
+
+    Reads only ``ix_restrictions_real_estate_period``: one index range per id,
+    the period columns checked in the index itself.
+    """
+    statement = (
+        select(Restriction.real_estate_id)
+        .where(Restriction.real_estate_id.in_(real_estate_ids), active_on(day))
+        .distinct()
+    )
+    return set(db.exec(statement).all())
+
+def get_restriction_periods(db: Session) -> list[tuple[int, date, date | None]]:
+    """``(real_estate_id, imposed_date, removed_date)`` of every restriction, for ``RestrictionPeriods``."""
+    statement = select(Restriction.real_estate_id, Restriction.imposed_date, Restriction.removed_date)
+    return db.exec(statement).all()
@@ -0,0 +1,76 @@
+from sqlalchemy import func, literal, text
+from sqlmodel import Session, select
+
+from database.search_index import SEARCH_COLUMNS
+from models.clients import Client
+from models.real_estate import RealEstate
+from models.users import User
+
+# FTS-таблица для SQLite по имени таблицы модели
+_FTS_TABLES = {table: fts for table, _, fts in SEARCH_COLUMNS}
+
+# вид результата -> (модель, колонка, FTS-таблица для SQLite)
+SEARCH_TARGETS = {
+    kind: (model, column, _FTS_TABLES[model.__tablename__])
+    for kind, model, column in (
+        ("properties", RealEstate, RealEstate.address),
+        ("clients", Client, Client.full_name),
+        ("employees", User, User.full_name),
+    )
+}
+
+
+def contains(column, q: str):
+    """Case-insensitive substring match; ``%``, ``_`` and ``\\`` in ``q`` are literal."""
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+
+def _trigrams(q: str) -> list[str]:
+    q = " ".join(q.lower().split())
+    return sorted({q[i:i + 3] for i in range(len(q) - 2)})
+
+
+def _search_postgres(db: Session, model, column, q: str, limit: int) -> list[tuple[int, str, float]]:
+    # word_similarity + оператор <% используют GIN-индекс gin_trgm_ops и терпят опечатки
+    score = func.word_similarity(q, column)
+    statement = (
+        select(model.id, column, score.label("score"))
+        .where(literal(q).op("<%")(column) | contains(column, q))
+        .order_by(score.desc(), model.id)
+        .limit(limit)
+    )
+    return [tuple(row) for row in db.exec(statement).all()]
+
+
+def _search_sqlite(db: Session, model, column, fts: str, q: str, limit: int) -> list[tuple[int, str, float]]:
+    table = model.__tablename__
+    trigrams = _trigrams(q)
+    if not trigrams:
+        # короче триграммы FTS5 не ищет — для 1–2 символов хватит LIKE
+        statement = select(model.id, column, literal(0.0)).where(contains(column, q)).order_by(model.id).limit(limit)
+        return [tuple(row) for row in db.exec(statement).all()]
+    # OR по триграммам запроса: опечатка выбивает лишь часть триграмм, bm25 ранжирует по совпавшим
+    match = " OR ".join('"' + t.replace('"', '""') + '"' for t in trigrams)
+    statement = text(
+        f"SELECT t.id, t.{column.key}, -bm25({fts}) AS score "
+        f"FROM {fts} JOIN {table} AS t ON t.id = {fts}.rowid "
+        f"WHERE {fts} MATCH :match ORDER BY rank LIMIT :limit"
+    )
+    rows = db.execute(statement, {"match": match, "limit": limit}).all()
+    return [tuple(row) for row in rows]
+
+
+def search(db: Session, q: str, kinds: list[str], limit: int = 10) -> dict[str, list[tuple[int, str, float]]]:
+    dialect = db.get_bind().dialect.name
+    results = {}
+    for kind in kinds:
+        model, column, fts = SEARCH_TARGETS[kind]
+        if dialect == "postgresql":
+            results[kind] = _search_postgres(db, model, column, q, limit)
+        elif dialect == "sqlite":
+            results[kind] = _search_sqlite(db, model, column, fts, q, limit)
+        else:
+            statement = select(model.id, column, literal(0.0)).where(contains(column, q)).order_by(model.id).limit(limit)
+            results[kind] = [tuple(row) for row in db.exec(statement).all()]
+    return results
@@ -0,0 +1,70 @@
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel
+
+_UNIQUE_VIOLATION = "23505"
+
+
+def insert_returning(db: Session, obj: SQLModel):
+    """``INSERT ... RETURNING`` for ``obj`` in one statement, then commit.
+
+    Uniqueness is left to the database: an ``IntegrityError`` is re-raised
+    after the rollback, see :func:`unique_violation`.
+    """
+    model = type(obj)
+    primary_key = {column.name for column in model.__table__.primary_key.columns}
+    values = {key: value for key, value in obj.model_dump().items() if not (key in primary_key and value is None)}
+    try:
+        created = db.scalars(insert(model).values(**values).returning(model)).one()
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+    return created
+
+
+def unique_violation(exc: IntegrityError, model) -> str | None:
+    """Column of ``model`` whose unique or primary key constraint ``exc`` reports.
+
+    Matches the messages of SQLite (``UNIQUE constraint failed: clients.email``)
+    and Postgres (``clients_email_key`` / ``Key (email)=...``, ``*_pkey``).
+    ``None`` for any other integrity error (NOT NULL, foreign key, CHECK).
+    """
+    message = str(exc.orig)
+    # у драйверов Postgres — SQLSTATE (asyncpg/psycopg 3: sqlstate, psycopg2: pgcode), у SQLite — только текст
+    sqlstate = getattr(exc.orig, "sqlstate", None) or getattr(exc.orig, "pgcode", None)
+    if sqlstate is not None:
+        if sqlstate != _UNIQUE_VIOLATION:
+            return None
+    elif not message.startswith("UNIQUE constraint failed:"):
+        # "NOT NULL constraint failed: clients.phone" несёт тот же маркер таблица.колонка
+        return None
+    table = model.__table__
+    for column in table.columns:
+        if not (column.unique or column.primary_key):
+            continue
+        markers = [f"{table.name}.{column.name}", f"{table.name}_{column.name}_key", f"({column.name})"]
+        if column.primary_key:
+            markers.append(f"{table.name}_pkey")
+        if any(marker in message for marker in markers):
+            return column.name
+    return None
+
+
+def update_returning(db: Session, model, key, update_data: dict):
+    """``UPDATE ... WHERE <pk> = :key RETURNING *`` with only the given columns, then commit.
+
+    ``None`` values are skipped (PATCH semantics); returns ``None`` when no row matches.
+    """
+    values = {column: value for column, value in update_data.items() if value is not None}
+    if not values:
+        return db.get(model, key)
+    (key_column,) = model.__table__.primary_key.columns
+    statement = update(model).where(key_column == key).values(**values).returning(model)
+    try:
+        updated = db.scalars(statement).one_or_none()
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+    return updated
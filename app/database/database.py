@@ -1,16 +1,53 @@
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine
 import os
 from dotenv import load_dotenv
 
+from database.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    attach_stats,
+    pool_options,
+)
+from database.search_index import create_search_indexes
+import database.table_versions  # noqa: F401  регистрирует слушателей сессии
+
 load_dotenv()
 
+# sync-драйвер -> async-драйвер для того же URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend in ASYNC_DRIVERS:
+        url = url.set(drivername=ASYNC_DRIVERS[backend])
+    return url.render_as_string(hide_password=False)
+
+
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **pool_options(InstrumentedQueuePool))
+async_engine = create_async_engine(
+    async_database_url(SQLALCHEMY_DATABASE_URL), **pool_options(InstrumentedAsyncAdaptedQueuePool)
+)
+attach_stats(engine, "sync")
+attach_stats(async_engine.sync_engine, "async")
 
 def get_db():
     with Session(engine) as session:
         yield session
 
+async def get_async_db():
+    # expire_on_commit=False: после коммита объекты отдаются в ответ без повторной загрузки
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
 def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
\ No newline at end of file
+    SQLModel.metadata.create_all(engine)
+    create_search_indexes(engine)
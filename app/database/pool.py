@@ -0,0 +1,141 @@
+import logging
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from core.config import settings
+
+logger = logging.getLogger("database.pool")
+
+# ключи ConnectionPoolEntry.info: когда начато и сколько заняло открытие соединения
+_CONNECT_STARTED = "pool_stats_connect_started"
+_CONNECT_TIME = "pool_stats_connect_time"
+
+
+class PoolStats:
+    """Checkout counters for one engine's pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, waited: float, overflow: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            if overflow:
+                self.overflow_checkouts += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+
+class _InstrumentedPoolMixin:
+    """Checkout timing around the public ``Pool.connect()``.
+
+    No pool event fires when a checkout starts waiting, so ``connect()`` is
+    timed here; the ``do_connect``/``connect`` listeners installed by
+    ``attach_stats`` measure the time spent opening a new DBAPI connection,
+    which is subtracted: the wait counts only time blocked on the pool.
+    """
+
+    stats: PoolStats
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record_timeout()
+            logger.error(
+                "pool %s exhausted: timed out after %.0f ms (size=%d, overflow=%d)",
+                self.stats.name, (time.perf_counter() - started) * 1000, self.size(), max(self.overflow(), 0),
+            )
+            raise
+        connect_time = connection.info.pop(_CONNECT_TIME, None)
+        waited = max(time.perf_counter() - started - (connect_time or 0.0), 0.0)
+        # новое соединение сверх pool_size — overflow
+        overflow = connect_time is not None and self.overflow() > 0
+        self.stats.record(waited, overflow)
+        if overflow:
+            logger.info("pool %s overflow connection opened (overflow=%d)", self.stats.name, self.overflow())
+        if waited * 1000 >= settings.db_pool_slow_checkout_ms:
+            logger.warning(
+                "pool %s slow checkout: waited %.1f ms (checked out=%d)",
+                self.stats.name, waited * 1000, self.checkedout(),
+            )
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def snapshot(self) -> dict:
+        stats = self.stats
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": stats.checkouts,
+            "overflow_checkouts": stats.overflow_checkouts,
+            "timeouts": stats.timeouts,
+            "wait_ms_total": round(stats.wait_total * 1000, 3),
+            "wait_ms_avg": round(stats.wait_total * 1000 / stats.checkouts, 3) if stats.checkouts else 0.0,
+            "wait_ms_max": round(stats.wait_max * 1000, 3),
+        }
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(poolclass) -> dict:
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def _connect_started(dialect, connection_record, cargs, cparams):
+    if connection_record is not None:
+        connection_record.info[_CONNECT_STARTED] = time.perf_counter()
+
+
+def _connected(dbapi_connection, connection_record):
+    started = connection_record.info.pop(_CONNECT_STARTED, None)
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        connection_record.info[_CONNECT_TIME] = connection_record.info.get(_CONNECT_TIME, 0.0) + elapsed
+
+
+def attach_stats(engine, name: str) -> None:
+    engine.pool.stats = PoolStats(name)
+    # слушатели на engine переживают пересоздание пула (dispose)
+    event.listen(engine, "do_connect", _connect_started)
+    event.listen(engine, "connect", _connected)
+
+
+def pool_snapshot(engine) -> dict:
+    pool = engine.pool
+    if isinstance(pool, _InstrumentedPoolMixin):
+        return pool.snapshot()
+    return {"status": pool.status()}
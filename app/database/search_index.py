@@ -0,0 +1,59 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+# (таблица, колонка, имя индекса) — всё, что ищет GET /search
+SEARCH_COLUMNS = [
+    ("real_estate_objects", "address", "real_estate_fts"),
+    ("clients", "full_name", "clients_fts"),
+    ("users", "full_name", "users_fts"),
+]
+
+
+def is_search_object(name: str, type_: str) -> bool:
+    """Search index objects that live outside ``SQLModel.metadata``.
+
+    The Postgres trigram indexes come from migration d842db0f7d00 and the
+    SQLite FTS5 tables (with their shadow tables) from ``create_search_indexes``;
+    autogenerate must neither drop nor recreate them.
+    """
+    if type_ == "index":
+        return any(name == f"ix_{table}_{column}_trgm" for table, column, _ in SEARCH_COLUMNS)
+    if type_ == "table":
+        return any(name == fts or name.startswith(f"{fts}_") for _, _, fts in SEARCH_COLUMNS)
+    return False
+
+
+def _create_sqlite(conn: Connection) -> None:
+    # FTS5 external-content таблицы с trigram-токенизатором, синхронизируются триггерами
+    for table, column, fts in SEARCH_COLUMNS:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": fts},
+        ).first()
+        if exists:
+            continue
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5("
+            f"{column}, content='{table}', content_rowid='id', tokenize='trigram')"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column} ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+            f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END"
+        ))
+        conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def create_search_indexes(engine: Engine) -> None:
+    # на Postgres trigram-индексы строит только миграция d842db0f7d00 (CONCURRENTLY), не старт приложения
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            _create_sqlite(conn)
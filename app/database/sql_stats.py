@@ -0,0 +1,57 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class SqlStats:
+    """Statements executed on behalf of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        # одна и та же форма запроса много раз за запрос — вероятно, N+1
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+# статистика текущего HTTP-запроса; контекст переходит и в greenlet run_sync, и в threadpool
+current_stats: ContextVar[Optional[SqlStats]] = ContextVar("current_sql_stats", default=None)
+
+_STARTED = "sql_stats_started"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_stats.get() is not None:
+        conn.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_stats.get()
+    started = conn.info.get(_STARTED)
+    if stats is None or not started:
+        return
+    stats.count += 1
+    stats.duration += time.perf_counter() - started.pop()
+    stats.shapes[statement] += 1
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute не придёт: снимаем отметку, иначе время уедет к следующему запросу
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_STARTED):
+        conn.info[_STARTED].pop()
+
+
+def instrument(*engines: Engine) -> None:
+    """Attach the statement counters; only called when ``settings.sql_instrumentation`` is on."""
+    for engine in engines:
+        if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+            event.listen(engine, "handle_error", _handle_error)
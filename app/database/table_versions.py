@@ -0,0 +1,77 @@
+import threading
+import time
+from collections import defaultdict
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_WRITTEN = "written_tables"
+
+
+class TableVersions:
+    """Per-process counters bumped whenever a session commits writes to a table."""
+
+    def __init__(self):
+        self._versions = defaultdict(int)
+        self._modified: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def bump(self, *tables: str) -> None:
+        now = time.time()
+        with self._lock:
+            for table in tables:
+                self._versions[table] += 1
+                self._modified[table] = now
+
+    def get(self, table: str) -> int:
+        return self._versions[table]
+
+    def token(self, tables) -> tuple[int, ...]:
+        return tuple(self._versions[table] for table in tables)
+
+    def last_modified(self, tables) -> float:
+        """Wall time of the latest commit to any of ``tables`` in this process (0 if none)."""
+        return max((self._modified.get(table, 0.0) for table in tables), default=0.0)
+
+
+table_versions = TableVersions()
+
+
+def _written(session: Session) -> set:
+    return session.info.setdefault(_WRITTEN, set())
+
+
+def mark_written(session: Session, *tables: str) -> None:
+    """Record writes that bypass the ORM (e.g. ``COPY``) so the commit bumps their versions."""
+    _written(session).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    tables = _written(session)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            tables.add(table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tables(orm_execute_state):
+    # insert()/update()/delete() через session.execute минуют flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _written(orm_execute_state.session).add(mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session):
+    tables = session.info.pop(_WRITTEN, None)
+    if tables:
+        table_versions.bump(*tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_tables(session):
+    session.info.pop(_WRITTEN, None)
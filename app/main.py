@@ -1,11 +1,22 @@
 from fastapi import FastAPI
-from database.database import create_db_and_tables
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from database.database import async_engine, create_db_and_tables, engine
+from database.pool import pool_snapshot
+from database.sql_stats import instrument
+from crud.repository import repositories
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
+from api.compression import CompressionMiddleware
 from api.endpoints import all_routers
+from api.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, render as render_metrics
+from api.sql_timing import SqlTimingMiddleware
+from core.config import settings
+from core.security import signing_key
+from api.pagination import NEXT_CURSOR_HEADER
 
-app = FastAPI(title="Estate Agency", version="1.0.0")
+# ответы, собранные FastAPI по response_model, кодируются orjson
+app = FastAPI(title="Estate Agency", version="1.0.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -13,24 +24,59 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
+app.add_middleware(CompressionMiddleware)
+if settings.sql_instrumentation:
+    instrument(engine, async_engine.sync_engine)
+    app.add_middleware(SqlTimingMiddleware)
+# последним — самый внешний: время запроса включает все остальные слои
+app.add_middleware(MetricsMiddleware)
 
 @app.on_event("startup")
 def on_startup():
+    # без AUTH_SECRET_KEY (и не в dev-режиме) воркер не стартует
+    signing_key()
     create_db_and_tables()
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    # закрыть соединения пула (у aiosqlite это ещё и рабочие потоки)
+    await async_engine.dispose()
+
 
 for router in all_routers:
     app.include_router(router)
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Welcome to My FastAPI App!"}
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "healthy"}
 
+@app.get("/health/pool")
+async def pool_health():
+    # занятые соединения, ожидание пула и overflow — для подбора числа воркеров
+    return {
+        "sync": pool_snapshot(engine),
+        "async": pool_snapshot(async_engine.sync_engine),
+    }
+
+@app.get("/health/crud")
+async def crud_health():
+    # число вызовов и время операций репозиториев по таблицам
+    return {table: repository.timings.snapshot() for table, repository in repositories.items()}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    # формат Prometheus: запросы и задержки по маршрутам, пул соединений, попадания в кеши
+    return PlainTextResponse(
+        render_metrics({"sync": engine, "async": async_engine.sync_engine}),
+        media_type=METRICS_CONTENT_TYPE,
+    )
+
 if __name__ == "__main__":
     uvicorn.run("main:app", reload=True)
     
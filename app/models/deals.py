@@ -9,17 +9,20 @@ if TYPE_CHECKING:
     from models.users import User
 
 
-class Deal(SQLModel, table=True):
+class DealBase(SQLModel):
+    deal_type: str = Field(nullable=False)
+    real_estate_id: int = Field(foreign_key="real_estate_objects.id", nullable=False, index=True)
+    client_id: int = Field(foreign_key="clients.id", nullable=False, index=True)
+    employee_id: int = Field(foreign_key="users.id", nullable=False, index=True)
+    deal_date: date = Field(nullable=False, index=True)
+    amount: Decimal = Field(nullable=False)
+    status: Optional[str] = Field(default=None, index=True)
+
+
+class Deal(DealBase, table=True):
     __tablename__ = "deals"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    deal_type: str = Field(nullable=False)
-    real_estate_id: int = Field(foreign_key="real_estate_objects.id", nullable=False)
-    client_id: int = Field(foreign_key="clients.id", nullable=False)
-    employee_id: int = Field(foreign_key="users.id", nullable=False)
-    deal_date: date = Field(nullable=False)
-    amount: Decimal = Field(nullable=False)
-    status: Optional[str] = Field(default=None)
 
     # ORM relationships
     real_estate: Optional["RealEstate"] = Relationship(back_populates="deals")
@@ -28,3 +31,7 @@ class Deal(SQLModel, table=True):
 
     class Config:
         arbitrary_types_allowed = True
+
+
+class DealRead(DealBase):
+    id: int
@@ -0,0 +1,51 @@
+from typing import List, Optional
+
+from models.clients import ClientRead
+from models.deals import DealRead
+from models.ownership import OwnershipRead
+from models.ownership_types import OwnershipTypeRead
+from models.real_estate import RealEstateRead
+from models.restriction_types import RestrictionTypeRead
+from models.restrictions import RestrictionRead
+from models.users import UserRead
+
+# Ответы с `include=`: связи попадают в ответ, только если их запросили.
+# rows_response/row_response сериализуют ORM-строку без валидации и пишут лишь
+# загруженные атрибуты, а незапрошенные связи не загружены — их нет в JSON.
+
+class DealExpanded(DealRead):
+    client: Optional[ClientRead] = None
+    real_estate: Optional[RealEstateRead] = None
+    employee: Optional[UserRead] = None
+
+class OwnershipExpanded(OwnershipRead):
+    real_estate: Optional[RealEstateRead] = None
+    owner: Optional[ClientRead] = None
+    ownership_type: Optional[OwnershipTypeRead] = None
+
+class RestrictionExpanded(RestrictionRead):
+    real_estate: Optional[RealEstateRead] = None
+    restriction_type: Optional[RestrictionTypeRead] = None
+
+class RealEstateExpanded(RealEstateRead):
+    ownerships: Optional[List[OwnershipRead]] = None
+    restrictions: Optional[List[RestrictionRead]] = None
+    deals: Optional[List[DealRead]] = None
+
+# Карточка объекта (/real_estate/{id}/dossier): весь граф загружен всегда.
+
+class DossierOwnership(OwnershipRead):
+    owner: ClientRead
+    ownership_type: OwnershipTypeRead
+
+class DossierRestriction(RestrictionRead):
+    restriction_type: RestrictionTypeRead
+
+class DossierDeal(DealRead):
+    client: ClientRead
+    employee: UserRead
+
+class RealEstateDossier(RealEstateRead):
+    ownerships: List[DossierOwnership]
+    restrictions: List[DossierRestriction]
+    deals: List[DossierDeal]
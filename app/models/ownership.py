@@ -7,16 +7,18 @@ if TYPE_CHECKING:
     from models.ownership_types import OwnershipType
     from models.clients import Client
 
-class Ownership(SQLModel, table=True):
-    __tablename__ = "ownership"
-
-    id: Optional[int] = Field(default=None, primary_key=True)
-    real_estate_id: int = Field(foreign_key="real_estate_objects.id", nullable=False)
+class OwnershipBase(SQLModel):
+    real_estate_id: int = Field(foreign_key="real_estate_objects.id", nullable=False, index=True)
     ownership_type_code: str = Field(foreign_key="ownership_types.code", nullable=False)
-    owner_id: int = Field(foreign_key="clients.id", nullable=False)
+    owner_id: int = Field(foreign_key="clients.id", nullable=False, index=True)
     registration_date: date = Field(nullable=False)
     document_reference: Optional[str] = Field(default=None)
 
+class Ownership(OwnershipBase, table=True):
+    __tablename__ = "ownership"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
     # ORM Relationships
     real_estate: Optional["RealEstate"] = Relationship(back_populates="ownerships")
     ownership_type: Optional["OwnershipType"] = Relationship(back_populates="ownerships")
@@ -24,3 +26,6 @@ class Ownership(SQLModel, table=True):
 
     class Config:
         arbitrary_types_allowed = True
+
+class OwnershipRead(OwnershipBase):
+    id: int
@@ -4,14 +4,18 @@ from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from models.ownership import Ownership
 
-class OwnershipType(SQLModel, table=True):
-    __tablename__ = "ownership_types"
-
+class OwnershipTypeBase(SQLModel):
     code: str = Field(primary_key=True, max_length=50, description="Код вида права собственности")
     name: str = Field(nullable=False, unique=True, max_length=150, description="Наименование вида права")
     description: Optional[str] = Field(default=None, description="Описание вида права")
+
+class OwnershipType(OwnershipTypeBase, table=True):
+    __tablename__ = "ownership_types"
     
     ownerships: list["Ownership"] = Relationship(back_populates="ownership_type")
 
     class Config:
         arbitrary_types_allowed = True
+
+class OwnershipTypeRead(OwnershipTypeBase):
+    pass
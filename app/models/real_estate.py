@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -6,18 +7,25 @@ if TYPE_CHECKING:
     from models.restrictions import Restriction
     from models.deals import Deal
 
-class RealEstate(SQLModel, table=True):
-    __tablename__ = "real_estate_objects"
-
-    id: Optional[int] = Field(default=None, primary_key=True)
-    type: str = Field(nullable=False, max_length=100, description="Тип недвижимости")
+class RealEstateBase(SQLModel):
+    type: str = Field(nullable=False, max_length=100, index=True, description="Тип недвижимости")
     address: str = Field(nullable=False, max_length=200, description="Адрес объекта")
-    area: float = Field(nullable=False, description="Площадь в квадратных метрах")
-    rooms: Optional[int] = Field(default=None, description="Количество комнат")
-    floor: Optional[int] = Field(default=None, description="Этаж")
-    price: Optional[float] = Field(default=None, description="Стоимость объекта")
+    area: float = Field(nullable=False, index=True, description="Площадь в квадратных метрах")
+    rooms: Optional[int] = Field(default=None, index=True, description="Количество комнат")
+    floor: Optional[int] = Field(default=None, index=True, description="Этаж")
+    price: Optional[float] = Field(default=None, index=True, description="Стоимость объекта")
     description: Optional[str] = Field(default=None, description="Описание объекта")
     status: Optional[str] = Field(default=None, description="Статус объекта (например, доступен, продан)")
+
+class RealEstate(RealEstateBase, table=True):
+    __tablename__ = "real_estate_objects"
+    __table_args__ = (
+        # фильтр по статусу и типу с сортировкой по цене (список объектов);
+        # он же обслуживает фильтр по одному статусу — отдельный индекс по status не нужен
+        Index("ix_real_estate_objects_status_type_price", "status", "type", "price"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
     
     ownerships: list["Ownership"] = Relationship(back_populates="real_estate")
     restrictions: list["Restriction"] = Relationship(back_populates="real_estate")
@@ -26,3 +34,6 @@ class RealEstate(SQLModel, table=True):
 
     class Config:
         arbitrary_types_allowed = True
+
+class RealEstateRead(RealEstateBase):
+    id: int
@@ -5,14 +5,18 @@ from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from models.restrictions import Restriction
 
-class RestrictionType(SQLModel, table=True):
-    __tablename__ = "restriction_types"
-
+class RestrictionTypeBase(SQLModel):
     code: str = Field(primary_key=True, max_length=50, description="Код ограничения прав собственности")
     name: str = Field(nullable=False, unique=True, max_length=150, description="Наименование ограничения")
     description: Optional[str] = Field(default=None, description="Описание ограничения")
 
+class RestrictionType(RestrictionTypeBase, table=True):
+    __tablename__ = "restriction_types"
+
     restrictions: list["Restriction"] = Relationship(back_populates="restriction_type")
 
     class Config:
         arbitrary_types_allowed = True
+
+class RestrictionTypeRead(RestrictionTypeBase):
+    pass
@@ -0,0 +1,126 @@
+"""Sync vs async endpoint throughput on the same slow-DB workload.
+
+Every request runs ``SELECT sleep(latency)`` (``pg_sleep`` on Postgres) and
+then reads one page of ``real_estate_objects``. The sync app goes through
+``get_db`` and the threadpool, the async app through ``get_async_db`` and the
+async CRUD facade, exactly like the real routers.
+
+    python benchmarks/bench_async.py --requests 400 --concurrency 100 --latency 0.05
+
+Without ``DATABASE_URL`` a temporary SQLite file is used; SQLite gets a
+``sleep()`` SQL function that blocks the driver thread, which is how a slow
+database looks to each stack. Both stacks share the engines' connection pools,
+so once concurrency exceeds the pool size the pool, not the stack, is the limit;
+raise ``DB_POOL_SIZE`` above the threadpool size (40) to compare the stacks.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_async.db"
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+import crud.real_estate_crud as sync_real_estate_crud  # noqa: E402
+from crud.aio import real_estate_crud  # noqa: E402
+from database.database import async_engine, create_db_and_tables, engine, get_async_db, get_db  # noqa: E402
+from models.real_estate import RealEstate  # noqa: E402
+
+
+def _install_sleep(target_engine) -> None:
+    @event.listens_for(target_engine, "connect")
+    def _register(dbapi_connection, connection_record):
+        dbapi_connection.create_function("sleep", 1, lambda seconds: time.sleep(seconds) or 0)
+
+
+def sleep_sql(dialect: str) -> str:
+    return "SELECT pg_sleep(:s)" if dialect == "postgresql" else "SELECT sleep(:s)"
+
+
+def build_apps(latency: float) -> tuple[FastAPI, FastAPI]:
+    statement = text(sleep_sql(engine.dialect.name))
+    sync_app, async_app = FastAPI(), FastAPI()
+
+    @sync_app.get("/real_estate/")
+    def sync_list(db: Session = Depends(get_db)):
+        db.connection().execute(statement, {"s": latency})
+        return sync_real_estate_crud.get_real_estates(db, limit=20)
+
+    @async_app.get("/real_estate/")
+    async def async_list(db: AsyncSession = Depends(get_async_db)):
+        await (await db.connection()).execute(statement, {"s": latency})
+        return await real_estate_crud.get_real_estates(db, limit=20)
+
+    return sync_app, async_app
+
+
+def seed(rows: int = 200) -> None:
+    create_db_and_tables()
+    with Session(engine) as session:
+        if session.get(RealEstate, 1) is None:
+            session.add_all(
+                RealEstate(type="flat", address=f"Бенчмарк, {i}", area=30 + i % 70, price=1_000_000 + i)
+                for i in range(rows)
+            )
+            session.commit()
+
+
+async def run(app: FastAPI, requests: int, concurrency: int, dispose: bool = False) -> dict:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # первый коннект (инициализация диалекта) — вне замера и не конкурентно
+        (await client.get("/real_estate/")).raise_for_status()
+
+        async def one():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get("/real_estate/")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    if dispose:
+        await async_engine.dispose()
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated DB time per request, seconds")
+    args = parser.parse_args()
+
+    if engine.dialect.name == "sqlite":
+        _install_sleep(engine)
+        _install_sleep(async_engine.sync_engine)
+    seed()
+    sync_app, async_app = build_apps(args.latency)
+    for name, app in (("sync", sync_app), ("async", async_app)):
+        result = asyncio.run(run(app, args.requests, args.concurrency, dispose=app is async_app))
+        print(f"{name:>5}: {result['rps']:8.1f} req/s  p50 {result['p50_ms']:7.1f} ms  p95 {result['p95_ms']:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Login throughput and per-request cost of token authentication.
+
+Logins run scrypt in the threadpool, so while they are in flight the event
+loop keeps serving other requests; the benchmark measures ``/health``
+latency during a burst of logins to show that. Token verification is timed
+with a cold and a warm claims cache, and ``/auth/me`` is compared with an
+unauthenticated endpoint.
+
+    python benchmarks/bench_auth.py --logins 200 --concurrency 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_auth.db"
+# токены выпускает и проверяет один процесс: случайного ключа достаточно
+os.environ.setdefault("AUTH_DEV_MODE", "1")
+
+import httpx  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from core.security import _verified_claims, create_token, decode_token, hash_password  # noqa: E402
+from database.database import async_engine, create_db_and_tables, engine  # noqa: E402
+from main import app  # noqa: E402
+from models.users import User  # noqa: E402
+
+
+def seed() -> None:
+    create_db_and_tables()
+    with Session(engine) as session:
+        if session.get(User, 1) is None:
+            session.add(User(login="bench", full_name="Бенчмарк", password=hash_password("secret")))
+            session.commit()
+
+
+async def logins(client: httpx.AsyncClient, total: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    probe_latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def one():
+        async with semaphore:
+            response = await client.post("/auth/login", json={"login": "bench", "password": "secret"})
+            response.raise_for_status()
+
+    async def probe():
+        # лёгкий запрос параллельно логинам: цикл событий не должен стоять
+        while not done.is_set():
+            started = time.perf_counter()
+            (await client.get("/health")).raise_for_status()
+            probe_latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0.005)
+
+    prober = asyncio.create_task(probe())
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await prober
+    return {
+        "rps": total / elapsed,
+        "probe_p50_ms": statistics.median(probe_latencies) * 1000,
+        "probe_max_ms": max(probe_latencies) * 1000,
+    }
+
+
+async def request_overhead(client: httpx.AsyncClient, requests: int) -> dict:
+    token = create_token({"sub": "1", "login": "bench", "role": None})
+    headers = {"Authorization": f"Bearer {token}"}
+    # несколько чередующихся раундов, берём лучший — так меньше шума от планировщика
+    result = {"/health": float("inf"), "/auth/me": float("inf")}
+    for _ in range(5):
+        for name, kwargs in (("/health", {}), ("/auth/me", {"headers": headers})):
+            started = time.perf_counter()
+            for _ in range(requests):
+                (await client.get(name, **kwargs)).raise_for_status()
+            result[name] = min(result[name], (time.perf_counter() - started) / requests * 1e6)
+    return result
+
+
+def decode_cost(calls: int) -> dict:
+    token = create_token({"sub": "1", "login": "bench", "role": None})
+    started = time.perf_counter()
+    for _ in range(calls):
+        _verified_claims.cache_clear()
+        decode_token(token)
+    cold = (time.perf_counter() - started) / calls * 1e6
+    decode_token(token)
+    started = time.perf_counter()
+    for _ in range(calls):
+        decode_token(token)
+    warm = (time.perf_counter() - started) / calls * 1e6
+    return {"cold_us": cold, "warm_us": warm}
+
+
+async def run(args) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # первый коннект (инициализация диалекта) — вне замера
+        (await client.post("/auth/login", json={"login": "bench", "password": "secret"})).raise_for_status()
+        result = await logins(client, args.logins, args.concurrency)
+        print(
+            f"login: {result['rps']:7.1f} req/s; /health during logins "
+            f"p50 {result['probe_p50_ms']:.1f} ms, max {result['probe_max_ms']:.1f} ms"
+        )
+        overhead = await request_overhead(client, args.requests)
+        print(
+            f"per request: /health {overhead['/health']:.0f} µs, /auth/me {overhead['/auth/me']:.0f} µs "
+            f"(+{overhead['/auth/me'] - overhead['/health']:.0f} µs for auth)"
+        )
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    seed()
+    asyncio.run(run(args))
+    cost = decode_cost(20000)
+    print(f"decode_token: {cost['cold_us']:.1f} µs cold (HMAC + JSON), {cost['warm_us']:.2f} µs cached")
+
+
+if __name__ == "__main__":
+    main()
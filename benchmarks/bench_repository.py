@@ -0,0 +1,82 @@
+"""Per-call overhead of Repository cached statements vs building select() per call.
+
+Each pair runs the same query against the same session: once the way the crud
+modules used to build it (a fresh ``select()`` on every call), once through
+``crud.repository.Repository``. The table is small and SQLite is local, so the
+difference is mostly Python-side statement construction and cache-key work.
+
+    python benchmarks/bench_repository.py --calls 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_repository.db"
+
+from sqlalchemy import func  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+
+import api.endpoints  # noqa: E402,F401  все модели для create_all
+from crud.pagination import paginate  # noqa: E402
+from crud.repository import Repository  # noqa: E402
+from database.database import create_db_and_tables, engine  # noqa: E402
+from models.clients import Client  # noqa: E402
+
+
+def seed(session: Session, rows: int = 200) -> None:
+    if session.get(Client, 1) is None:
+        session.add_all(Client(full_name=f"Клиент {i}", phone=f"+7000{i:06d}") for i in range(rows))
+        session.commit()
+
+
+def per_call_us(fn, calls: int) -> float:
+    for _ in range(min(calls, 100)):
+        fn()
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    create_db_and_tables()
+    repository = Repository(Client)
+    ids = [3, 17, 42, 99, 150]
+    with Session(engine) as db:
+        seed(db)
+        cases = {
+            "page (keyset)": (
+                lambda: db.exec(paginate(select(Client), Client.id, limit=20, after=100)).all(),
+                lambda: repository.get_page(db, limit=20, after=100),
+            ),
+            "page (offset)": (
+                lambda: db.exec(paginate(select(Client), Client.id, skip=40, limit=20)).all(),
+                lambda: repository.get_page(db, skip=40, limit=20),
+            ),
+            "get_many": (
+                lambda: db.exec(select(Client).where(Client.id.in_(ids))).all(),
+                lambda: repository.get_many(db, ids),
+            ),
+            "count": (
+                lambda: db.exec(select(func.count()).select_from(Client)).one(),
+                lambda: repository.count(db),
+            ),
+        }
+        print(f"{'operation':<15} {'select() µs':>12} {'repository µs':>14} {'speedup':>8}")
+        for name, (built, cached) in cases.items():
+            before, after = per_call_us(built, args.calls), per_call_us(cached, args.calls)
+            print(f"{name:<15} {before:12.1f} {after:14.1f} {before / after:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
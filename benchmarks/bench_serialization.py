@@ -0,0 +1,122 @@
+"""Serialization cost of a 1,000-row list response, before and after the fast path.
+
+"before" is what FastAPI does with ``response_model=List[Model]``: dump each
+row, validate it again into the response model, serialize it and encode the
+result with the standard ``json`` encoder (``JSONResponse``). "after" is
+``api.responses.rows_response`` with the read schema. Rows are loaded from the
+database once, so only serialization is timed.
+
+    python benchmarks/bench_serialization.py --rows 1000
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/bench_serialization.db"
+
+from fastapi import Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+
+import api.endpoints  # noqa: E402,F401  все модели для create_all
+from api.responses import rows_response  # noqa: E402
+from crud.relations import eager_options  # noqa: E402
+from database.database import create_db_and_tables, engine  # noqa: E402
+from models.clients import Client  # noqa: E402
+from models.deals import Deal  # noqa: E402
+from models.expanded import DealExpanded  # noqa: E402
+from models.real_estate import RealEstate, RealEstateRead  # noqa: E402
+from models.users import User  # noqa: E402
+
+
+def seed(session: Session, rows: int) -> None:
+    if session.get(RealEstate, 1) is not None:
+        return
+    session.add(User(login="bench", full_name="Бенчмарк", password="x"))
+    session.add_all(Client(full_name=f"Клиент {i}", phone=f"+7000{i:06d}") for i in range(rows))
+    session.add_all(
+        RealEstate(type="flat", address=f"ул. Ленина, {i}", area=30 + i % 70, rooms=1 + i % 4, floor=i % 20, price=1e6 + i, status="available")
+        for i in range(rows)
+    )
+    session.flush()
+    session.add_all(
+        Deal(deal_type="sale", real_estate_id=i + 1, client_id=i + 1, employee_id=1, deal_date=datetime.date(2024, 1, 1), amount=Decimal("1000000.50"), status="active")
+        for i in range(rows)
+    )
+    session.commit()
+
+
+def per_call_ms(fn, calls: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1000
+
+
+def fastapi_path(rows, response_model, include=()):
+    # как раньше: expand() в dict, затем валидация response_model, затем json
+    field = create_response_field(name="response", type_=response_model)
+    loop = asyncio.new_event_loop()
+
+    def render():
+        content = [_as_dict(row, include) for row in rows] if include else rows
+        value = loop.run_until_complete(serialize_response(field=field, response_content=content, exclude_unset=bool(include), is_coroutine=True))
+        return JSONResponse(value).body
+
+    return render
+
+
+def _as_dict(obj, include) -> dict:
+    data = obj.model_dump()
+    for name in include:
+        value = getattr(obj, name)
+        data[name] = value.model_dump() if value is not None else None
+    return data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+
+    create_db_and_tables()
+    include = ("client", "employee")
+    with Session(engine) as db:
+        seed(db, args.rows)
+        real_estates = db.exec(select(RealEstate).limit(args.rows)).all()
+        deals = db.exec(select(Deal).options(*eager_options(Deal, include)).limit(args.rows)).all()
+        cases = {
+            "real_estate": (
+                fastapi_path(real_estates, List[RealEstate]),
+                lambda: rows_response(Response(), real_estates, RealEstateRead).body,
+            ),
+            "deals+include": (
+                fastapi_path(deals, List[DealExpanded], include),
+                lambda: rows_response(Response(), deals, DealExpanded).body,
+            ),
+        }
+        print(f"{len(real_estates)} rows per response")
+        print(f"{'response':<15} {'before ms':>10} {'after ms':>9} {'speedup':>8}")
+        for name, (before, after) in cases.items():
+            assert json.loads(before()) == json.loads(after()), name
+            old, new = per_call_ms(before, args.calls), per_call_ms(after, args.calls)
+            print(f"{name:<15} {old:10.2f} {new:9.2f} {old / new:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""EXPLAIN every crud, dashboard and report query; fail on full scans of large tables.
+
+Each query is run once through the real ``crud`` function while the SQL it
+sends is recorded; then every recorded statement is explained with the same
+parameters (``EXPLAIN QUERY PLAN`` on SQLite, ``EXPLAIN (FORMAT JSON)`` on
+Postgres). A full scan — ``SCAN <table>`` / ``Seq Scan`` — of a table with at
+least ``--min-rows`` rows fails the check, unless the scan runs in output
+order under a ``LIMIT`` (no sort step), so it stops after one page, or the
+query is listed in ``ALLOWED_SCANS`` with the reason.
+
+    python benchmarks/check_query_plans.py                 # fresh SQLite seeded by seed_data
+    DATABASE_URL=postgresql://... python benchmarks/check_query_plans.py --existing
+
+Without ``--existing`` the schema comes from the models (``create_all``), so
+the check covers the ``index=True`` declarations; with it, the check runs
+against a database migrated with Alembic and seeded beforehand.
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+
+EXISTING = "--existing" in sys.argv
+if not EXISTING:
+    os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/query_plans.db"
+
+from sqlalchemy import event, func, select, text  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+import crud.client_crud as client_crud  # noqa: E402
+import crud.dashboard_crud as dashboard_crud  # noqa: E402
+import crud.deal_crud as deal_crud  # noqa: E402
+import crud.ownership_crud as ownership_crud  # noqa: E402
+import crud.ownership_type_crud as ownership_type_crud  # noqa: E402
+import crud.real_estate_crud as real_estate_crud  # noqa: E402
+import crud.report_crud as report_crud  # noqa: E402
+import crud.restriction_type_crud as restriction_type_crud  # noqa: E402
+import crud.restrictions_crud as restrictions_crud  # noqa: E402
+import crud.search_crud as search_crud  # noqa: E402
+import crud.user_crud as user_crud  # noqa: E402
+import seed_data  # noqa: E402
+from database.database import engine  # noqa: E402
+from main import app  # noqa: E402,F401  все модели для маппера
+from sqlmodel import SQLModel  # noqa: E402
+
+# (запрос, таблица) -> почему полный просмотр здесь неизбежен
+ALLOWED_SCANS = {
+    ("dashboard.get_stats", "real_estate_objects"): "count(*) of the whole table",
+    ("dashboard.get_stats", "clients"): "count(*) of the whole table",
+    ("real_estate.get_real_estates[address]", "real_estate_objects"): "ILIKE '%...%' substring filter; /search/ is the indexed path",
+    ("restrictions.get_restriction_periods", "restrictions"): "loads the whole table into the in-memory interval index",
+}
+
+# таблицы, растущие с данными (справочники и сотрудники остаются маленькими): каждая должна попасть в проверку
+GROWING_TABLES = ("real_estate_objects", "clients", "deals", "ownership", "restrictions")
+
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)")
+
+
+def queries(db: Session) -> dict[str, Callable[[], object]]:
+    """Every read the API issues, as ``label -> call`` with realistic arguments."""
+    real_estate_id = db.scalar(select(func.max(seed_data.RealEstate.id))) // 2
+    client_id = db.scalar(select(func.max(seed_data.Client.id))) // 2
+    deal_id = db.scalar(select(func.max(seed_data.Deal.id))) // 2
+    year_ago, today = date(2023, 6, 1), date(2024, 6, 1)
+    filters = real_estate_crud.RealEstateFilters
+    return {
+        "clients.get_client": lambda: client_crud.get_client(db, client_id),
+        "clients.get_client_by_email": lambda: client_crud.get_client_by_email(db, f"client{client_id}@example.ru"),
+        "clients.get_client_by_phone": lambda: client_crud.get_client_by_phone(db, f"+7{9_000_000_000 + client_id}"),
+        "clients.get_clients": lambda: client_crud.get_clients(db, skip=200, limit=100),
+        "clients.get_clients[after]": lambda: client_crud.get_clients(db, limit=100, after=client_id),
+        "users.get_user_by_login": lambda: user_crud.get_user_by_login(db, "agent0001"),
+        "users.get_users": lambda: user_crud.get_users(db),
+        "real_estate.get_real_estate[include]": lambda: real_estate_crud.get_real_estate(
+            db, real_estate_id, include=("ownerships", "restrictions", "deals"),
+        ),
+        "real_estate.get_dossier": lambda: real_estate_crud.get_dossier(db, real_estate_id, today),
+        "real_estate.get_real_estates": lambda: real_estate_crud.get_real_estates(db, limit=20),
+        "real_estate.get_real_estates[include]": lambda: real_estate_crud.get_real_estates(
+            db, limit=20, include=("ownerships", "restrictions", "deals"),
+        ),
+        "real_estate.get_real_estates[status, type, -price]": lambda: real_estate_crud.get_real_estates(
+            db, limit=20, filters=filters(status="available", type="Дом"), sort="-price",
+        ),
+        "real_estate.get_real_estates[price range, area]": lambda: real_estate_crud.get_real_estates(
+            db, limit=20, filters=filters(min_price=5e6, max_price=6e6), sort="area",
+        ),
+        "real_estate.get_real_estates[rooms, floor]": lambda: real_estate_crud.get_real_estates(
+            db, limit=20, filters=filters(rooms=3, min_floor=2, max_floor=9),
+        ),
+        "real_estate.get_real_estates[address]": lambda: real_estate_crud.get_real_estates(
+            db, limit=20, filters=filters(address="Ленина"),
+        ),
+        "deals.get_deal[include]": lambda: deal_crud.get_deal(db, deal_id, include=("client", "real_estate", "employee")),
+        "deals.get_deals[include]": lambda: deal_crud.get_deals(db, limit=100, include=("client", "real_estate", "employee")),
+        "deals.get_deals[after]": lambda: deal_crud.get_deals(db, limit=100, after=deal_id),
+        "ownership.get_ownership[include]": lambda: ownership_crud.get_ownership(
+            db, 1, include=("real_estate", "owner", "ownership_type"),
+        ),
+        "ownership.get_ownerships[include]": lambda: ownership_crud.get_ownerships(
+            db, limit=100, include=("real_estate", "owner", "ownership_type"),
+        ),
+        "restrictions.get_restrictions[include]": lambda: restrictions_crud.get_restrictions(
+            db, limit=100, include=("real_estate", "restriction_type"),
+        ),
+        "restrictions.get_encumbered_ids": lambda: restrictions_crud.get_encumbered_ids(
+            db, list(range(1, real_estate_id, 7)), today,
+        ),
+        "restrictions.get_restriction_periods": lambda: restrictions_crud.get_restriction_periods(db),
+        "ownership_types.get_all": lambda: ownership_type_crud.get_all_ownership_types(db),
+        "restriction_types.get_all": lambda: restriction_type_crud.get_all_restriction_types(db),
+        "dashboard.get_stats": lambda: dashboard_crud.get_stats(db),
+        "dashboard.get_recent_deals": lambda: dashboard_crud.get_recent_deals(db),
+        "dashboard.get_new_properties": lambda: dashboard_crud.get_new_properties(db),
+        "reports.sales_by_period": lambda: report_crud.sales_by_period(db, year_ago, today, "month"),
+        "reports.properties_by_type": lambda: report_crud.properties_by_type(db, year_ago, today),
+        "reports.employees_ranking": lambda: report_crud.employees_ranking(db, year_ago, today),
+        "search.search": lambda: search_crud.search(db, "Ленина", ["properties", "clients", "employees"]),
+    }
+
+
+def record(db: Session, call: Callable[[], object]) -> list[tuple[str, object]]:
+    """SQL statements and parameters ``call`` sends to the database."""
+    statements = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", collect)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", collect)
+    # следующий вызов должен снова сходить в БД, а не взять строки из identity map
+    db.expunge_all()
+    return statements
+
+
+def full_scans_sqlite(db: Session, statement: str, parameters) -> list[tuple[str, str]]:
+    plan = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    details = [row[3] for row in plan]
+    # SCAN в порядке выдачи под LIMIT останавливается на первой странице
+    stops_early = " LIMIT " in statement.upper() and not any("USE TEMP B-TREE" in detail for detail in details)
+    scans = []
+    for detail in details:
+        match = _SQLITE_SCAN.match(detail)
+        if match and not stops_early:
+            scans.append((match.group(1), detail))
+    return scans
+
+
+def full_scans_postgres(db: Session, statement: str, parameters) -> list[tuple[str, str]]:
+    (plan,) = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).one()
+    scans = []
+
+    def walk(node: dict, under_limit: bool) -> None:
+        kind = node["Node Type"]
+        if kind == "Seq Scan" and not under_limit:
+            scans.append((node["Relation Name"], f"Seq Scan on {node['Relation Name']}"))
+        # Limit над сортировкой читает всё, что под ней, — досрочной остановки нет
+        under_limit = (under_limit or kind == "Limit") and kind not in ("Sort", "Aggregate", "HashAggregate")
+        for child in node.get("Plans", []):
+            walk(child, under_limit)
+
+    walk(plan[0]["Plan"], False)
+    return scans
+
+
+def table_sizes(db: Session) -> dict[str, int]:
+    return {
+        table.name: db.scalar(select(func.count()).select_from(table))
+        for table in SQLModel.metadata.sorted_tables
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--existing", action="store_true", help="use DATABASE_URL as is, already migrated and seeded")
+    parser.add_argument("--scale", type=float, default=0.05, help="seed_data volumes for the fresh SQLite database")
+    parser.add_argument("--min-rows", type=int, default=200, help="tables this large must not be scanned")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every plan")
+    args = parser.parse_args()
+
+    if not args.existing:
+        seed_data.seed(seed_data.scaled(args.scale))
+    full_scan = {"sqlite": full_scans_sqlite, "postgresql": full_scans_postgres}.get(engine.dialect.name)
+    if full_scan is None:
+        sys.exit(f"no plan reader for {engine.dialect.name}")
+
+    failures = []
+    with Session(engine) as db:
+        # свежая статистика, иначе планировщик выбирает по умолчаниям
+        db.execute(text("ANALYZE"))
+        db.commit()
+        large = {name for name, rows in table_sizes(db).items() if rows >= args.min_rows}
+        print(f"large tables (>= {args.min_rows} rows): {', '.join(sorted(large))}\n")
+        # таблица с данными ниже порога — её запросы молча не проверяются
+        unchecked = sorted(set(GROWING_TABLES) - large)
+        if unchecked:
+            sys.exit(f"not checked, fewer than {args.min_rows} rows: {', '.join(unchecked)}; raise --scale or lower --min-rows")
+        for label, call in queries(db).items():
+            problems = []
+            for statement, parameters in record(db, call):
+                if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                    continue
+                for table, detail in full_scan(db, statement, parameters):
+                    if table not in large:
+                        continue
+                    reason = ALLOWED_SCANS.get((label, table))
+                    if reason is None:
+                        problems.append((detail, statement))
+                    elif args.verbose:
+                        print(f"  allowed  {label}: {detail} ({reason})")
+            status = "FAIL" if problems else "ok"
+            print(f"{status:>4}  {label}")
+            for detail, statement in problems:
+                print(f"        {detail}\n        {' '.join(statement.split())[:300]}")
+            failures += problems
+    if failures:
+        print(f"\n{len(failures)} full scan(s) of large tables")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
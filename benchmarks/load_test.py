@@ -0,0 +1,275 @@
+"""Mixed-workload load test: latency percentiles and throughput per route.
+
+Replays a weighted mix of what the UI does — dashboard, list pages, detail
+pages, creates and patches — with ``--concurrency`` concurrent clients, then
+prints count, errors, p50/p95/p99 and req/s for each route template.
+
+    python benchmarks/seed_data.py --scale 0.1
+    python benchmarks/load_test.py --duration 30 --concurrency 50
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --requests 5000
+
+Without ``--url`` the app is driven in-process through ``httpx.ASGITransport``
+(no network, no server process); with it, requests go to a running server,
+e.g. ``uvicorn main:app --workers 4``. Either way ``DATABASE_URL`` must point
+at the seeded database: ids for detail pages and patches are drawn from the
+ids that exist there. ``--mix`` overrides weights, e.g. ``--mix dashboard=0``.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv()
+if not os.getenv("DATABASE_URL"):
+    sys.exit("DATABASE_URL is not set: seed a database with benchmarks/seed_data.py first")
+
+import httpx  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from database.database import async_engine, create_db_and_tables, engine  # noqa: E402
+from main import app  # noqa: E402  заодно регистрирует все модели для маппера
+from models.clients import Client  # noqa: E402
+from models.deals import Deal  # noqa: E402
+from models.real_estate import RealEstate  # noqa: E402
+from models.users import User  # noqa: E402
+
+STATUSES = ("available", "sold", "reserved")
+
+# порядковый номер запроса; старшие разряды — время запуска, чтобы телефоны
+# новых клиентов не совпадали с созданными прошлыми прогонами
+SERIAL = itertools.count(int(time.time()) % 10**6 * 10**6)
+
+
+@dataclass
+class Ids:
+    """Id ranges present in the database; detail pages and patches pick from them."""
+
+    real_estate: tuple[int, int]
+    clients: tuple[int, int]
+    deals: tuple[int, int]
+    users: tuple[int, int]
+
+    @classmethod
+    def load(cls) -> "Ids":
+        with Session(engine) as db:
+            ranges = {
+                name: db.execute(select(func.min(model.id), func.max(model.id))).one()
+                for name, model in (("real_estate", RealEstate), ("clients", Client), ("deals", Deal), ("users", User))
+            }
+        empty = [name for name, (low, _) in ranges.items() if low is None]
+        if empty:
+            sys.exit(f"no rows in {', '.join(empty)}: run benchmarks/seed_data.py first")
+        return cls(**{name: tuple(bounds) for name, bounds in ranges.items()})
+
+
+@dataclass
+class Operation:
+    route: str
+    weight: float
+    # (rng, ids, serial) -> (method, url, json body)
+    build: Callable[[random.Random, Ids, int], tuple[str, str, Optional[dict]]]
+
+
+def _id(rng: random.Random, bounds: tuple[int, int]) -> int:
+    return rng.randint(*bounds)
+
+
+# веса — примерная доля операций в работе агентства: чтение списков и карточек преобладает
+OPERATIONS = [
+    Operation("GET /dashboard/", 8, lambda rng, ids, n: ("GET", "/dashboard/", None)),
+    Operation("GET /real_estate/", 16, lambda rng, ids, n: (
+        "GET", f"/real_estate/?limit=20&sort=-price&status={rng.choice(STATUSES)}", None,
+    )),
+    Operation("GET /real_estate/{id}", 16, lambda rng, ids, n: (
+        "GET", f"/real_estate/{_id(rng, ids.real_estate)}", None,
+    )),
+    Operation("GET /real_estate/{id}/dossier", 12, lambda rng, ids, n: (
+        "GET", f"/real_estate/{_id(rng, ids.real_estate)}/dossier", None,
+    )),
+    Operation("GET /clients/", 8, lambda rng, ids, n: ("GET", f"/clients/?limit=50&skip={rng.randint(0, 500)}", None)),
+    Operation("GET /clients/{id}", 10, lambda rng, ids, n: ("GET", f"/clients/{_id(rng, ids.clients)}", None)),
+    Operation("GET /deals/", 10, lambda rng, ids, n: ("GET", "/deals/?limit=50&include=client&include=real_estate", None)),
+    Operation("GET /deals/{id}", 10, lambda rng, ids, n: ("GET", f"/deals/{_id(rng, ids.deals)}?include=client", None)),
+    Operation("GET /ownership/", 4, lambda rng, ids, n: ("GET", "/ownership/?limit=50", None)),
+    Operation("GET /restrictions/", 3, lambda rng, ids, n: ("GET", "/restrictions/?limit=50", None)),
+    Operation("POST /clients/", 4, lambda rng, ids, n: ("POST", "/clients/", {
+        "full_name": f"Нагрузочный клиент {n}",
+        "phone": f"+8{n:012d}",
+        "client_type": "Покупатель",
+    })),
+    Operation("POST /deals/", 3, lambda rng, ids, n: ("POST", "/deals/", {
+        "deal_type": "Продажа",
+        "real_estate_id": _id(rng, ids.real_estate),
+        "client_id": _id(rng, ids.clients),
+        "employee_id": _id(rng, ids.users),
+        "deal_date": "2024-06-01",
+        "amount": round(rng.uniform(1e6, 3e7), 2),
+        "status": "active",
+    })),
+    Operation("PATCH /real_estate/{id}", 4, lambda rng, ids, n: (
+        "PATCH", f"/real_estate/{_id(rng, ids.real_estate)}", {"price": round(rng.uniform(1e6, 3e7), -3)},
+    )),
+    Operation("PATCH /deals/{id}", 2, lambda rng, ids, n: (
+        "PATCH", f"/deals/{_id(rng, ids.deals)}", {"status": rng.choice(("active", "completed", "cancelled"))},
+    )),
+]
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Nearest-rank percentile of sorted ``values``."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(len(values) * p / 100 + 0.5) - 1))]
+
+
+async def run(client: httpx.AsyncClient, operations: list[Operation], ids: Ids, args) -> tuple[dict, float]:
+    stats: dict[str, RouteStats] = defaultdict(RouteStats)
+    weights = list(itertools.accumulate(op.weight for op in operations))
+    deadline = time.perf_counter() + args.duration if args.duration else None
+    remaining = itertools.count(args.requests, -1) if not args.duration else None
+
+    async def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        while True:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            if remaining is not None and next(remaining) <= 0:
+                return
+            op = rng.choices(operations, cum_weights=weights)[0]
+            method, url, body = op.build(rng, ids, next(SERIAL))
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body)
+                status = response.status_code
+            except httpx.HTTPError:
+                status = 0
+            route = stats[op.route]
+            route.latencies.append(time.perf_counter() - started)
+            route.statuses[status] += 1
+            # 404 на случайный id из диапазона (удалённые строки) ошибкой не считаем
+            if status == 0 or status >= 500 or (status >= 400 and status != 404):
+                route.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(args.seed + i) for i in range(args.concurrency)))
+    return stats, time.perf_counter() - started
+
+
+def report(stats: dict[str, RouteStats], elapsed: float) -> list[dict]:
+    rows = []
+    for route, route_stats in sorted(stats.items()):
+        latencies = sorted(route_stats.latencies)
+        rows.append({
+            "route": route,
+            "count": len(latencies),
+            "errors": route_stats.errors,
+            "statuses": dict(sorted(route_stats.statuses.items())),
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "rps": len(latencies) / elapsed,
+        })
+    everything = sorted(latency for route_stats in stats.values() for latency in route_stats.latencies)
+    rows.append({
+        "route": "total",
+        "count": len(everything),
+        "errors": sum(route_stats.errors for route_stats in stats.values()),
+        "statuses": {},
+        "p50_ms": percentile(everything, 50) * 1000,
+        "p95_ms": percentile(everything, 95) * 1000,
+        "p99_ms": percentile(everything, 99) * 1000,
+        "rps": len(everything) / elapsed,
+    })
+    return rows
+
+
+def parse_mix(values: list[str]) -> list[Operation]:
+    overrides = {}
+    for value in values:
+        name, _, weight = value.rpartition("=")
+        overrides[name] = float(weight)
+    operations = []
+    for op in OPERATIONS:
+        # ключ — маршрут целиком ("GET /deals/") или его путь без метода и слешей ("deals")
+        weight = op.weight
+        for name, override in overrides.items():
+            if name in (op.route, op.route.split(" ", 1)[1].strip("/")):
+                weight = override
+        if weight > 0:
+            operations.append(Operation(op.route, weight, op.build))
+    return operations
+
+
+async def main_async(args) -> None:
+    ids = Ids.load()
+    operations = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout)
+    else:
+        # ASGITransport не шлёт lifespan — таблицы создаём, как это сделал бы startup
+        create_db_and_tables()
+        # исключение приложения — это ответ 500 в отчёте, а не падение прогона
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        client = httpx.AsyncClient(transport=transport, base_url="http://load", timeout=args.timeout)
+    try:
+        async with client:
+            if args.warmup:
+                warmup = argparse.Namespace(**{**vars(args), "duration": 0, "requests": args.warmup})
+                await run(client, operations, ids, warmup)
+            stats, elapsed = await run(client, operations, ids, args)
+    finally:
+        if not args.url:
+            # иначе поток соединения aiosqlite не даст процессу завершиться
+            await async_engine.dispose()
+
+    rows = report(stats, elapsed)
+    if args.json:
+        print(json.dumps({"elapsed_s": elapsed, "concurrency": args.concurrency, "routes": rows}, ensure_ascii=False, indent=2))
+        return
+    print(f"{'route':<26} {'count':>7} {'err':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8}")
+    for row in rows:
+        print(
+            f"{row['route']:<26} {row['count']:>7} {row['errors']:>5} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['rps']:>8.1f}"
+        )
+    print(f"{elapsed:.1f} s, concurrency {args.concurrency}, {'server ' + args.url if args.url else 'in-process'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None, help="base URL of a running server; in-process ASGI if omitted")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=0, help="seconds to run; overrides --requests")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100, help="requests sent before measuring")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--mix", nargs="*", default=[], metavar="ROUTE=WEIGHT")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
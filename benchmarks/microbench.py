@@ -0,0 +1,290 @@
+"""Microbenchmarks with a stored baseline: fails when a tracked case regresses.
+
+Covers the ``crud`` functions, per-request session setup (``get_db`` /
+``get_async_db``), ``response_model`` validation of SQLModel lists against
+the ``rows_response`` fast path, and routing/dependency overhead of the app
+built from ``all_routers``.
+
+    python benchmarks/microbench.py                  # compare with benchmarks/baseline.json
+    python benchmarks/microbench.py --save           # record a new baseline
+    python benchmarks/microbench.py -k crud -k asgi  # only cases containing these substrings
+
+Every run uses a fresh SQLite file seeded by ``seed_data`` with fixed volumes
+and seed, so numbers are comparable between runs on one machine. Each case
+is calibrated to run at least ``--min-time`` per sample; ``--rounds`` passes
+over all cases follow and the best sample of each case is kept.
+
+A case is tracked once it is in the baseline; the run exits with 1 if any
+tracked case is slower than its baseline by more than ``--threshold``.
+Changes are normalized by the median change over all tracked cases, so the
+machine running faster or slower as a whole does not count as a regression:
+a slowdown has to stand out from the other cases. On a shared machine runs
+still differ by up to ~40%, hence the 50% default; on a quiet one
+``--threshold 0.2`` is practical. Baselines are machine-specific: re-record
+with ``--save`` on the machine that runs the comparison.
+"""
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+# всегда свежая SQLite: базовая линия сравнима только на тех же данных
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/microbench.db"
+
+import sqlalchemy  # noqa: E402
+from fastapi import Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from starlette.routing import Match  # noqa: E402
+
+import crud.client_crud as client_crud  # noqa: E402
+import crud.dashboard_crud as dashboard_crud  # noqa: E402
+import crud.deal_crud as deal_crud  # noqa: E402
+import crud.real_estate_crud as real_estate_crud  # noqa: E402
+import seed_data  # noqa: E402
+from api.responses import rows_response  # noqa: E402
+from database.database import async_engine, engine, get_async_db, get_db  # noqa: E402
+from main import app  # noqa: E402
+from models.clients import Client, ClientRead  # noqa: E402
+from models.expanded import DealExpanded  # noqa: E402
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+VOLUMES = {"employees": 10, "clients": 1_000, "real_estate": 2_000, "deals": 10_000}
+
+
+def seed() -> None:
+    rng = seed_data.random.Random(42)
+    seed_data.create_db_and_tables()
+    with Session(engine) as db:
+        seed_data.seed_reference(db)
+        batch = 5_000
+        seed_data.load(db, seed_data.User, seed_data.users(1, VOLUMES["employees"], "bench"), batch)
+        seed_data.load(db, seed_data.Client, seed_data.clients(rng, 1, VOLUMES["clients"]), batch)
+        seed_data.load(db, seed_data.RealEstate, seed_data.real_estates(rng, 1, VOLUMES["real_estate"]), batch)
+        ids = {name: range(1, count + 1) for name, count in VOLUMES.items()}
+        seed_data.load(db, seed_data.Ownership, seed_data.ownerships(rng, 1, ids["real_estate"], ids["clients"]), batch)
+        seed_data.load(
+            db, seed_data.Deal,
+            seed_data.deals(rng, 1, VOLUMES["deals"], ids["real_estate"], ids["clients"], ids["employees"]),
+            batch,
+        )
+
+
+def asgi_get(loop: asyncio.AbstractEventLoop, path: str, query: bytes = b"") -> Callable[[], None]:
+    """One request through the full middleware stack, without a client or a socket."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": query, "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"GET {path}: {message['status']}")
+
+    return lambda: loop.run_until_complete(app(dict(scope), receive, send))
+
+
+def route_match(path: str) -> Callable[[], None]:
+    # то же, что делает Router.__call__: перебор маршрутов до полного совпадения
+    scope = {"type": "http", "method": "GET", "path": path, "root_path": ""}
+    routes = app.router.routes
+
+    def match():
+        for route in routes:
+            if route.matches(scope)[0] == Match.FULL:
+                return
+        raise RuntimeError(f"no route for {path}")
+
+    return match
+
+
+def fastapi_validation(loop: asyncio.AbstractEventLoop, rows, response_model) -> Callable[[], bytes]:
+    # путь без rows_response: валидация в response_model, jsonable_encoder, json.dumps
+    field = create_response_field(name="response", type_=response_model)
+    return lambda: JSONResponse(
+        loop.run_until_complete(serialize_response(field=field, response_content=rows, is_coroutine=True))
+    ).body
+
+
+def sync_session() -> None:
+    dependency = get_db()
+    db = next(dependency)
+    db.connection().execute(text("SELECT 1"))
+    dependency.close()
+
+
+async def async_session() -> None:
+    dependency = get_async_db()
+    db = await dependency.__anext__()
+    await (await db.connection()).execute(text("SELECT 1"))
+    await dependency.aclose()
+
+
+def build_cases(db: Session, loop: asyncio.AbstractEventLoop) -> dict[str, Callable]:
+    clients = client_crud.get_clients(db, limit=100)
+    deals = deal_crud.get_deals(db, limit=100, include=("client", "real_estate", "employee"))
+    filters = real_estate_crud.RealEstateFilters(status="available", type="Квартира")
+    phones = (f"+6{n:012d}" for n in itertools.count())
+    prices = itertools.cycle((1_000_000.0, 2_000_000.0))
+    cases = {
+        "crud.get_client": lambda: client_crud.get_client(db, 500),
+        "crud.get_clients[100]": lambda: client_crud.get_clients(db, limit=100),
+        "crud.get_clients[100, after]": lambda: client_crud.get_clients(db, limit=100, after=500),
+        "crud.get_real_estates[filter, sort]": lambda: real_estate_crud.get_real_estates(
+            db, limit=20, filters=filters, sort="-price",
+        ),
+        "crud.get_deal[include]": lambda: deal_crud.get_deal(db, 5_000, include=("client", "real_estate")),
+        "crud.get_deals[100, include]": lambda: deal_crud.get_deals(db, limit=100, include=("client", "real_estate")),
+        "crud.dashboard.get_stats": lambda: dashboard_crud.get_stats(db),
+        "crud.create_client": lambda: client_crud.create_client(db, Client(full_name="Бенчмарк", phone=next(phones))),
+        "crud.update_real_estate": lambda: real_estate_crud.update_real_estate(db, 1_000, {"price": next(prices)}),
+        "session.get_db": sync_session,
+        "session.get_async_db": lambda: loop.run_until_complete(async_session()),
+        "serialize.response_model[ClientRead x100]": fastapi_validation(loop, clients, List[ClientRead]),
+        "serialize.rows_response[ClientRead x100]": lambda: rows_response(Response(), clients, ClientRead).body,
+        "serialize.response_model[DealExpanded x100]": fastapi_validation(loop, deals, List[DealExpanded]),
+        "serialize.rows_response[DealExpanded x100]": lambda: rows_response(Response(), deals, DealExpanded).body,
+        "routing.match[/health]": route_match("/health"),
+        "routing.match[/reports/employees]": route_match("/reports/employees"),
+        "asgi.GET /health": asgi_get(loop, "/health"),
+        "asgi.GET /ownership_types/": asgi_get(loop, "/ownership_types/"),
+        "asgi.GET /clients/{id}": asgi_get(loop, "/clients/500"),
+        "asgi.GET /real_estate/": asgi_get(loop, "/real_estate/", b"limit=20&status=available&sort=-price"),
+    }
+    # быстрый путь сравниваем с валидацией, только если ответы совпадают
+    for schema in ("ClientRead", "DealExpanded"):
+        fast, validated = (cases[f"serialize.{path}[{schema} x100]"]() for path in ("rows_response", "response_model"))
+        assert json.loads(fast) == json.loads(validated), schema
+    return cases
+
+
+def measure(cases: dict[str, Callable], rounds: int, min_time: float) -> dict[str, list[float]]:
+    """Seconds per call of every case, one sample per case per round.
+
+    Rounds interleave the cases, so a burst of load on the machine costs every
+    case one slow sample instead of costing one case all of them. The garbage
+    collector is off while sampling, as in ``timeit``: a collection triggered
+    by an earlier case would otherwise land on a random one.
+    """
+    loops = {name: _calibrate(fn, min_time) for name, fn in cases.items()}
+    samples: dict[str, list[float]] = {name: [] for name in cases}
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            for name, fn in cases.items():
+                samples[name].append(_sample(fn, loops[name]) / loops[name])
+            gc.collect()
+    finally:
+        gc.enable()
+    return samples
+
+
+def _calibrate(fn: Callable, min_time: float) -> int:
+    fn()
+    loops = 1
+    while True:
+        elapsed = _sample(fn, loops)
+        if elapsed >= min_time:
+            return loops
+        loops *= 2 if elapsed < min_time / 4 else 1 + int(min_time / max(elapsed, 1e-9))
+
+
+def _sample(fn: Callable, loops: int) -> float:
+    started = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return time.perf_counter() - started
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "sqlite": sqlite3.sqlite_version,
+        "machine": f"{platform.machine()} {platform.system()} {os.cpu_count()} cpu",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="filters", action="append", default=[], help="run cases containing this substring")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--min-time", type=float, default=0.1, help="seconds per sample")
+    parser.add_argument("--threshold", type=float, default=0.5, help="allowed slowdown, 0.5 = 50%%")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"environment": {}, "cases": {}}
+    if baseline["environment"] and baseline["environment"] != environment():
+        print(f"warning: baseline recorded on {baseline['environment']}, now {environment()}")
+
+    seed()
+    loop = asyncio.new_event_loop()
+    results: dict[str, dict] = {}
+    regressions = []
+    # без expire_on_commit: коммиты crud.create_* не должны сбрасывать строки для serialize.*
+    with Session(engine, expire_on_commit=False) as db:
+        cases = build_cases(db, loop)
+        selected = {name: fn for name, fn in cases.items() if not args.filters or any(f in name for f in args.filters)}
+        samples = measure(selected, args.rounds, args.min_time)
+    for name, case_samples in samples.items():
+        results[name] = {"us": round(min(case_samples) * 1e6, 2), "median_us": round(statistics.median(case_samples) * 1e6, 2)}
+
+    # общий множитель скорости машины — медиана по случаям; по одному-двум случаям не оцениваем
+    ratios = [result["us"] / baseline["cases"][name]["us"] for name, result in results.items() if name in baseline["cases"]]
+    speed = statistics.median(ratios) if len(ratios) >= 3 else 1.0
+    print(f"\n{'case':<46} {'best us':>10} {'median us':>10} {'baseline':>10} {'change':>8}")
+    for name, result in results.items():
+        line = f"{name:<46} {result['us']:>10.1f} {result['median_us']:>10.1f}"
+        tracked = baseline["cases"].get(name)
+        if tracked is None:
+            print(f"{line} {'new':>10}")
+            continue
+        change = result["us"] / tracked["us"] / speed - 1
+        flag = ""
+        if change > args.threshold:
+            regressions.append((name, change))
+            flag = "  REGRESSION"
+        print(f"{line} {tracked['us']:>10.1f} {change:>+7.0%}{flag}")
+    if ratios:
+        print(f"machine speed vs baseline: x{1 / speed:.2f} (median over {len(ratios)} cases); changes are relative to it")
+    # иначе поток соединения aiosqlite не даст процессу завершиться
+    loop.run_until_complete(async_engine.dispose())
+    loop.close()
+
+    if args.save:
+        # при -k обновляем только выбранные случаи, остальные остаются как были
+        cases = {**baseline["cases"], **results} if args.filters else results
+        args.baseline.write_text(json.dumps({"environment": environment(), "cases": cases}, ensure_ascii=False, indent=2) + "\n")
+        print(f"\nbaseline written to {args.baseline}")
+        return
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than baseline by more than {args.threshold:.0%}:")
+        for name, change in regressions:
+            print(f"  {name}: {change:+.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
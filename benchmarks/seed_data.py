@@ -0,0 +1,337 @@
+"""Fill the database with realistic synthetic data for load tests.
+
+Default volumes: 100k ``real_estate_objects``, 50k ``clients``, 1M ``deals``,
+about 120k ``ownership`` and 15k ``restrictions``, plus 40 employees and the
+ownership/restriction reference codes.
+
+    python benchmarks/seed_data.py                  # DATABASE_URL from the environment / .env
+    python benchmarks/seed_data.py --scale 0.01     # 1% of every volume
+
+Rows are generated with explicit ids after the current maximum, so every
+foreign key points at an existing row and seeding can be repeated on a
+non-empty database. Distributions are skewed the way real data is: most
+objects are flats, prices follow area and type, a few objects and clients
+account for most deals, recent dates are more frequent than old ones. The
+same ``--seed`` gives the same data. Batches go through
+``crud.import_crud.insert_rows``, i.e. one ``executemany`` per batch.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from itertools import accumulate
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv()
+if not os.getenv("DATABASE_URL"):
+    sys.exit("DATABASE_URL is not set (sqlite:///./load.db or a local Postgres URL)")
+
+from sqlalchemy import func, select, text  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from core.security import hash_password  # noqa: E402
+from crud.import_crud import insert_rows  # noqa: E402
+from database.database import create_db_and_tables, engine  # noqa: E402
+from models.clients import Client  # noqa: E402
+from models.deals import Deal  # noqa: E402
+from models.ownership import Ownership  # noqa: E402
+from models.ownership_types import OwnershipType  # noqa: E402
+from models.real_estate import RealEstate  # noqa: E402
+from models.restriction_types import RestrictionType  # noqa: E402
+from models.restrictions import Restriction  # noqa: E402
+from models.users import User  # noqa: E402
+
+VOLUMES = {
+    "real_estate": 100_000,
+    "clients": 50_000,
+    "deals": 1_000_000,
+    "employees": 40,
+}
+
+OWNERSHIP_TYPES = [
+    ("private", "Частная собственность", None),
+    ("shared", "Общая долевая собственность", None),
+    ("joint", "Общая совместная собственность", None),
+    ("municipal", "Муниципальная собственность", None),
+    ("state", "Государственная собственность", None),
+]
+RESTRICTION_TYPES = [
+    ("mortgage", "Ипотека", "Залог в силу закона или договора"),
+    ("arrest", "Арест", "Запрет на распоряжение по решению суда"),
+    ("lease", "Аренда", "Долгосрочная аренда с регистрацией"),
+    ("easement", "Сервитут", None),
+]
+
+# тип -> (доля объектов, площадь: медиана, разброс; цена за м², этажность)
+PROPERTY_TYPES = {
+    "Квартира": (0.62, 52, 0.35, 180_000, 25),
+    "Дом": (0.14, 140, 0.45, 70_000, 3),
+    "Земельный участок": (0.10, 900, 0.6, 1_500, None),
+    "Коммерческая": (0.08, 120, 0.7, 150_000, 12),
+    "Гараж": (0.06, 18, 0.2, 60_000, None),
+}
+PROPERTY_STATUSES = (("available", 0.55), ("sold", 0.30), ("reserved", 0.10), ("archived", 0.05))
+DEAL_TYPES = (("Продажа", 0.55), ("Аренда", 0.35), ("Ипотека", 0.10))
+DEAL_STATUSES = (("completed", 0.70), ("active", 0.18), ("cancelled", 0.12))
+CLIENT_TYPES = (("Покупатель", 0.45), ("Продавец", 0.25), ("Арендатор", 0.20), ("Юридическое лицо", 0.10))
+
+CITIES = ("Москва", "Санкт-Петербург", "Казань", "Екатеринбург", "Новосибирск", "Нижний Новгород", "Самара", "Краснодар")
+CITY_WEIGHTS = (0.35, 0.2, 0.08, 0.08, 0.08, 0.07, 0.07, 0.07)
+STREETS = (
+    "Ленина", "Мира", "Гагарина", "Советская", "Садовая", "Школьная", "Лесная", "Новая",
+    "Пушкина", "Молодёжная", "Центральная", "Зелёная", "Набережная", "Полевая", "Строителей",
+)
+SURNAMES = (
+    "Иванов", "Смирнов", "Кузнецов", "Попов", "Васильев", "Петров", "Соколов", "Михайлов",
+    "Новиков", "Фёдоров", "Морозов", "Волков", "Алексеев", "Лебедев", "Семёнов", "Егоров",
+)
+FIRST_NAMES = ("Александр", "Дмитрий", "Максим", "Сергей", "Андрей", "Алексей", "Иван", "Михаил", "Елена", "Ольга", "Анна", "Мария")
+PATRONYMICS = ("Александрович", "Дмитриевич", "Сергеевич", "Андреевич", "Иванович", "Михайлович")
+
+TODAY = date(2024, 6, 1)
+HISTORY_DAYS = 365 * 8
+
+
+def _pick(rng: random.Random, choices: tuple) -> str:
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def _recent_date(rng: random.Random, days: int = HISTORY_DAYS) -> date:
+    # треугольное распределение с модой в «сегодня»: свежих записей больше
+    return TODAY - timedelta(days=int(rng.triangular(0, days, 0)))
+
+
+def _full_name(rng: random.Random) -> str:
+    first = rng.choice(FIRST_NAMES)
+    surname = rng.choice(SURNAMES)
+    patronymic = rng.choice(PATRONYMICS)
+    if first in ("Елена", "Ольга", "Анна", "Мария"):
+        surname, patronymic = surname + "а", patronymic[:-2] + "на"
+    return f"{surname} {first} {patronymic}"
+
+
+def _popularity(rng: random.Random, count: int) -> list[float]:
+    # кумулятивные веса по Парето: небольшая доля объектов/клиентов даёт большинство сделок
+    weights = [rng.paretovariate(1.3) for _ in range(count)]
+    return list(accumulate(weights))
+
+
+def next_id(db: Session, model) -> int:
+    return (db.scalar(select(func.max(model.id))) or 0) + 1
+
+
+def seed_reference(db: Session) -> None:
+    for model, rows in ((OwnershipType, OWNERSHIP_TYPES), (RestrictionType, RESTRICTION_TYPES)):
+        existing = set(db.scalars(select(model.code)))
+        missing = [
+            (i, {"code": code, "name": name, "description": description})
+            for i, (code, name, description) in enumerate(rows)
+            if code not in existing
+        ]
+        _insert(db, model, missing)
+
+
+def users(start: int, count: int, password: str):
+    # один хеш на всех: scrypt на каждого сотрудника — это секунды без пользы
+    hashed = hash_password(password)
+    for i in range(start, start + count):
+        yield {
+            "id": i,
+            "login": f"agent{i:04d}",
+            "full_name": f"Сотрудник {i}",
+            "position": "Агент" if i % 8 else "Руководитель отдела",
+            "role": "manager" if i % 8 == 0 else "agent",
+            "password": hashed,
+        }
+
+
+def clients(rng: random.Random, start: int, count: int):
+    for i in range(start, start + count):
+        client_type = _pick(rng, CLIENT_TYPES)
+        legal = client_type == "Юридическое лицо"
+        yield {
+            "id": i,
+            "full_name": f'ООО "{rng.choice(STREETS)}-{i}"' if legal else _full_name(rng),
+            # телефон и почта уникальны, поэтому строятся от id
+            "phone": f"+7{9_000_000_000 + i}",
+            "email": f"client{i}@example.ru" if legal or rng.random() < 0.7 else None,
+            "client_type": client_type,
+        }
+
+
+def real_estates(rng: random.Random, start: int, count: int):
+    names = list(PROPERTY_TYPES)
+    shares = [PROPERTY_TYPES[name][0] for name in names]
+    for i in range(start, start + count):
+        kind = rng.choices(names, shares)[0]
+        _, median_area, spread, per_m2, max_floor = PROPERTY_TYPES[kind]
+        area = round(median_area * rng.lognormvariate(0, spread), 1)
+        city = rng.choices(CITIES, CITY_WEIGHTS)[0]
+        # в столицах дороже, плюс шум ±25%
+        price = area * per_m2 * (1.6 if city in CITIES[:2] else 1.0) * rng.uniform(0.75, 1.25)
+        rooms = None
+        if kind in ("Квартира", "Дом"):
+            rooms = max(1, min(7, round(area / (22 if kind == "Квартира" else 30))))
+        yield {
+            "id": i,
+            "type": kind,
+            "address": f"г. {city}, ул. {rng.choice(STREETS)}, д. {rng.randint(1, 180)}"
+            + (f", кв. {rng.randint(1, 400)}" if kind == "Квартира" else ""),
+            "area": area,
+            "rooms": rooms,
+            "floor": rng.randint(1, max_floor) if max_floor else None,
+            "price": round(price, -3),
+            "description": None if rng.random() < 0.6 else f"{kind}, {area} м², {city}",
+            "status": _pick(rng, PROPERTY_STATUSES),
+        }
+
+
+def deals(rng: random.Random, start: int, count: int, real_estate_ids: range, client_ids: range, employee_ids: range):
+    estate_weights = _popularity(rng, len(real_estate_ids))
+    client_weights = _popularity(rng, len(client_ids))
+    employee_weights = _popularity(rng, len(employee_ids))
+    for i in range(start, start + count):
+        deal_type = _pick(rng, DEAL_TYPES)
+        # сумма: аренда — месячный платёж, продажа и ипотека — порядок цены объекта
+        amount = rng.lognormvariate(11, 0.5) if deal_type == "Аренда" else rng.lognormvariate(15.5, 0.7)
+        yield {
+            "id": i,
+            "deal_type": deal_type,
+            "real_estate_id": rng.choices(real_estate_ids, cum_weights=estate_weights)[0],
+            "client_id": rng.choices(client_ids, cum_weights=client_weights)[0],
+            "employee_id": rng.choices(employee_ids, cum_weights=employee_weights)[0],
+            "deal_date": _recent_date(rng),
+            "amount": round(amount, 2),
+            "status": _pick(rng, DEAL_STATUSES),
+        }
+
+
+def ownerships(rng: random.Random, start: int, real_estate_ids: range, client_ids: range):
+    codes, weights = ("private", "shared", "joint", "municipal", "state"), (0.7, 0.12, 0.1, 0.05, 0.03)
+    next_row = start
+    for real_estate_id in real_estate_ids:
+        # у каждого объекта есть владелец, у каждого пятого — ещё один (доля или прежний собственник)
+        for _ in range(2 if rng.random() < 0.2 else 1):
+            yield {
+                "id": next_row,
+                "real_estate_id": real_estate_id,
+                "ownership_type_code": rng.choices(codes, weights)[0],
+                "owner_id": rng.choice(client_ids),
+                "registration_date": _recent_date(rng, HISTORY_DAYS * 2),
+                "document_reference": f"77:{rng.randint(1, 99):02d}:{real_estate_id:07d}-{next_row}",
+            }
+            next_row += 1
+
+
+def restrictions(rng: random.Random, start: int, real_estate_ids: range):
+    codes, weights = ("mortgage", "arrest", "lease", "easement"), (0.6, 0.1, 0.2, 0.1)
+    next_row = start
+    for real_estate_id in real_estate_ids:
+        if rng.random() >= 0.15:
+            continue
+        imposed = _recent_date(rng)
+        removed = None
+        if rng.random() < 0.4:
+            removed = min(TODAY, imposed + timedelta(days=rng.randint(30, 3000)))
+        yield {
+            "id": next_row,
+            "real_estate_id": real_estate_id,
+            "restriction_type_code": rng.choices(codes, weights)[0],
+            "imposed_date": imposed,
+            "removed_date": removed,
+            "basis": None if rng.random() < 0.5 else f"Договор № {next_row}",
+        }
+        next_row += 1
+
+
+def _insert(db: Session, model, rows: list[tuple[int, dict]]) -> None:
+    errors = insert_rows(db, model, rows)
+    if errors:
+        row, error = errors[0]
+        raise RuntimeError(f"{model.__tablename__}: {len(errors)} rows rejected, first at {row}: {error}")
+
+
+def load(db: Session, model, rows, batch_size: int) -> int:
+    started = time.perf_counter()
+    batch: list[tuple[int, dict]] = []
+    total = 0
+    for row in rows:
+        batch.append((total, row))
+        total += 1
+        if len(batch) == batch_size:
+            _insert(db, model, batch)
+            batch = []
+    _insert(db, model, batch)
+    if engine.dialect.name == "postgresql" and total:
+        # явные id не двигают sequence — иначе следующий INSERT из API упрётся в дубль ключа
+        table = model.__tablename__
+        db.execute(text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT max(id) FROM {table}))"))
+        db.commit()
+    elapsed = time.perf_counter() - started
+    print(f"{model.__tablename__:>20}: {total:>9} rows  {elapsed:6.1f} s  {total / elapsed if elapsed else 0:9.0f} rows/s")
+    return total
+
+
+def scaled(scale: float) -> dict[str, int]:
+    return {name: max(1, int(default * scale)) for name, default in VOLUMES.items()}
+
+
+def seed(volumes: dict[str, int], batch_size: int = 5_000, password: str = "bench", random_seed: int = 42) -> None:
+    """Create the tables if needed and append ``volumes`` rows of every kind."""
+    rng = random.Random(random_seed)
+    create_db_and_tables()
+    with Session(engine) as db:
+        seed_reference(db)
+        start = next_id(db, User)
+        load(db, User, users(start, volumes["employees"], password), batch_size)
+        employee_ids = range(start, start + volumes["employees"])
+
+        start = next_id(db, Client)
+        load(db, Client, clients(rng, start, volumes["clients"]), batch_size)
+        client_ids = range(start, start + volumes["clients"])
+
+        start = next_id(db, RealEstate)
+        load(db, RealEstate, real_estates(rng, start, volumes["real_estate"]), batch_size)
+        real_estate_ids = range(start, start + volumes["real_estate"])
+
+        load(db, Ownership, ownerships(rng, next_id(db, Ownership), real_estate_ids, client_ids), batch_size)
+        load(db, Restriction, restrictions(rng, next_id(db, Restriction), real_estate_ids), batch_size)
+        load(
+            db, Deal,
+            deals(rng, next_id(db, Deal), volumes["deals"], real_estate_ids, client_ids, employee_ids),
+            batch_size,
+        )
+        if engine.dialect.name == "postgresql":
+            db.execute(text("ANALYZE"))
+            db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for every volume")
+    parser.add_argument("--real-estate", type=int, default=None)
+    parser.add_argument("--clients", type=int, default=None)
+    parser.add_argument("--deals", type=int, default=None)
+    parser.add_argument("--employees", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--password", default="bench", help="password of the generated employees")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    volumes = {
+        name: getattr(args, name) if getattr(args, name) is not None else count
+        for name, count in scaled(args.scale).items()
+    }
+    seed(volumes, args.batch_size, args.password, args.seed)
+
+
+if __name__ == "__main__":
+    main()
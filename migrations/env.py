@@ -14,6 +14,7 @@ from app.models.real_estate import RealEstate
 from app.models.restriction_types import RestrictionType
 from app.models.restrictions import Restriction
 from app.models.users import User
+from app.database.search_index import is_search_object
 
 import os
 from dotenv import load_dotenv
@@ -39,6 +40,12 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = SQLModel.metadata
 
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    # trigram-индексы и FTS-таблицы поиска не описаны в моделях: autogenerate их не трогает
+    return not is_search_object(name, type_)
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -62,6 +69,7 @@ def run_migrations_offline() -> None:
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
+        include_object=include_object,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -84,7 +92,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,26 @@
+"""deals deal_date index
+
+Revision ID: 70e75d6bbf9e
+Revises: d842db0f7d00
+Create Date: 2026-10-18 12:20:05.381274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '70e75d6bbf9e'
+down_revision: Union[str, None] = 'd842db0f7d00'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_deals_deal_date'), 'deals', ['deal_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_deals_deal_date'), table_name='deals')
@@ -0,0 +1,36 @@
+"""real estate filter indexes
+
+Revision ID: 89052dd9fe7e
+Revises: 26015c90103e
+Create Date: 2026-10-18 10:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '89052dd9fe7e'
+down_revision: Union[str, None] = '26015c90103e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_real_estate_objects_type'), 'real_estate_objects', ['type'], unique=False)
+    op.create_index(op.f('ix_real_estate_objects_price'), 'real_estate_objects', ['price'], unique=False)
+    op.create_index(op.f('ix_real_estate_objects_area'), 'real_estate_objects', ['area'], unique=False)
+    op.create_index(op.f('ix_real_estate_objects_rooms'), 'real_estate_objects', ['rooms'], unique=False)
+    op.create_index(op.f('ix_real_estate_objects_floor'), 'real_estate_objects', ['floor'], unique=False)
+    op.create_index('ix_real_estate_objects_status_type_price', 'real_estate_objects', ['status', 'type', 'price'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_real_estate_objects_status_type_price', table_name='real_estate_objects')
+    op.drop_index(op.f('ix_real_estate_objects_floor'), table_name='real_estate_objects')
+    op.drop_index(op.f('ix_real_estate_objects_rooms'), table_name='real_estate_objects')
+    op.drop_index(op.f('ix_real_estate_objects_area'), table_name='real_estate_objects')
+    op.drop_index(op.f('ix_real_estate_objects_price'), table_name='real_estate_objects')
+    op.drop_index(op.f('ix_real_estate_objects_type'), table_name='real_estate_objects')
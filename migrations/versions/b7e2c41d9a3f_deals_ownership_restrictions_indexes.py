@@ -0,0 +1,47 @@
+"""deals ownership restrictions indexes
+
+Revision ID: b7e2c41d9a3f
+Revises: 70e75d6bbf9e
+Create Date: 2026-10-18 20:31:47.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c41d9a3f'
+down_revision: Union[str, None] = '70e75d6bbf9e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# внешние ключи: include= и selectinload ищут строки по ним (WHERE ... IN),
+# Postgres сам индексы на FK не создаёт; status — счётчик активных сделок на дашборде
+INDEXES = [
+    ('deals', 'real_estate_id'),
+    ('deals', 'client_id'),
+    ('deals', 'employee_id'),
+    ('deals', 'status'),
+    ('ownership', 'real_estate_id'),
+    ('ownership', 'owner_id'),
+    ('restrictions', 'real_estate_id'),
+]
+
+
+def upgrade() -> None:
+    # на Postgres — CONCURRENTLY, чтобы не блокировать запись в deals на время построения;
+    # такой индекс нельзя строить внутри транзакции
+    postgresql = op.get_bind().dialect.name == 'postgresql'
+    for table, column in INDEXES:
+        if postgresql:
+            with op.get_context().autocommit_block():
+                op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False, postgresql_concurrently=True)
+        else:
+            op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False)
+
+
+def downgrade() -> None:
+    for table, column in reversed(INDEXES):
+        op.drop_index(op.f(f'ix_{table}_{column}'), table_name=table)
@@ -0,0 +1,34 @@
+"""restrictions period index
+
+Revision ID: c3a9f5e81b27
+Revises: b7e2c41d9a3f
+Create Date: 2026-10-18 22:04:13.527610
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9f5e81b27'
+down_revision: Union[str, None] = 'b7e2c41d9a3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # составной индекс покрывает и поиск по real_estate_id: одиночный больше не нужен
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index('ix_restrictions_real_estate_period', 'restrictions', ['real_estate_id', 'imposed_date', 'removed_date'], unique=False, postgresql_concurrently=True)
+            op.drop_index(op.f('ix_restrictions_real_estate_id'), table_name='restrictions', postgresql_concurrently=True)
+    else:
+        op.create_index('ix_restrictions_real_estate_period', 'restrictions', ['real_estate_id', 'imposed_date', 'removed_date'], unique=False)
+        op.drop_index(op.f('ix_restrictions_real_estate_id'), table_name='restrictions')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_restrictions_real_estate_id'), 'restrictions', ['real_estate_id'], unique=False)
+    op.drop_index('ix_restrictions_real_estate_period', table_name='restrictions')
@@ -0,0 +1,47 @@
+"""trigram search indexes
+
+Revision ID: d842db0f7d00
+Revises: 89052dd9fe7e
+Create Date: 2026-10-18 11:03:17.550912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd842db0f7d00'
+down_revision: Union[str, None] = '89052dd9fe7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQLite-стенд получает FTS5-таблицы при старте приложения (database/search_index.py)
+TRGM_INDEXES = [
+    ('ix_real_estate_objects_address_trgm', 'real_estate_objects', 'address'),
+    ('ix_clients_full_name_trgm', 'clients', 'full_name'),
+    ('ix_users_full_name_trgm', 'users', 'full_name'),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY не блокирует запись в таблицы на время построения, но не работает в транзакции
+    with op.get_context().autocommit_block():
+        for name, table, column in TRGM_INDEXES:
+            op.create_index(
+                name, table, [column], unique=False,
+                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name, table, _ in TRGM_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
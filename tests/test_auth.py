@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+from sqlmodel import Session, select
+
+from conftest import APP_DIR
+from core.security import create_token, is_hashed, verify_password
+from database.database import engine
+from models.users import User
+
+
+def me(client, token: str):
+    return client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+
+def stored_password(login: str) -> str:
+    with Session(engine) as db:
+        return db.exec(select(User.password).where(User.login == login)).one()
+
+
+@pytest.fixture(scope="module")
+def user(client):
+    body = {"login": "auth-user", "full_name": "Проверка входа", "password": "correct horse"}
+    response = client.post("/users/", json=body)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def login(client, name: str, password: str):
+    return client.post("/auth/login", json={"login": name, "password": password})
+
+
+def test_login_and_me(client, user):
+    response = login(client, "auth-user", "correct horse")
+    assert response.status_code == 200, response.text
+    assert me(client, response.json()["access_token"]).json()["id"] == user["id"]
+
+
+@pytest.mark.parametrize("name, password", [("auth-user", "wrong"), ("no-such-user", "correct horse")])
+def test_wrong_credentials(client, user, name, password):
+    response = login(client, name, password)
+    assert response.status_code == 401
+    assert "access_token" not in response.text
+
+
+def test_tampered_token(client, user):
+    token = login(client, "auth-user", "correct horse").json()["access_token"]
+    assert me(client, token).status_code == 200
+    header, payload, signature = token.split(".")
+    forged = create_token({"sub": str(user["id"]), "login": "auth-user", "role": "admin"}).split(".")[1]
+    for bad in (f"{header}.{forged}.{signature}", f"{header}.{payload}.{signature[:-2]}AA", token[:-1], "garbage"):
+        response = me(client, bad)
+        assert response.status_code == 401, bad
+        assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_expired_token(client, user):
+    claims = {"sub": str(user["id"]), "login": "auth-user"}
+    assert me(client, create_token(claims, ttl=-1)).status_code == 401
+    # проверенные claims кешируются, но срок действия сверяется на каждом запросе
+    token = create_token(claims, ttl=1)
+    assert me(client, token).status_code == 200
+    time.sleep(1.1)
+    response = me(client, token)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token expired"
+
+
+def test_plaintext_password_is_rehashed_on_login(client):
+    # пароль, сохранённый до хеширования, — минуя POST /users/, который хеширует
+    with Session(engine) as db:
+        db.add(User(login="legacy-user", full_name="Старый пароль", password="plain secret"))
+        db.commit()
+    assert login(client, "legacy-user", "wrong").status_code == 401
+    assert stored_password("legacy-user") == "plain secret"
+
+    assert login(client, "legacy-user", "plain secret").status_code == 200
+    stored = stored_password("legacy-user")
+    assert is_hashed(stored) and verify_password("plain secret", stored)
+    assert login(client, "legacy-user", "plain secret").status_code == 200
+    assert stored_password("legacy-user") == stored
+
+
+def test_startup_requires_secret_key():
+    env = {key: value for key, value in os.environ.items() if not key.startswith("AUTH_")}
+    env.update(PYTHONPATH=str(APP_DIR), DATABASE_URL=f"sqlite:///{tempfile.mkdtemp()}/startup.db")
+    code = "from fastapi.testclient import TestClient; from main import app; TestClient(app).__enter__()"
+    # cwd без .env: ключ не должен подхватиться из файла
+    result = subprocess.run([sys.executable, "-c", code], env=env, cwd=tempfile.mkdtemp(), capture_output=True, text=True)
+    assert result.returncode != 0
+    assert "AUTH_SECRET_KEY is not set" in result.stderr
@@ -0,0 +1,148 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from api import compression
+from api.compression import CompressedBody, CompressionMiddleware, negotiate
+from core.config import settings
+
+BIG = json.dumps([{"id": i, "name": f"Объект {i}"} for i in range(200)]).encode()
+SMALL = b'{"id": 1}'
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/big")
+    def big():
+        return Response(BIG, media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return Response(SMALL, media_type="application/json")
+
+    @app.get("/binary")
+    def binary():
+        return Response(BIG, media_type="application/octet-stream")
+
+    @app.get("/encoded")
+    def encoded():
+        # уже сжато приложением: middleware не должен сжимать повторно
+        return Response(gzip.compress(BIG), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([BIG, BIG, b""]), media_type="application/x-ndjson")
+
+    cached = CompressedBody(BIG)
+
+    @app.get("/cached")
+    def cached_body(request: Request):
+        return cached.response(request)
+
+    return app
+
+
+@pytest.fixture
+def server():
+    with TestClient(build_app()) as test_client:
+        yield test_client
+
+
+def raw_get(server, url: str, accept_encoding: str = "gzip") -> tuple[dict, bytes]:
+    # httpx сам распаковывает gzip: сравниваем байты, пришедшие по сети
+    with server.stream("GET", url, headers={"Accept-Encoding": accept_encoding}) as response:
+        assert response.status_code == 200
+        return response.headers, b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("", None),
+    ("gzip", "gzip"),
+    ("GZIP, deflate", "gzip"),
+    ("identity", None),
+    ("gzip;q=0", None),
+    ("gzip;q=0.5, identity", "gzip"),
+    ("gzip;q=bad", None),
+    ("*", compression.ENCODINGS[0]),
+    ("*;q=0", None),
+    ("*, gzip;q=0", "br" if "br" in compression.ENCODINGS else None),
+])
+def test_negotiate(header, expected):
+    assert negotiate(header) == expected
+
+
+def test_brotli_preferred_at_equal_q(monkeypatch):
+    monkeypatch.setattr(compression, "ENCODINGS", ("br", "gzip"))
+    assert negotiate("gzip, br") == "br"
+    assert negotiate("gzip, br;q=0.5") == "gzip"
+
+
+def test_threshold(server, monkeypatch):
+    headers, body = raw_get(server, "/small")
+    assert "content-encoding" not in headers and body == SMALL
+    headers, body = raw_get(server, "/big")
+    assert headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in headers["vary"]
+    assert int(headers["content-length"]) == len(body) < len(BIG)
+    assert gzip.decompress(body) == BIG
+
+    monkeypatch.setattr(settings, "compression_minimum_size", len(BIG) + 1)
+    headers, body = raw_get(server, "/big")
+    assert "content-encoding" not in headers and body == BIG
+
+
+@pytest.mark.parametrize("url", ["/big", "/cached", "/stream"])
+def test_identity_when_not_accepted(server, url):
+    for accept_encoding in ("identity", "gzip;q=0"):
+        headers, body = raw_get(server, url, accept_encoding)
+        assert "content-encoding" not in headers
+        assert body in (BIG, BIG * 2)
+
+
+def test_passthrough(server):
+    headers, body = raw_get(server, "/binary")
+    assert "content-encoding" not in headers and body == BIG
+    headers, body = raw_get(server, "/encoded")
+    assert headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == BIG
+
+
+def test_stream_is_compressed_in_chunks(server):
+    headers, body = raw_get(server, "/stream")
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert gzip.decompress(body) == BIG * 2
+
+
+@pytest.mark.parametrize("level", [1, 9])
+def test_configured_gzip_level(server, monkeypatch, level):
+    monkeypatch.setattr(settings, "compression_gzip_level", level)
+    expected = gzip.compress(BIG, compresslevel=level, mtime=0)
+    assert raw_get(server, "/big")[1] == expected
+    # кешированное тело сжимается с тем же уровнем, один раз
+    cached = CompressedBody(BIG)
+    assert cached.encoded("gzip") == expected
+    assert cached.encoded("gzip") is cached.encoded("gzip")
+
+
+def test_configured_brotli_quality(monkeypatch):
+    brotli = pytest.importorskip("brotli")
+    monkeypatch.setattr(settings, "compression_brotli_quality", 2)
+    assert CompressedBody(BIG).encoded("br") == brotli.compress(BIG, quality=2)
+
+
+def test_cached_body_negotiation(server):
+    headers, body = raw_get(server, "/cached")
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == BIG
+    headers, body = raw_get(server, "/cached", "identity")
+    assert headers["vary"] == "Accept-Encoding"
+    assert body == BIG
@@ -0,0 +1,100 @@
+import time
+from email.utils import formatdate
+from types import SimpleNamespace
+
+import pytest
+
+from api import conditional
+from core.config import settings
+
+
+@pytest.fixture
+def later(monkeypatch):
+    """Clock of ``Conditional`` moved ``seconds`` ahead; validators never roll over."""
+    monkeypatch.setattr(settings, "http_validator_ttl", 10**9)
+
+    def move(seconds: float) -> None:
+        now = time.time() + seconds
+        monkeypatch.setattr(conditional, "time", SimpleNamespace(time=lambda: now))
+
+    return move
+
+
+@pytest.fixture(scope="module")
+def client_id(client):
+    response = client.post("/clients/", json={"full_name": "Условный GET", "phone": "+70050000001"})
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def etag(client, url: str = "/clients/") -> str:
+    response = client.get(url)
+    assert response.status_code == 200
+    return response.headers["etag"]
+
+
+def test_repeat_get_is_304(client, client_id):
+    first = client.get("/clients/")
+    tag = first.headers["etag"]
+    assert first.headers["cache-control"] == settings.http_cache_control
+
+    response = client.get("/clients/", headers={"If-None-Match": tag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == tag
+    # слабое сравнение и список тегов
+    for header in (tag.removeprefix("W/"), f'"other", {tag}', "*"):
+        assert client.get("/clients/", headers={"If-None-Match": header}).status_code == 304
+    assert client.get("/clients/", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+@pytest.mark.parametrize("method, path, body", [
+    ("post", "/clients/", {"full_name": "Новый", "phone": "+70050000002"}),
+    ("patch", "/clients/{id}", {"full_name": "Переименован"}),
+    ("delete", "/clients/{id}", None),
+])
+def test_write_changes_etag(client, client_id, method, path, body):
+    if method == "delete":
+        client_id = client.post("/clients/", json={"full_name": "На удаление", "phone": "+70050000003"}).json()["id"]
+    before = etag(client)
+    kwargs = {"json": body} if body else {}
+    assert getattr(client, method)(path.format(id=client_id), **kwargs).status_code == 200
+    after = etag(client)
+    assert after != before
+    assert client.get("/clients/", headers={"If-None-Match": before}).status_code == 200
+
+
+def test_unrelated_write_keeps_etag(client, client_id):
+    before = etag(client)
+    assert client.post("/restriction_types/", json={"code": "cond", "name": "Чужая таблица"}).status_code == 200
+    assert etag(client) == before
+    # откат (дубликат телефона) ничего не записал
+    assert client.post("/clients/", json={"full_name": "Дубль", "phone": "+70050000001"}).status_code == 400
+    assert etag(client) == before
+    assert client.get("/clients/", headers={"If-None-Match": before}).status_code == 304
+
+
+def test_if_modified_since(client, client_id, later):
+    assert client.patch(f"/clients/{client_id}", json={"email": None}).status_code == 200
+    # в секунду последней записи Last-Modified не выдаётся и If-Modified-Since не даёт 304
+    response = client.get("/clients/")
+    assert "last-modified" not in response.headers
+    future = formatdate(time.time() + 60, usegmt=True)
+    assert client.get("/clients/", headers={"If-Modified-Since": future}).status_code == 200
+
+    later(5)
+    modified = client.get("/clients/").headers["last-modified"]
+    assert client.get("/clients/", headers={"If-Modified-Since": modified}).status_code == 304
+    assert client.get("/clients/", headers={"If-Modified-Since": future}).status_code == 304
+    past = formatdate(time.time() - 60, usegmt=True)
+    assert client.get("/clients/", headers={"If-Modified-Since": past}).status_code == 200
+    assert client.get("/clients/", headers={"If-Modified-Since": "not a date"}).status_code == 200
+    # If-None-Match важнее If-Modified-Since
+    headers = {"If-Modified-Since": modified, "If-None-Match": '"other"'}
+    assert client.get("/clients/", headers=headers).status_code == 200
+
+    # следующая запись — в следующей секунде, иначе она неотличима по Last-Modified
+    time.sleep(1 - time.time() % 1)
+    assert client.patch(f"/clients/{client_id}", json={"full_name": "Изменён"}).status_code == 200
+    later(10)
+    assert client.get("/clients/", headers={"If-Modified-Since": modified}).status_code == 200
@@ -0,0 +1,76 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from api.encumbrance import RestrictionPeriods
+
+D = date(2024, 1, 1)
+
+
+def day(n: int) -> date:
+    return D + timedelta(days=n)
+
+
+def naive(rows, real_estate_id: int, on: date) -> bool:
+    # то же условие, что restrictions_crud.active_on
+    return any(rid == real_estate_id and imposed <= on and (removed is None or removed > on) for rid, imposed, removed in rows)
+
+
+def active_days(periods: RestrictionPeriods, real_estate_id: int, last: int = 40) -> list[int]:
+    return [n for n in range(-2, last) if periods.active(real_estate_id, day(n))]
+
+
+@pytest.mark.parametrize("rows, expected", [
+    # одиночный период: день наложения входит, день снятия — нет
+    ([(day(5), day(10))], list(range(5, 10))),
+    # пересекающиеся и вложенные
+    ([(day(5), day(10)), (day(8), day(15)), (day(9), day(11))], list(range(5, 15))),
+    # смежные: снятие в день следующего наложения — без разрыва
+    ([(day(10), day(15)), (day(5), day(10))], list(range(5, 15))),
+    # с разрывом в один день
+    ([(day(5), day(10)), (day(11), day(15))], list(range(5, 10)) + list(range(11, 15))),
+    # бессрочное поглощает всё, что начинается после него
+    ([(day(5), None), (day(8), day(12))], list(range(5, 40))),
+    ([(day(8), day(12)), (day(10), None)], list(range(8, 40))),
+    ([(day(3), day(6)), (day(20), None)], [3, 4, 5] + list(range(20, 40))),
+    # снято в день наложения (или раньше) — не действует ни дня
+    ([(day(5), day(5))], []),
+    ([(day(5), day(4))], []),
+    ([(day(5), day(5)), (day(7), day(9))], [7, 8]),
+])
+def test_periods(rows, expected):
+    periods = RestrictionPeriods((1, imposed, removed) for imposed, removed in rows)
+    assert active_days(periods, 1) == expected
+
+
+def test_boundaries():
+    periods = RestrictionPeriods([(1, day(5), day(10)), (2, day(5), None)])
+    assert not periods.active(1, day(4))
+    assert periods.active(1, day(5))
+    assert periods.active(1, day(9))
+    assert not periods.active(1, day(10))
+    assert periods.active(2, day(5)) and periods.active(2, date.max)
+    assert not periods.active(2, date.min)
+
+
+def test_objects_without_restrictions():
+    periods = RestrictionPeriods([(1, day(0), None), (2, day(5), day(5))])
+    assert not periods.active(2, day(5))
+    assert not periods.active(3, day(5))
+    assert periods.encumbered([1, 2, 3, 4], day(5)) == {1}
+    assert periods.encumbered([], day(5)) == set()
+    assert RestrictionPeriods([]).encumbered([1, 2], day(5)) == set()
+
+
+def test_matches_naive_check():
+    rng = random.Random(25)
+    rows = []
+    for _ in range(300):
+        imposed = day(rng.randrange(60))
+        removed = None if rng.random() < 0.15 else imposed + timedelta(days=rng.randrange(-2, 15))
+        rows.append((rng.randrange(1, 30), imposed, removed))
+    periods = RestrictionPeriods(rows)
+    for n in range(-1, 80):
+        expected = {rid for rid in range(1, 32) if naive(rows, rid, day(n))}
+        assert periods.encumbered(range(1, 32), day(n)) == expected, day(n)
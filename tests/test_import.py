@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+
+from conftest import APP_DIR
+from core.config import settings
+
+CSV = "text/csv"
+NDJSON = "application/x-ndjson"
+
+
+def post_import(client, body: str, content_type: str) -> dict:
+    response = client.post("/clients/import", content=body.encode(), headers={"Content-Type": content_type})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_good_csv(client):
+    body = (
+        "full_name,phone,email\n"
+        "Импорт Один,+70040000001,one@import.ru\n"
+        '"Импорт, Два",+70040000002,\n'
+        '"Импорт\nТри",+70040000003,three@import.ru\n'
+    )
+    assert post_import(client, body, CSV) == {"inserted": 3, "failed": 0, "errors": []}
+    names = {row["full_name"] for row in client.get("/clients/?limit=1000").json()}
+    assert {"Импорт Один", "Импорт, Два", "Импорт\nТри"} <= names
+
+
+def test_bad_rows_are_reported_by_line(client):
+    lines = [
+        json.dumps({"full_name": "Импорт Четыре", "phone": "+70040000004"}),
+        "{not json",
+        json.dumps(["not", "an", "object"]),
+        json.dumps({"full_name": "Без телефона"}),
+        "",
+        json.dumps({"full_name": "Импорт Пять", "phone": "+70040000005"}),
+    ]
+    result = post_import(client, "\n".join(lines), NDJSON)
+    assert result["inserted"] == 2
+    assert result["failed"] == 3
+    assert [error["row"] for error in result["errors"]] == [2, 3, 4]
+    assert result["errors"][1]["error"] == "expected a JSON object"
+    assert result["errors"][2]["error"].startswith("phone: Field required")
+
+
+def test_csv_column_count_mismatch(client):
+    body = "full_name,phone\nИмпорт Шесть,+70040000006\nлишняя,+70040000007,колонка\n"
+    result = post_import(client, body, CSV)
+    assert (result["inserted"], result["failed"]) == (1, 1)
+    assert result["errors"] == [{"row": 3, "error": "expected 2 columns, got 3"}]
+
+
+def test_duplicate_key_is_retried_row_by_row(client, monkeypatch):
+    # дубликат в середине пачки: пачка откатывается, строки вставляются по одной в savepoint-ах
+    monkeypatch.setattr(settings, "import_batch_size", 3)
+    body = (
+        "full_name,phone\n"
+        "Импорт Семь,+70040000008\n"
+        "Импорт Восемь,+70040000001\n"
+        "Импорт Девять,+70040000009\n"
+        "Импорт Десять,+70040000010\n"
+    )
+    result = post_import(client, body, CSV)
+    assert (result["inserted"], result["failed"]) == (3, 1)
+    assert result["errors"] == [{"row": 3, "error": "UNIQUE constraint failed: clients.phone"}]
+    phones = {row["phone"] for row in client.get("/clients/?limit=1000").json()}
+    assert {"+70040000008", "+70040000009", "+70040000010"} <= phones
+
+
+def test_import_without_asyncpg_installed():
+    # COPY нужен только с asyncpg: на SQLite и psycopg пакет может отсутствовать
+    code = "import sys; sys.modules['asyncpg'] = None; import crud.import_crud"
+    env = {**os.environ, "PYTHONPATH": str(APP_DIR)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env, cwd=APP_DIR)
@@ -0,0 +1,83 @@
+import tempfile
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, event, exc
+
+from database.pool import InstrumentedQueuePool, attach_stats
+
+CONNECT_DELAY = 0.2
+
+
+def make_engine(pool_timeout: float = 0.1):
+    engine = create_engine(
+        f"sqlite:///{tempfile.mkdtemp()}/pool.db",
+        poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=1, pool_timeout=pool_timeout,
+    )
+    attach_stats(engine, "test")
+
+    @event.listens_for(engine, "do_connect")
+    def slow_connect(dialect, connection_record, cargs, cparams):
+        # медленное открытие соединения — это не ожидание пула
+        time.sleep(CONNECT_DELAY)
+
+    return engine
+
+
+@pytest.fixture
+def engine():
+    engine = make_engine()
+    yield engine
+    engine.dispose()
+
+
+def stats(engine) -> dict:
+    return engine.pool.snapshot()
+
+
+def test_connect_time_is_not_wait(engine):
+    with engine.connect():
+        pass
+    with engine.connect():  # уже открытое соединение из пула
+        pass
+    snapshot = stats(engine)
+    assert snapshot["checkouts"] == 2
+    assert snapshot["wait_ms_max"] < CONNECT_DELAY * 1000 / 2
+    assert snapshot["overflow_checkouts"] == 0
+
+
+def test_overflow_and_timeout(engine):
+    with engine.connect(), engine.connect():
+        assert stats(engine)["overflow"] == 1
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    snapshot = stats(engine)
+    assert (snapshot["checkouts"], snapshot["overflow_checkouts"], snapshot["timeouts"]) == (2, 1, 1)
+    assert snapshot["wait_ms_max"] < CONNECT_DELAY * 1000 / 2
+
+
+def test_blocked_checkout_is_wait():
+    engine = make_engine(pool_timeout=5)
+    first, second = engine.connect(), engine.connect()
+    threading.Timer(0.3, second.close).start()
+    started = time.perf_counter()
+    with engine.connect():
+        blocked = time.perf_counter() - started
+    first.close()
+    snapshot = stats(engine)
+    engine.dispose()
+    assert blocked >= 0.25
+    assert snapshot["wait_ms_max"] >= 250
+    assert snapshot["checkouts"] == 3
+
+
+def test_stats_survive_dispose(engine):
+    with engine.connect():
+        pass
+    engine.dispose()
+    with engine.connect():
+        pass
+    snapshot = stats(engine)
+    assert snapshot["checkouts"] == 2
+    assert snapshot["wait_ms_max"] < CONNECT_DELAY * 1000 / 2
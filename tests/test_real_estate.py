@@ -0,0 +1,5 @@
+def test_address_filter_is_literal(client):
+    for address in ("Лесная 10%", "Лесная 100"):
+        assert client.post("/real_estate/", json={"type": "Квартира", "address": address, "area": 30.0}).status_code == 200
+    response = client.get("/real_estate/", params={"address": "Лесная 10%"})
+    assert [row["address"] for row in response.json()] == ["Лесная 10%"]
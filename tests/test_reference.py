@@ -0,0 +1,57 @@
+import sqlite3
+
+from sqlalchemy.engine import make_url
+
+from api.reference import ReferenceSnapshot, restriction_types
+from core.config import settings
+from database.database import engine
+from models.ownership_types import OwnershipTypeRead
+
+
+def insert_behind_cache(table: str, code: str) -> None:
+    # запись мимо SQLAlchemy — как из другого воркера: table_versions её не видит
+    with sqlite3.connect(make_url(str(engine.url)).database) as connection:
+        connection.execute(f"INSERT INTO {table} (code, name) VALUES (?, ?)", (code, f"Вид {code}"))
+
+
+def test_code_added_by_another_worker_is_found(client, monkeypatch):
+    monkeypatch.setattr(restriction_types, "_next_miss_reload", 0.0)
+    assert client.get("/restriction_types/").status_code == 200  # снимок загружен
+    insert_behind_cache("restriction_types", "elsewhere")
+    response = client.get("/restriction_types/elsewhere")
+    assert response.status_code == 200, response.text
+    assert client.get("/restriction_types/missing").status_code == 404
+
+
+def test_snapshot_pages_in_python_order():
+    # строки в порядке collation БД ("B" после "a"), не в порядке str
+    rows = [OwnershipTypeRead(code=code, name=code) for code in ("a", "B", "c", "D")]
+    snapshot = ReferenceSnapshot(rows, OwnershipTypeRead)
+    assert [row.code for row in snapshot.rows] == ["B", "D", "a", "c"]
+    assert [row.code for row in snapshot.page(after="B", limit=2)] == ["D", "a"]
+    assert [row.code for row in snapshot.page(after="D")] == ["a", "c"]
+
+
+def test_misses_reload_once_per_interval(client, monkeypatch):
+    loads = []
+    load = restriction_types._load
+
+    async def counting_load(db):
+        loads.append(1)
+        return await load(db)
+
+    monkeypatch.setattr(restriction_types, "_load", counting_load)
+    monkeypatch.setattr(settings, "reference_miss_reload_interval", 60.0)
+    monkeypatch.setattr(restriction_types, "_next_miss_reload", 0.0)
+    assert client.get("/restriction_types/").status_code == 200
+    loads.clear()
+
+    for i in range(5):
+        assert client.get(f"/restriction_types/unknown-{i}").status_code == 404
+    assert len(loads) == 1
+    # до конца интервала код из другого воркера не виден, после — находится
+    insert_behind_cache("restriction_types", "later")
+    assert client.get("/restriction_types/later").status_code == 404
+    monkeypatch.setattr(restriction_types, "_next_miss_reload", 0.0)
+    assert client.get("/restriction_types/later").status_code == 200
+    assert len(loads) == 2
@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+from sqlmodel import Session
+
+from database.database import engine
+from models.clients import Client
+from models.deals import Deal
+from models.real_estate import RealEstate
+from models.users import User
+
+RANGE = {"date_from": "2001-01-01", "date_to": "2001-12-31"}
+
+
+@pytest.fixture(scope="module")
+def deals(client):
+    # сделки — через Session: у SQLite JSON-даты в POST не проходят
+    with Session(engine) as db:
+        agent = User(login="report-agent", full_name="Агент отчёта", password="x")
+        buyer = Client(full_name="Покупатель отчёта", phone="+70010000000")
+        house, other_house = (RealEstate(type="Отчётный дом", address="Отчётная 1", area=100.0) for _ in range(2))
+        db.add_all([agent, buyer, house, other_house])
+        db.flush()
+
+        def deal(real_estate, deal_type, amount, status="completed"):
+            return Deal(
+                real_estate_id=real_estate.id, client_id=buyer.id, employee_id=agent.id,
+                deal_type=deal_type, deal_date=date(2001, 6, 1), amount=amount, status=status,
+            )
+
+        db.add_all([
+            deal(house, "Продажа", 10e6),
+            deal(house, "Продажа", 20e6),
+            deal(house, "Аренда", 50e3),
+            deal(house, "Продажа", 900e6, status="cancelled"),
+            # так отменяет сделку интерфейс (DealsSection.tsx)
+            deal(house, "Продажа", 800e6, status="Отменена"),
+            deal(other_house, "Продажа", 30e6),
+        ])
+        db.commit()
+        return agent.id
+
+
+def test_properties_average_sale_price_per_object(client, deals):
+    rows = {row["type"]: row for row in client.get("/reports/properties", params=RANGE).json()}
+    # (среднее 10 и 20 млн по первому дому + 30 млн по второму) / 2; аренда и отменённые не в счёт
+    assert rows["Отчётный дом"] == {"type": "Отчётный дом", "count": 2, "avg_price": 22.5e6}
+
+
+def test_employee_revenue_skips_deals_cancelled_in_either_spelling(client, deals):
+    rows = {row["employee_id"]: row for row in client.get("/reports/employees", params=RANGE).json()}
+    assert rows[deals]["deals"] == 4
+    assert rows[deals]["revenue"] == pytest.approx(60.05e6)
+
+
+def test_sales_skip_cancelled_deals(client, deals):
+    (row,) = client.get("/reports/sales", params={**RANGE, "period": "month"}).json()
+    assert row["deals"] == 4
@@ -0,0 +1,46 @@
+import pytest
+from sqlmodel import Session, select
+
+from crud.search_crud import SEARCH_TARGETS, contains
+from database.database import engine
+from database.search_index import SEARCH_COLUMNS
+from models.clients import Client
+
+NAMES = ("Скидка 5% Иванов", "Петров_Сидоров", "Обратный\\слеш", "Обычный клиент")
+
+
+@pytest.fixture(scope="module")
+def clients(client):
+    for i, name in enumerate(NAMES):
+        response = client.post("/clients/", json={"full_name": name, "phone": f"+7002000{i:04d}"})
+        assert response.status_code == 200, response.text
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("%", [NAMES[0]]),
+    ("_", [NAMES[1]]),
+    ("\\", [NAMES[2]]),
+])
+def test_wildcards_are_literal(client, clients, q, expected):
+    # 1–2 символа на SQLite идут через LIKE
+    response = client.get("/search/", params={"q": q, "types": "clients"})
+    assert response.status_code == 200, response.text
+    assert [hit["title"] for hit in response.json()["clients"]] == expected
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("5%", {NAMES[0]}),
+    ("в_С", {NAMES[1]}),
+    ("й\\с", {NAMES[2]}),
+    ("%%", set()),
+])
+def test_contains_escapes_pattern(clients, q, expected):
+    with Session(engine) as db:
+        names = set(db.exec(select(Client.full_name).where(contains(Client.full_name, q))).all())
+    assert names == expected
+
+
+def test_targets_use_their_own_fts_table():
+    by_table = {table: (column, fts) for table, column, fts in SEARCH_COLUMNS}
+    for model, column, fts in SEARCH_TARGETS.values():
+        assert by_table[model.__tablename__] == (column.key, fts)
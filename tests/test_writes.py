@@ -0,0 +1,33 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+@pytest.fixture(scope="module")
+def server(client):
+    # ошибка БД, не распознанная как дубликат, — обычный 500, а не исключение в тесте
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest.mark.parametrize("url, body, duplicate", [
+    ("/clients/", {"full_name": "Без телефона"}, "Phone number already registered"),
+    ("/users/", {"full_name": "Без логина", "password": "secret"}, "Login already exists"),
+    ("/ownership_types/", {"code": "no-name"}, "Ownership type already exists"),
+])
+def test_not_null_is_not_reported_as_duplicate(server, url, body, duplicate):
+    response = server.post(url, json=body)
+    assert response.status_code == 500
+    assert duplicate not in response.text
+
+
+@pytest.mark.parametrize("url, body, duplicate", [
+    ("/clients/", {"full_name": "Дубль", "phone": "+70030000000"}, "Phone number already registered"),
+    ("/users/", {"login": "duplicate", "full_name": "Дубль", "password": "secret"}, "Login already exists"),
+    ("/ownership_types/", {"code": "dup", "name": "Дубль"}, "Ownership type already exists"),
+])
+def test_unique_violation_is_400(server, url, body, duplicate):
+    assert server.post(url, json=body).status_code == 200
+    response = server.post(url, json=body)
+    assert response.status_code == 400
+    assert response.json() == {"detail": duplicate}